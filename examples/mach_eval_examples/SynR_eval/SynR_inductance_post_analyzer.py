@@ -1,9 +1,11 @@
 import copy
 import numpy as np
-import matplotlib.pyplot as plt
-import scipy.optimize
+
+from mach_eval.analyzers.waveform_data import SinusoidFitProblem, SinusoidFitAnalyzer
 
 class SynR_Inductance_PostAnalyzer:
+    # set to True to plot the flux linkages against their fitted sinusoids
+    debug_plots = False
     
     def get_next_state(results, in_state):
         state_out = copy.deepcopy(in_state)
@@ -16,51 +18,39 @@ class SynR_Inductance_PostAnalyzer:
         data = flux_linkages.to_numpy() # change csv format to readable array
         
         t = data[:,0] # define x axis data as time
-        Uu = data[:,1] # define y axis data as self inductance
-        Uv = data[:,2] # define y axis data as mutual inductance
+        U = data[:,1:3].T # define y axis data as self and mutual inductance
 
-        # curve fit inductance values and calculate curve
-        def fit_sin(t, y):
-            fft_func = np.fft.fftfreq(len(t), (t[1]-t[0])) # define fft function with assumed uniform spacing
-            fft_y = abs(np.fft.fft(y)) # carry out fft function for inductance values
-            guess_freq = abs(fft_func[np.argmax(fft_y[1:])+1]) # excluding the zero frequency "peak", which can cause problematic fits
-            guess_amp = np.std(y) # guess amplitude based on one standard deviation
-            guess_offset = np.mean(y) # guess y offset based on average of magnitude
-            guess = np.array([guess_amp, 2.*np.pi*guess_freq, 0, guess_offset]) # arrage in array
-            
-            # define sin function 
-            def sinfunc(t, A, w, p, c):  
-                return A * np.sin(w*t + p) + c
-            
-            popt, pcov = scipy.optimize.curve_fit(sinfunc, t, y, p0=guess) # calculate sin function fit
-            A, w, p, c = popt # assign appropriate variables
-            fitfunc = lambda t: A * np.sin(w*t + p) + c # define fit function for curve fit
-            
-            # define function used to calculate least square
-            def sumfunc(x):
-                return sum((sinfunc(t, x[0], x[1], x[2], x[3]) - y)**2)
-            
-            sUx = scipy.optimize.minimize(fun=sumfunc, x0=np.array([guess_amp, 2.*np.pi*guess_freq, 0, guess_offset])) # calculate matching curve fit values with minimum error
-            return [{"amp": A, "omega": w, "phase": p, "offset": c, "fitfunc": fitfunc}, sUx]
+        # inductances vary at twice the electrical frequency of the rotor position
+        if "drive_freq" in results:
+            fit_freq = 2 * results["drive_freq"]
+        else:
+            # fall back to the strongest non-zero frequency, assuming uniform spacing
+            spectrum = np.abs(np.fft.rfft(U[0]))
+            fit_freq = (np.argmax(spectrum[1:]) + 1) / (len(t) * (t[1] - t[0]))
 
-        [Uu_fit, sUu] = fit_sin(t, Uu) # carry out calculations on self inductance
-        [Uv_fit, sUv] = fit_sin(t, Uv) # carry out calculations on mutual inductance
-        
-        fig1, ax1 = plt.subplots()
-        ax1.plot(t, Uu, "-k", label="y", linewidth=2)
-        ax1.plot(t, Uu_fit["fitfunc"](t), "r-", label="y fit curve", linewidth=2)
-        ax1.legend(loc="best")
-        #plt.savefig("temp1.svg")
+        # fit both inductances at the known frequency with a single linear least-squares solve
+        fit_prob = SinusoidFitProblem(U, t, fit_freq)
+        fit = SinusoidFitAnalyzer().analyze(fit_prob)
+        # the mutual amplitude is signed by its sine coefficient like the earlier fit started at
+        # zero phase, Lg is negative for rotors with Ld > Lq
+        Uv_amp = np.copysign(fit["amp"][1], fit["sin_coeff"][1])
+        [Uu_offset, Uv_offset] = fit["offset"]
+
+        if SynR_Inductance_PostAnalyzer.debug_plots:
+            import matplotlib.pyplot as plt
 
-        fig2, ax2 = plt.subplots()
-        ax2.plot(t, Uv, "-k", label="y", linewidth=2)
-        ax2.plot(t, Uv_fit["fitfunc"](t), "r-", label="y fit curve", linewidth=2)
-        ax2.legend(loc="best")
-        #plt.savefig("temp2.svg")
+            U_fit = fit["amp"][:, None] * np.sin(
+                fit["omega"] * t + fit["phase"][:, None]
+            ) + fit["offset"][:, None]
+            for y, y_fit in zip(U, U_fit):
+                fig, ax = plt.subplots()
+                ax.plot(t, y, "-k", label="y", linewidth=2)
+                ax.plot(t, y_fit, "r-", label="y fit curve", linewidth=2)
+                ax.legend(loc="best")
 
-        Lzero = -2*sUv.x[3]/I_hat; # calculate L0 based on equations in publication
-        Lg = sUv.x[0]/I_hat # calculate Lg based on equations in publication
-        Lls = (sUu.x[3] + 2*sUv.x[3])/I_hat # calculate Lls based on equations in publication
+        Lzero = -2*Uv_offset/I_hat; # calculate L0 based on equations in publication
+        Lg = Uv_amp/I_hat # calculate Lg based on equations in publication
+        Lls = (Uu_offset + 2*Uv_offset)/I_hat # calculate Lls based on equations in publication
         Ld = Lls + 3/2*(Lzero - Lg) # calculate Ld based on equations in publication
         Lq = Lls + 3/2*(Lzero + Lg) # calculate Lq based on equations in publication
         saliency_ratio = Ld/Lq # calculate saliency ratio
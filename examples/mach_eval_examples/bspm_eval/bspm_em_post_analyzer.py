@@ -15,6 +15,11 @@ from mach_eval.analyzers.torque_data import (
     ProcessTorqueDataProblem,
     ProcessTorqueDataAnalyzer,
 )
+from mach_eval.analyzers.power_factor import (
+    PowerFactorProblem,
+    PowerFactorAnalyzer,
+    rms,
+)
 
 
 class BSPM_EM_PostAnalyzer:
@@ -144,169 +149,18 @@ class BSPM_EM_PostAnalyzer:
 
 
 def compute_vrms(voltage_df):
-    phase_voltage = voltage_df["Terminal_Wt"]
-    rms_voltage = np.sqrt(sum(np.square(phase_voltage)) / len(phase_voltage))
-    return rms_voltage
-
-
-def compute_power_factor(
-    voltage_df, current_df, target_freq, numPeriodicalExtension=1000
-):
-    mytime = current_df.index
-    voltage = voltage_df["Terminal_Wt"]
-    current = current_df["coil_Wb"]
-
-    power_factor = compute_power_factor_from_half_period(
-        voltage,
-        current,
-        mytime,
-        targetFreq=target_freq,
-        numPeriodicalExtension=numPeriodicalExtension,
+    phase_voltage = np.asarray(voltage_df["Terminal_Wt"])
+    return rms(phase_voltage)
+
+
+def compute_power_factor(voltage_df, current_df, target_freq):
+    # the time step data covers half an electrical period of half-wave symmetric waveforms
+    pf_prob = PowerFactorProblem(
+        voltage=voltage_df["Terminal_Wt"],
+        current=current_df["coil_Wb"],
+        time=current_df.index,
+        freq=target_freq,
+        half_period=True,
     )
-    return power_factor
-
-
-# https://dsp.stackexchange.com/questions/11513/estimate-frequency-and-peak-value-of-a-signals-fundamental
-# define N_SAMPLE ((long int)(1.0/(0.1*TS))) // Resolution 0.1 Hz = 1 / (N_SAMPLE * TS)
-class GoertzelDataStruct(object):
-    """docstring for GoertzelDataStruct"""
-
-    def __init__(
-        self,
-        id=None,
-    ):
-        self.id = id
-        self.bool_initialized = False
-        self.sine = None
-        self.cosine = None
-        self.coeff = None
-        self.scalingFactor = None
-        self.q = None
-        self.q2 = None
-        self.count = None
-        self.k = None  # k is the normalized target frequency
-        self.real = None
-        self.imag = None
-        self.accumSquaredData = None
-        self.ampl = None
-        self.phase = None
-
-    # /************************************************
-    #  * Real time implementation to avoid the array of input double *data[]
-    #  * with Goertzel Struct to store the variables and the output values
-    #  *************************************************/
-    def goertzel_realtime(gs, targetFreq, numSamples, samplingRate, data):
-        # gs is equivalent to self
-        try:
-            len(data)
-        except:
-            pass
-        else:
-            raise Exception(
-                "This is for real time implementation of Goertzel, hence data must be a scalar rather than array."
-            )
-
-        if not gs.bool_initialized:
-            gs.bool_initialized = True
-
-            gs.count = 0
-            gs.k = 0.5 + ((numSamples * targetFreq) / samplingRate)
-            omega = (2.0 * np.pi * gs.k) / numSamples
-            gs.sine = np.sin(omega)
-            gs.cosine = np.cos(omega)
-            gs.coeff = 2.0 * gs.cosine
-            gs.q1 = 0
-            gs.q2 = 0
-            gs.scalingFactor = 0.5 * numSamples
-            gs.accumSquaredData = 0.0
-
-        q0 = gs.coeff * gs.q1 - gs.q2 + data
-        gs.q2 = gs.q1
-        gs.q1 = (
-            q0  # // q1 is the newest output vk[N], while q2 is the last output vk[N-1].
-        )
-
-        gs.accumSquaredData += data * data
-
-        gs.count += 1
-        if gs.count >= numSamples:
-            # // calculate the real and imaginary results with scaling appropriately
-            gs.real = (
-                gs.q1 * gs.cosine - gs.q2
-            ) / gs.scalingFactor  # // inspired by the python script of sebpiq
-            gs.imag = (gs.q1 * gs.sine) / gs.scalingFactor
-
-            # // reset
-            gs.bool_initialized = False
-            return True
-        else:
-            return False
-
-    def goertzel_offline(gs, targetFreq, samplingRate, data_list):
-        # gs is equivalent to self
-        numSamples = len(data_list)
-        if not gs.bool_initialized:
-            gs.bool_initialized = True
-
-            gs.count = 0
-            gs.k = 0.5 + ((numSamples * targetFreq) / samplingRate)
-            omega = (2.0 * np.pi * gs.k) / numSamples
-            gs.sine = np.sin(omega)
-            gs.cosine = np.cos(omega)
-            gs.coeff = 2.0 * gs.cosine
-            gs.q1 = 0
-            gs.q2 = 0
-            gs.scalingFactor = 0.5 * numSamples
-            gs.accumSquaredData = 0.0
-
-        for data in data_list:
-            q0 = gs.coeff * gs.q1 - gs.q2 + data
-            gs.q2 = gs.q1
-            gs.q1 = q0  # // q1 is the newest output vk[N], while q2 is the last output vk[N-1].
-
-            gs.accumSquaredData += data * data
-
-            gs.count += 1
-            if gs.count >= numSamples:
-                # // calculate the real and imaginary results with scaling appropriately
-                gs.real = (
-                    gs.q1 * gs.cosine - gs.q2
-                ) / gs.scalingFactor  # // inspired by the python script of sebpiq
-                gs.imag = (gs.q1 * gs.sine) / gs.scalingFactor
-
-                # // reset
-                gs.bool_initialized = False
-                return True
-        return None
-
-
-def compute_power_factor_from_half_period(
-    voltage, current, mytime, targetFreq=1e3, numPeriodicalExtension=1000
-):
-    gs_u = GoertzelDataStruct("Goertzel Struct for Voltage\n")
-    gs_i = GoertzelDataStruct("Goertzel Struct for Current\n")
-
-    TS = mytime[-1] - mytime[-2]
-
-    if type(voltage) != type([]):
-        voltage = voltage.tolist() + (-voltage).tolist()
-        current = current.tolist() + (-current).tolist()
-    else:
-        voltage = voltage + [-el for el in voltage]
-        current = current + [-el for el in current]
-
-    voltage *= numPeriodicalExtension
-    current *= numPeriodicalExtension
-
-    gs_u.goertzel_offline(targetFreq, 1.0 / TS, voltage)
-    gs_i.goertzel_offline(targetFreq, 1.0 / TS, current)
-
-    gs_u.ampl = np.sqrt(gs_u.real * gs_u.real + gs_u.imag * gs_u.imag)
-    gs_u.phase = np.arctan2(gs_u.imag, gs_u.real)
-
-    gs_i.ampl = np.sqrt(gs_i.real * gs_i.real + gs_i.imag * gs_i.imag)
-    gs_i.phase = np.arctan2(gs_i.imag, gs_i.real)
-
-    phase_difference_in_deg = (gs_i.phase - gs_u.phase) / np.pi * 180
-    power_factor = np.cos(gs_i.phase - gs_u.phase)
-    return power_factor
+    pf_analyzer = PowerFactorAnalyzer()
+    return pf_analyzer.analyze(pf_prob)["power_factor"]
@@ -13,7 +13,7 @@ from mach_eval import MachineEvaluator
 from structural_step import struct_step
 from electromagnetic_step import em_step
 from rotor_thermal_step import rotor_therm_step
-from stator_thermal_step import stator_therm_step
+from electro_thermal_step import electro_thermal_step
 from windage_loss_step import windage_step
 
 ############################ Create Evaluator ########################
@@ -22,7 +22,7 @@ evaluator = MachineEvaluator(
         struct_step,
         em_step,
         rotor_therm_step,
-        stator_therm_step,
+        electro_thermal_step,
         windage_step,
     ]
 )
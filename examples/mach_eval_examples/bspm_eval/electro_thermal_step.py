@@ -0,0 +1,96 @@
+import os
+import sys
+from copy import deepcopy
+
+# add the directory 3 levels above this file's directory to path for module import
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+sys.path.append(os.path.dirname(__file__))
+
+from mach_eval.analyzers.mechanical import thermal_stator as st_therm
+from mach_eval.analyzers import electro_thermal as et
+from mach_eval import AnalysisStep, ProblemDefinition
+from mach_opt import InvalidDesign
+from stator_thermal_step import MyThermalProblemDefinition
+from rotor_thermal_step import MyAirflowProblemDef
+
+
+################### Define Coupled Electro-Thermal AnalysisStep ###################
+class MyElectroThermalProblemDefinition(ProblemDefinition):
+    """Class converts input state into a coupled electro-thermal problem
+
+    The copper loss of the EM step is evaluated at the reference temperature of the coil and
+    magnet materials. It is corrected for the coil resistance at the coil temperature and for the
+    current required to hold torque with the remanence at the magnet temperature. The iterated
+    temperatures are [coil, stator yoke, magnet].
+    """
+
+    T_ref_material = 20  # temperature of material data [C]
+
+    def get_problem(state):
+        machine = state.design.machine
+        T_ref = MyElectroThermalProblemDefinition.T_ref_material
+        copper_loss_ref = state.conditions.em["copper_loss"]
+        sigma_ref = machine.coil_mat["copper_elec_conductivity"]
+        B_r_ref = machine.magnet_mat["B_r"]
+
+        # analytical stages are created once and reused in every iteration
+        stator_prob = MyThermalProblemDefinition.get_problem(state)
+        stator_ana = st_therm.StatorThermalAnalyzer()
+        rotor_prob = MyAirflowProblemDef.get_problem(state)
+        u_z = state.conditions.airflow["Required Airflow"]
+
+        def loss_model(T):
+            sigma = et.copper_conductivity(sigma_ref, T[0], T_ref)
+            B_r = et.magnet_remanence(B_r_ref, T[2], T_ref)
+            copper_loss = copper_loss_ref * (sigma_ref / sigma) * (B_r_ref / B_r) ** 2
+            return {"copper_loss": copper_loss}
+
+        def thermal_model(losses):
+            stator_prob.Q_coil = losses["copper_loss"] / machine.Q
+            results = stator_ana.analyze(stator_prob)
+            return [
+                results["Coil temperature"],
+                results["Stator yoke temperature"],
+                rotor_prob.magnet_temp(u_z)[0],
+            ]
+
+        T_0 = [stator_prob.T_ref, stator_prob.T_ref, rotor_prob.T_ref]
+        problem = et.ElectroThermalProblem(loss_model, thermal_model, T_0, tol=1e-2)
+        return problem
+
+
+class MyElectroThermalPostAnalyzer:
+    """Converts input state into output state for ElectroThermalAnalyzer"""
+
+    def get_next_state(results, stateIn):
+        T_coil, T_sy, T_magnet = results.T
+        if not results.converged:
+            raise InvalidDesign("Electro-thermal iteration did not converge")
+        if T_coil > 300:
+            raise InvalidDesign("Coil temperature beyond limits")
+
+        stateOut = deepcopy(stateIn)
+        machine = stateOut.design.machine
+        stateOut.conditions.em["copper_loss"] = results.losses["copper_loss"]
+        stateOut.conditions.Q_coil = results.losses["copper_loss"] / machine.Q
+        stateOut.conditions.T_coil = T_coil
+        stateOut.conditions.T_sy = T_sy
+        stateOut.conditions.T_magnet = T_magnet
+        stateOut.conditions.electro_thermal = {
+            "iterations": results.iterations,
+            "evaluations": results.evaluations,
+        }
+
+        print("\nCoil temperature = ", T_coil, " degC")
+        print("Stator yoke temperature = ", T_sy, " degC")
+        print("Magnet temperature = ", T_magnet, " degC")
+        print("Copper loss = ", results.losses["copper_loss"], " W")
+        print("Electro-thermal iterations = ", results.iterations)
+        return stateOut
+
+
+electro_thermal_step = AnalysisStep(
+    MyElectroThermalProblemDefinition,
+    et.ElectroThermalAnalyzer(),
+    MyElectroThermalPostAnalyzer,
+)
@@ -72,6 +72,6 @@ class MyAirflowPostAnalyzer:
 
 
 rotor_therm_step = AnalysisStep(
-    MyAirflowProblemDef, therm.AirflowAnalyzer(), MyAirflowPostAnalyzer
+    MyAirflowProblemDef, therm.AirflowRootAnalyzer(), MyAirflowPostAnalyzer
 )
 
@@ -6,6 +6,7 @@ from .location_3d import *
 from .component import *
 from .make_solid import *
 from .materials import *
+from .geometry_hash import *
 
 
 __all__ = []
@@ -15,4 +16,5 @@ __all__ += dimensions.__all__
 __all__ += location_3d.__all__
 __all__ += component.__all__
 __all__ += make_solid.__all__
-__all__ += materials.__all__
\ No newline at end of file
+__all__ += materials.__all__
+__all__ += geometry_hash.__all__
\ No newline at end of file
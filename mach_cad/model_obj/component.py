@@ -3,6 +3,7 @@ from copy import deepcopy
 from .make_solid.make_solid_base import MakeSolidBase
 from .materials.material_generic import MaterialGeneric
 from .cross_sects.cross_sect_base import CrossSectBase
+from .geometry_hash import content_hash
 
 __all__ = ["Component"]
 
@@ -60,6 +61,17 @@ class Component:
             cs.append(self.cross_sections[i].draw(drawer))
         return cs
 
+    def content_hash(self) -> str:
+        """Hash of the component content
+
+        Components with equal cross-sections, material and make_solid operation share a hash,
+        regardless of their name and the units their dimensions are defined in.
+
+        Returns:
+            hash: hexadecimal SHA-256 digest
+        """
+        return content_hash(self)
+
     def clone(self, name: str, **kwargs):
         """Create clone of an already existing component
 
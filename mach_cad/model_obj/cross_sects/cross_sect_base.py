@@ -3,6 +3,7 @@ from typing import List
 from copy import deepcopy
 
 from ..location_2d import Location2D
+from ..geometry_hash import content_hash
 
 
 class CrossSectBase(ABC):
@@ -45,6 +46,17 @@ class CrossSectBase(ABC):
         """
         pass
 
+    def content_hash(self) -> str:
+        """Hash of the cross-section geometry
+
+        Cross-sections of the same type with equal dimensions and location share a hash, regardless
+        of their name and the units their dimensions are defined in.
+
+        Returns:
+            hash: hexadecimal SHA-256 digest
+        """
+        return content_hash(self)
+
     def clone(self, name: str, **kwargs: any):
         """Create clone of an already existing cross-section
 
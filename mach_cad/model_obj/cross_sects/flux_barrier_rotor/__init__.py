@@ -3,6 +3,7 @@ import numpy as np
 from ...dimensions.dim_linear import DimLinear
 from ...dimensions.dim_angular import DimAngular
 from ...dimensions import DimRadian
+from ...dimensions import DimArray
 from ..cross_sect_base import CrossSectBase, CrossSectToken
 
 __all__ = ['CrossSectFluxBarrierRotor','CrossSectFluxBarrierRotorPartial']
@@ -271,8 +272,10 @@ class CrossSectFluxBarrierRotor(CrossSectBase):
         coords = list(zip(*coords))
         coords = [list(sublist) for sublist in coords]
 
+        base = DimArray.from_dims(coords)
+        po_all = self.location.transform_coords_batch(base, np.arange(2 * p) * alpha_total).to_dims()
         for i in range(0, (2*p)):
-            po = self.location.transform_coords(coords, alpha_total * i)
+            po = po_all[i]
             
             # Shaft
             arc1.append(drawer.draw_arc(self.location.anchor_xy, po[0], po[1]))
@@ -3,6 +3,7 @@ import numpy as np
 from ...dimensions.dim_linear import DimLinear
 from ...dimensions.dim_angular import DimAngular
 from ...dimensions import DimRadian
+from ...dimensions import DimArray
 from ..cross_sect_base import CrossSectBase, CrossSectToken
 
 __all__ = ['CrossSectInnerReluctanceRotor']
@@ -127,8 +128,10 @@ class CrossSectInnerReluctanceRotor(CrossSectBase):
         coords = list(zip(*coords))
         coords = [list(sublist) for sublist in coords]
 
+        base = DimArray.from_dims(coords)
+        po_all = self.location.transform_coords_batch(base, np.arange(1, Q_r + 1) * alpha_total).to_dims()
         for i in range(1, (Q_r +1)):
-            po = self.location.transform_coords(coords, alpha_total * i)
+            po = po_all[i - 1]
 
             arc1.append(drawer.draw_arc(self.location.anchor_xy, po[0], po[1])) # Shaft
             arc2.append(drawer.draw_arc(self.location.anchor_xy, po[3], po[2])) # Rotor Core to fillet start (Top)
@@ -1,6 +1,7 @@
 import numpy as np
 
 from ...dimensions import DimRadian
+from ...dimensions import DimArray
 from ...dimensions import DimMillimeter
 from ...dimensions.dim_linear import DimLinear
 
@@ -110,8 +111,10 @@ class CrossSectInnerRotorRoundSlots(CrossSectBase):
         coords = list(zip(*coords))
         coords = [list(sublist) for sublist in coords]
 
+        base = DimArray.from_dims(coords)
+        p_all = self.location.transform_coords_batch(base, np.arange(Qr) * alpha_u).to_dims()
         for i in range(0, Qr):
-            p = self.location.transform_coords(coords, alpha_u * i)
+            p = p_all[i]
 
             arc1.append(drawer.draw_arc(self.location.anchor_xy, p[0], p[1]))
             seg1.append(drawer.draw_line(p[1], p[2]))
@@ -1,6 +1,7 @@
 import numpy as np
 
 from ...dimensions import DimRadian
+from ...dimensions import DimArray
 from ...dimensions.dim_linear import DimLinear
 from ...dimensions.dim_angular import DimAngular
 from ..cross_sect_base import CrossSectBase, CrossSectToken
@@ -134,8 +135,10 @@ class CrossSectInnerRotorStator(CrossSectBase):
         coords = list(zip(*coords))
         coords = [list(sublist) for sublist in coords]
 
+        base = DimArray.from_dims(coords)
+        p_all = self.location.transform_coords_batch(base, np.arange(Q) * alpha_total).to_dims()
         for i in range(0, Q):
-            p = self.location.transform_coords(coords, alpha_total * i)
+            p = p_all[i]
 
             arc1.append(drawer.draw_arc(self.location.anchor_xy, p[0], p[1]))
             seg1.append(drawer.draw_line(p[1], p[2]))
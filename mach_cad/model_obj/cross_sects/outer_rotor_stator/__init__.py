@@ -4,6 +4,7 @@ from ...dimensions.dim_linear import DimLinear
 from ...dimensions.dim_angular import DimAngular
 from ...dimensions import DimDegree
 from ...dimensions import DimRadian
+from ...dimensions import DimArray
 from ..cross_sect_base import CrossSectBase, CrossSectToken
 
 __all__ = ['CrossSectOuterRotorStator']
@@ -145,9 +146,10 @@ class CrossSectOuterRotorStator(CrossSectBase):
         seg5 = []
         seg6 = []
 
+        base = DimArray.from_dims(points)
+        p_all = self.location.transform_coords_batch(base, np.arange(Q) * alpha_total).to_dims()
         for i in range(Q):
-            angle = alpha_total * i
-            p = self.location.transform_coords(points, DimRadian(angle))
+            p = p_all[i]
 
             # select point from p to draw lines and arcs
             p1 = [p[1][0], p[1][1]]
@@ -3,8 +3,9 @@ from .dim_inch import *
 from .dim_degree import *
 from .dim_radian import *
 from .dim_meter import *
+from .dim_array import *
 
 
 __all__ = []
 __all__ = dim_millimeter.__all__ + dim_inch.__all__ + dim_degree.__all__ \
-          + dim_radian.__all__ + dim_meter.__all__
+          + dim_radian.__all__ + dim_meter.__all__ + dim_array.__all__
@@ -0,0 +1,181 @@
+import numpy as np
+
+from .dim_base import DimBase
+from .dim_linear import DimLinear
+from .dim_angular import DimAngular
+
+__all__ = ['DimArray']
+
+
+def _kind(unit):
+    return DimLinear if issubclass(unit, DimLinear) else DimAngular
+
+
+class DimArray:
+    """NumPy array of dimensions sharing a single unit
+
+    DimArray is an opt-in fast path for dimension arithmetic on many values at once. Values are
+    held in a float array tagged with an eMach dimension class, so that arithmetic and trigonometry
+    run on plain arrays while the unit rules of DimBase still hold: lengths and angles are only
+    added to dimensions of the same kind, dimensions are not multiplied with each other and angles
+    are converted to radians before trigonometric functions. Indexing a single element returns an
+    object of the unit class, so a DimArray can be passed where lists of dimensions are expected.
+
+    Attributes:
+        value: numpy array of values in the unit
+        unit: eMach dimension class of the values, e.g. DimMillimeter
+    """
+
+    def __init__(self, value, unit):
+        if not (isinstance(unit, type) and issubclass(unit, (DimLinear, DimAngular))):
+            raise TypeError("Expected unit to be a DimLinear or DimAngular class. Instead it was "
+                            + str(unit))
+        self.value = np.asarray(value, dtype=float)
+        self.unit = unit
+
+    @classmethod
+    def from_dims(cls, dims, unit=None):
+        """Creates a DimArray from nested lists of dimensions
+
+        Args:
+            dims: nested lists of DimLinear or DimAngular objects of the same kind
+            unit: eMach dimension class of the array, the class of the first element if not defined
+        Returns:
+            array: object of type DimArray
+        """
+        flat = list(np.ravel(np.array(dims, dtype=object)))
+        for dim in flat:
+            if not isinstance(dim, DimBase):
+                raise TypeError("Expected input to be one of the following type: \
+                             DimBase. Instead it was of type " + str(type(dim)))
+        if unit is None:
+            unit = type(flat[0])
+        kind = _kind(unit)
+        if not all(isinstance(dim, kind) for dim in flat):
+            raise TypeError("Dimensions of different kinds in one DimArray")
+        factor = np.array([dim._conversion_factor for dim in flat], dtype=float)
+        value = np.array(flat, dtype=float) * factor / unit._conversion_factor
+        return cls(value.reshape(np.shape(np.array(dims, dtype=object))), unit)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, index):
+        value = self.value[index]
+        if np.ndim(value) == 0:
+            return self.unit(value)
+        return DimArray(value, self.unit)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return "DimArray(" + repr(self.value) + ", " + self.unit.__name__ + ")"
+
+    def to(self, unit):
+        """Returns the array converted to another unit of the same kind"""
+        if _kind(unit) is not _kind(self.unit):
+            raise TypeError("Cannot convert " + self.unit.__name__ + " to " + unit.__name__)
+        return DimArray(self._to_dimensionless() / unit._conversion_factor, unit)
+
+    def to_dims(self):
+        """Returns the values as nested lists of objects of the unit class"""
+        unit = self.unit
+
+        def convert(value):
+            return [convert(v) for v in value] if isinstance(value, list) else unit(value)
+
+        return convert(self.value.tolist())
+
+    def _to_dimensionless(self):
+        return self.value * self.unit._conversion_factor
+
+    def _in_unit(self, other):
+        # value of a dimension of the same kind in the unit of this array
+        if isinstance(other, (DimArray, DimBase)):
+            other_unit = other.unit if isinstance(other, DimArray) else type(other)
+            if _kind(other_unit) is _kind(self.unit):
+                return other._to_dimensionless() / self.unit._conversion_factor
+        raise TypeError("Expected a dimension of kind " + _kind(self.unit).__name__
+                        + ". Instead it was of type " + str(type(other)))
+
+    def __add__(self, other):
+        return DimArray(self.value + self._in_unit(other), self.unit)
+
+    def __radd__(self, other):
+        # DimBase + DimArray keeps the unit of the left operand
+        return self.to(type(other)) + other if isinstance(other, DimBase) else self + other
+
+    def __sub__(self, other):
+        return DimArray(self.value - self._in_unit(other), self.unit)
+
+    def __rsub__(self, other):
+        if isinstance(other, DimBase):
+            return -self.to(type(other)) + other
+        return -self + other
+
+    def __mul__(self, other):
+        if isinstance(other, (DimArray, DimBase)):
+            raise Exception('Multiplication Not valid')
+        return DimArray(self.value * np.asarray(other, dtype=float), self.unit)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, (DimArray, DimBase)):
+            return self.value / self._in_unit(other)
+        return DimArray(self.value / np.asarray(other, dtype=float), self.unit)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, DimBase):
+            return other._to_dimensionless() / self._to_dimensionless()
+        raise Exception('Division not valid')
+
+    def __neg__(self):
+        return DimArray(-self.value, self.unit)
+
+    def __pos__(self):
+        return DimArray(self.value.copy(), self.unit)
+
+    def __abs__(self):
+        return DimArray(np.abs(self.value), self.unit)
+
+    _trig = (np.sin, np.cos, np.tan)
+    _operators = {
+        np.add: "__add__",
+        np.subtract: "__sub__",
+        np.multiply: "__mul__",
+        np.true_divide: "__truediv__",
+    }
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in self._trig:
+            if not issubclass(self.unit, DimAngular):
+                raise TypeError("Trigonometric functions require angles")
+            return ufunc(self._to_dimensionless())
+        if ufunc in (np.negative, np.positive, np.absolute):
+            return {np.negative: self.__neg__, np.positive: self.__pos__,
+                    np.absolute: self.__abs__}[ufunc]()
+        if ufunc in self._operators:
+            left, right = inputs
+            if left is self:
+                return getattr(self, self._operators[ufunc])(right)
+            # arrays and scalars on the left, e.g. np.arange(Q) * DimArray
+            if ufunc is np.multiply:
+                return self.__mul__(left)
+            if ufunc is np.true_divide:
+                return self.__rtruediv__(left)
+            return getattr(self, "__r" + self._operators[ufunc][2:])(left)
+        return NotImplemented
+
+
+# let DimBase defer arithmetic with a DimArray on the right to the DimArray
+DimBase._array_type = DimArray
@@ -1,7 +1,9 @@
 from abc import abstractmethod, ABC
+import numpy as np
 
 
 class DimBase(float, ABC):
+    _array_type = ()  # set to DimArray, which handles arithmetic with arrays of dimensions
 
     @abstractmethod
     def _conversion_factor(self):
@@ -11,16 +13,24 @@ class DimBase(float, ABC):
         return float.__new__(cls, value)
 
     def __add__(self, other):
+        if isinstance(other, self._array_type):
+            return NotImplemented
         add = self._to_dimensionless() + other._to_dimensionless()
         return type(self)._from_dimensionless(type(self), add)
 
     def __sub__(self, other):
+        if isinstance(other, self._array_type):
+            return NotImplemented
         sub = self._to_dimensionless() - other._to_dimensionless()
         return type(self)._from_dimensionless(type(self), sub)
 
     def __mul__(self, other):
         if isinstance(self, DimBase) and isinstance(other, DimBase):
             raise Exception('Multiplication Not valid')
+        if isinstance(other, self._array_type):
+            return NotImplemented
+        if isinstance(other, np.ndarray):
+            return self._array_type(other * float(self), type(self))
 
         if isinstance(self, DimBase):
             mul = other * (self._to_dimensionless())
@@ -32,9 +42,11 @@ class DimBase(float, ABC):
 
         if isinstance(self, DimBase):
             mul = other * (self._to_dimensionless())
-            type(self)._from_dimensionless(type(self), mul)
+            return type(self)._from_dimensionless(type(self), mul)
 
     def __truediv__(self, other):
+        if isinstance(other, self._array_type):
+            return NotImplemented
         if isinstance(other, DimBase):
             div = self._to_dimensionless() / other._to_dimensionless()
             return div
@@ -0,0 +1,57 @@
+import hashlib
+import numpy as np
+
+from .dimensions.dim_linear import DimLinear
+from .dimensions.dim_angular import DimAngular
+from .materials.material_generic import MaterialGeneric
+
+__all__ = ["content_hash"]
+
+
+def content_hash(obj, digits=12) -> str:
+    """Canonical hash of the content of an eMach object
+
+    The hash depends on the class and attributes of the object only, so that equal cross-sections or
+    components drawn in different units, or cloned under a different name, share a hash. Dimensions
+    are normalized with _to_dimensionless, floats are rounded to a number of significant digits and
+    nested objects such as locations, materials and cross-sections are hashed by their content.
+    Names of cross-sections and components are left out, names of materials are kept.
+
+    Args:
+        obj: object to hash, e.g. of type CrossSectBase or Component
+        digits: significant digits floats are rounded to
+    Returns:
+        hash: hexadecimal SHA-256 digest
+    """
+    canonical = repr(_canonical(obj, digits))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _canonical(value, digits):
+    if isinstance(value, DimLinear):
+        return ("DimLinear", _number(value._to_dimensionless(), digits))
+    if isinstance(value, DimAngular):
+        return ("DimAngular", _number(value._to_dimensionless(), digits))
+    if value is None or isinstance(value, (bool, str, int, np.integer)):
+        return value if not isinstance(value, np.integer) else int(value)
+    if isinstance(value, (float, np.floating)):
+        return _number(value, digits)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, _canonical(value.tolist(), digits))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(item, digits) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical(v, digits)) for k, v in value.items()))
+    if hasattr(value, "__dict__"):
+        attrs = vars(value)
+        if not isinstance(value, MaterialGeneric):
+            attrs = {k: v for k, v in attrs.items() if k != "_name"}
+        return (type(value).__qualname__, _canonical(attrs, digits))
+    return (type(value).__qualname__, repr(value))
+
+
+def _number(value, digits):
+    value = float(value)
+    if value == 0:
+        return "0"
+    return format(value, ".%dg" % digits)
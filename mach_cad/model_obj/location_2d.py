@@ -64,11 +64,14 @@ class Location2D:
         attribute.
 
         Args:
-            coords : An nx2 array of coordinates of the form [x,y]
+            coords : An nx2 array of coordinates of the form [x,y], or a DimArray of shape (n, 2)
             add_theta : Angle in addition to self._theta by which coordinates are rotated
         Returns:
             trans_coords : An nx2 array of transformed coordinates of the form [x,y]
         """
+        if isinstance(coords, DimArray):
+            add_theta = DimRadian(0) if add_theta is None else add_theta
+            return self.transform_coords_batch(coords, [add_theta])[0]
         coords_np = np.array(coords)  # convert coords to number for ease of calc
         if add_theta is None:
             trans = self._rot
@@ -90,3 +93,57 @@ class Location2D:
             trans_coords_list[i][0] = type(coords[i][0])(rot_coords[i, 0]) + self._anchor_xy[0]
             trans_coords_list[i][1] = type(coords[i][1])(rot_coords[i, 1]) + self._anchor_xy[1]
         return trans_coords_list
+
+    def transform_coords_batch(self, coords, add_theta):
+        """Transform nx2 array of coordinates for several additional angles at once
+
+        Equivalent to calling transform_coords(coords, theta) for each theta in add_theta, but all
+        rotations are carried out in a single batched matrix product. This is used to draw the Q
+        periodic copies of slots, poles and barriers of a cross-section.
+
+        Args:
+            coords : An nx2 array of coordinates of the form [x,y], or a DimArray of shape (n, 2)
+            add_theta : List of angles of type DimAngular, angular DimArray, or numpy array of
+                angles in radians, in addition to self._theta by which coordinates are rotated
+        Returns:
+            trans_coords : List holding an nx2 list of transformed coordinates for each angle. A
+                DimArray of shape (len(add_theta), n, 2) if coords is a DimArray
+        """
+        if isinstance(add_theta, DimArray):
+            theta = add_theta.to(DimRadian).value
+        elif isinstance(add_theta, np.ndarray):
+            theta = add_theta.astype(float)
+        else:
+            theta = np.array([DimRadian(angle) for angle in add_theta], dtype=float)
+        theta = theta + float(self._theta)
+        cos, sin = np.cos(theta), np.sin(theta)
+        trans = np.array([[cos, -sin], [sin, cos]]).transpose(2, 0, 1)
+
+        if isinstance(coords, DimArray):
+            rot_coords = np.einsum("kij,nj->kni", trans, coords.value)
+            anchor = DimArray.from_dims(self._anchor_xy, coords.unit).value
+            return DimArray(rot_coords + anchor, coords.unit)
+
+        coords_np = np.array(coords, dtype=float)
+        rot_coords = np.einsum("kij,nj->kni", trans, coords_np)
+
+        # add the anchor in the dimension of each coordinate, as DimBase.__add__ would
+        trans_coords = []
+        columns = []
+        for j in range(2):
+            types = [type(coords[i][j]) for i in range(len(coords))]
+            anchor = self._anchor_xy[j]
+            if all(issubclass(t, DimLinear) for t in types):
+                factor = np.array([t._conversion_factor for t in types], dtype=float)
+                values = (rot_coords[:, :, j] * factor + anchor._to_dimensionless()) / factor
+                columns.append([[t(v) for t, v in zip(types, row)] for row in values.tolist()])
+            else:
+                columns.append(
+                    [
+                        [t(v) + anchor for t, v in zip(types, row)]
+                        for row in rot_coords[:, :, j].tolist()
+                    ]
+                )
+        for xs, ys in zip(*columns):
+            trans_coords.append([[x, y] for x, y in zip(xs, ys)])
+        return trans_coords
@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+
+import model_obj
+from model_obj.dimensions import DimArray, DimDegree, DimInch, DimMillimeter, DimRadian
+
+inches = DimArray([1, 2, 3], DimInch)
+millimeters = DimArray([25.4, 50.8, 76.2], DimMillimeter)
+degrees = DimArray([0, 90, 180], DimDegree)
+
+
+class TestDimArray(unittest.TestCase):
+    def test_from_dims(self):
+        val = DimArray.from_dims([[DimInch(1), DimMillimeter(25.4)]])
+        self.assertEqual(val.unit, DimInch)
+        self.assertEqual(val.shape, (1, 2))
+        np.testing.assert_allclose(val.value, [[1, 1]])
+
+        val = DimArray.from_dims([DimInch(1), DimInch(2)], DimMillimeter)
+        np.testing.assert_allclose(val.value, [25.4, 50.8])
+
+    def test_indexing(self):
+        val = inches[1]
+        self.assertAlmostEqual(val, DimInch(2), 5)
+        self.assertEqual(type(val), DimInch)
+        self.assertEqual(type(inches[1:]), DimArray)
+        self.assertEqual(type(inches.to_dims()[0]), DimInch)
+
+    def test_add_subtract(self):
+        val = inches + millimeters
+        self.assertEqual(val.unit, DimInch)
+        np.testing.assert_allclose(val.value, [2, 4, 6])
+
+        val = millimeters - DimInch(1)
+        self.assertEqual(val.unit, DimMillimeter)
+        np.testing.assert_allclose(val.value, [0, 25.4, 50.8])
+
+        val = DimInch(1) + millimeters
+        self.assertEqual(val.unit, DimInch)
+        np.testing.assert_allclose(val.value, [2, 3, 4])
+
+        val = DimInch(4) - inches
+        self.assertEqual(val.unit, DimInch)
+        np.testing.assert_allclose(val.value, [3, 2, 1])
+
+    def test_multiply_divide(self):
+        val = 2 * inches
+        self.assertEqual(val.unit, DimInch)
+        np.testing.assert_allclose(val.value, [2, 4, 6])
+
+        val = np.arange(3) * inches
+        self.assertEqual(type(val), DimArray)
+        np.testing.assert_allclose(val.value, [0, 2, 6])
+
+        val = DimMillimeter(2) * np.array([1, 2])
+        self.assertEqual(val.unit, DimMillimeter)
+        np.testing.assert_allclose(val.value, [2, 4])
+
+        val = inches / 2
+        self.assertEqual(val.unit, DimInch)
+        np.testing.assert_allclose(val.value, [0.5, 1, 1.5])
+
+        np.testing.assert_allclose(inches / millimeters, [1, 1, 1])
+        np.testing.assert_allclose(DimInch(3) / inches, [3, 1.5, 1])
+
+    def test_trig(self):
+        np.testing.assert_allclose(np.cos(degrees), [1, 0, -1], atol=1e-7)
+        np.testing.assert_allclose(np.sin(degrees.to(DimRadian)), [0, 1, 0], atol=1e-7)
+
+    def test_fail_conditions(self):
+        with self.assertRaises(Exception):
+            inches * inches
+
+        with self.assertRaises(Exception):
+            DimInch(1) * inches
+
+        with self.assertRaises(Exception):
+            inches + degrees
+
+        with self.assertRaises(Exception):
+            inches + 1
+
+        with self.assertRaises(Exception):
+            np.ones(3) + inches
+
+        with self.assertRaises(Exception):
+            2 / inches
+
+        with self.assertRaises(Exception):
+            np.cos(inches)
+
+        with self.assertRaises(Exception):
+            DimArray.from_dims([DimInch(1), DimDegree(1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from mach_cad.model_obj import (
+    Component,
+    CrossSectHollowCylinder,
+    DimDegree,
+    DimInch,
+    DimMeter,
+    DimMillimeter,
+    DimRadian,
+    Location2D,
+    Location3D,
+    MakeExtrude,
+    MaterialGeneric,
+)
+
+
+def make_cylinder(name="magnet", r_o=DimMillimeter(25.4), theta=DimRadian(0)):
+    return CrossSectHollowCylinder(
+        name=name,
+        dim_t=DimMillimeter(5),
+        dim_r_o=r_o,
+        location=Location2D(theta=theta),
+    )
+
+
+def make_component(name="Magnet", cylinder=None, material="N40", depth=DimMillimeter(25)):
+    return Component(
+        name=name,
+        cross_sections=[cylinder if cylinder is not None else make_cylinder()],
+        material=MaterialGeneric(material),
+        make_solid=MakeExtrude(location=Location3D(), dim_depth=depth),
+    )
+
+
+class TestContentHash(unittest.TestCase):
+    def test_cross_sect_hash_ignores_name_and_unit(self):
+        base = make_cylinder().content_hash()
+        self.assertEqual(make_cylinder(name="other").content_hash(), base)
+        self.assertEqual(make_cylinder(r_o=DimInch(1)).content_hash(), base)
+        self.assertEqual(make_cylinder().clone("clone").content_hash(), base)
+
+    def test_cross_sect_hash_changes_with_geometry(self):
+        base = make_cylinder().content_hash()
+        self.assertNotEqual(make_cylinder(r_o=DimMillimeter(25.5)).content_hash(), base)
+        self.assertNotEqual(make_cylinder(theta=DimDegree(10)).content_hash(), base)
+
+    def test_component_hash(self):
+        base = make_component().content_hash()
+        self.assertEqual(make_component(name="Other").content_hash(), base)
+        self.assertEqual(make_component(depth=DimMeter(0.025)).content_hash(), base)
+        self.assertNotEqual(make_component(material="N52").content_hash(), base)
+        self.assertNotEqual(make_component(depth=DimMillimeter(30)).content_hash(), base)
+        cylinder = make_cylinder(r_o=DimMillimeter(30))
+        self.assertNotEqual(make_component(cylinder=cylinder).content_hash(), base)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+# Importing not required for testing
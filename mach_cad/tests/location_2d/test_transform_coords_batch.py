@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+
+from mach_cad.model_obj import DimArray, DimDegree, DimInch, DimMeter, DimMillimeter, DimRadian, Location2D
+
+coords = [
+    [DimMillimeter(10), DimMillimeter(-2)],
+    [DimInch(1), DimInch(0.5)],
+    [DimMillimeter(30), DimMillimeter(4)],
+]
+location = Location2D(anchor_xy=[DimMeter(0.01), DimMillimeter(-5)], theta=DimDegree(15))
+
+
+class TestTransformCoordsBatch(unittest.TestCase):
+    def test_same_as_transform_coords(self):
+        angles = [DimDegree(30) * i for i in range(12)]
+        batch = location.transform_coords_batch(coords, angles)
+        self.assertEqual(len(batch), 12)
+        for angle, points in zip(angles, batch):
+            expected = location.transform_coords(coords, angle)
+            for point, expected_point in zip(points, expected):
+                for val, exp in zip(point, expected_point):
+                    self.assertAlmostEqual(val, exp, 10)
+                    self.assertEqual(type(val), type(exp))
+
+    def test_angles_in_radians(self):
+        batch = location.transform_coords_batch(coords, np.arange(4) * DimRadian(np.pi / 2))
+        expected = location.transform_coords(coords, DimRadian(np.pi))
+        np.testing.assert_allclose(np.array(batch[2], dtype=float), np.array(expected, dtype=float))
+
+    def test_dim_array(self):
+        angles = [DimDegree(30) * i for i in range(12)]
+        batch = location.transform_coords_batch(DimArray.from_dims(coords, DimInch), angles)
+        self.assertEqual(batch.unit, DimInch)
+        self.assertEqual(batch.shape, (12, 3, 2))
+        expected = location.transform_coords_batch(coords, angles)
+        expected = DimArray.from_dims(expected, DimMillimeter).value
+        np.testing.assert_allclose(batch.to(DimMillimeter).value, expected)
+
+        single = location.transform_coords(DimArray.from_dims(coords), DimDegree(30))
+        np.testing.assert_allclose(single.value, expected[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from mach_cad.model_obj import DimMillimeter
+from mach_cad.tools.recorder import GeometryCache
+from mach_cad.tests.geometry_hash.test_content_hash import make_component, make_cylinder
+from mach_cad.tests.tools.test_geometry_compiler import CountingTool
+
+
+class ModelFileTool(CountingTool):
+    """Counting tool able to save and import model files"""
+
+    def export_model(self, path):
+        self._count("export_model")
+        with open(path, "w") as f:
+            f.write("model")
+
+    def import_model(self, path):
+        self._count("import_model")
+
+
+class TestGeometryCache(unittest.TestCase):
+    def test_reuse_geometry_in_memory(self):
+        cache = GeometryCache()
+        geometry = cache.geometry(make_cylinder())
+        self.assertIs(cache.geometry(make_cylinder(name="clone")), geometry)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(geometry.n_arcs, 4)
+        self.assertEqual(geometry.n_sections, 1)
+
+        cache.geometry(make_cylinder(r_o=DimMillimeter(30)))
+        self.assertEqual(cache.misses, 2)
+
+    def test_make_from_cache(self):
+        cache = GeometryCache()
+        tool = CountingTool()
+        token_make = cache.make(make_component(), tool)
+        cache.make(make_component(name="Magnet2"), tool)
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(tool.calls["extrude"], 2)
+        self.assertEqual(tool.calls["add_arc"], 8)
+        self.assertEqual(token_make[0].make_solid_token, "Magnet")
+
+    def test_make_keeps_component_names(self):
+        # components of equal content share cached geometry but are made under their own name
+        cache = GeometryCache()
+        tool = CountingTool()
+        names = [
+            cache.make(make_component(name=name), tool)[0].make_solid_token
+            for name in ("Magnet1", "Magnet2")
+        ]
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(names, ["Magnet1", "Magnet2"])
+
+    def test_cache_folder(self):
+        with tempfile.TemporaryDirectory() as folder:
+            cache = GeometryCache(folder)
+            geometry = cache.geometry(make_component())
+            tool = ModelFileTool()
+            cache.make(make_component(), tool, suffix=".model")
+            self.assertEqual(tool.calls["export_model"], 1)
+
+            # a new cache reads geometry and model files of an earlier run
+            cache = GeometryCache(folder)
+            np.testing.assert_array_equal(cache.geometry(make_component()).arcs, geometry.arcs)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+            tool = ModelFileTool()
+            self.assertIsNone(cache.make(make_component(), tool, suffix=".model"))
+            self.assertEqual(tool.calls, {"import_model": 1})
+            self.assertEqual(len(os.listdir(folder)), 2)
+
+            # model files hold part names, another name is made from geometry and exported
+            token_make = cache.make(make_component(name="Magnet2"), tool, suffix=".model")
+            self.assertEqual(token_make[0].make_solid_token, "Magnet2")
+            self.assertEqual(tool.calls["export_model"], 1)
+            self.assertEqual(len(os.listdir(folder)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import numpy as np
+
+from mach_cad.model_obj import (
+    Component,
+    CrossSectInnerRotorStator,
+    CrossSectInnerRotorStatorRightSlot,
+    CrossSectSolidRectangle,
+    DimDegree,
+    DimMillimeter,
+    Location2D,
+    Location3D,
+    MakeExtrude,
+    MaterialGeneric,
+)
+from mach_cad.tools.recorder import RecordingDrawer, compile_geometry, replay_geometry
+from mach_cad.tools.token_draw import TokenDraw
+
+
+class CountingTool:
+    """Node based tool counting the calls it receives"""
+
+    def __init__(self):
+        self.calls = {}
+        self.nodes = []
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def add_node(self, xy):
+        self._count("add_node")
+        self.nodes.append((float(xy[0]), float(xy[1])))
+
+    def add_segment(self, startxy, endxy):
+        self._count("add_segment")
+        return TokenDraw(None, 0)
+
+    def add_arc(self, startxy, endxy, arc_angle):
+        self._count("add_arc")
+        return TokenDraw(None, 1)
+
+    def prepare_section(self, cs_token):
+        self._count("prepare_section")
+        return cs_token
+
+    def extrude(self, name, material, depth, token=None):
+        self._count("extrude")
+        return name
+
+
+def make_stator(Q):
+    return CrossSectInnerRotorStator(
+        name="StatorCore",
+        dim_alpha_st=DimDegree(44),
+        dim_alpha_so=DimDegree(22),
+        dim_r_si=DimMillimeter(40),
+        dim_d_so=DimMillimeter(5),
+        dim_d_sp=DimMillimeter(10),
+        dim_d_st=DimMillimeter(20),
+        dim_d_sy=DimMillimeter(15),
+        dim_w_st=DimMillimeter(8),
+        dim_r_st=DimMillimeter(0),
+        dim_r_sf=DimMillimeter(0),
+        dim_r_sb=DimMillimeter(0),
+        Q=Q,
+        location=Location2D(),
+        theta=DimDegree(0),
+    )
+
+
+class TestCompileGeometry(unittest.TestCase):
+    def test_shared_nodes_of_slots(self):
+        Q = 12
+        drawer = RecordingDrawer()
+        make_stator(Q).draw(drawer)
+        compiled = compile_geometry(drawer.geometry)
+
+        # each slot pitch draws 12 points, neighbouring slots share the two points at r4 and yoke
+        self.assertEqual(compiled.n_nodes, 10 * Q)
+        self.assertEqual(compiled.n_segments, 6 * Q)
+        self.assertEqual(compiled.n_arcs, 4 * Q)
+
+    def test_duplicate_and_collinear_segments(self):
+        drawer = RecordingDrawer()
+        for i in range(2):
+            rect = CrossSectSolidRectangle(
+                name="rect%d" % i,
+                dim_w=DimMillimeter(10),
+                dim_h=DimMillimeter(5),
+                location=Location2D(anchor_xy=[DimMillimeter(10 * i), DimMillimeter(0)]),
+            )
+            cs = rect.draw(drawer)
+            drawer.prepare_section(cs)
+        compiled = compile_geometry(drawer.geometry)
+
+        # the shared side is drawn once for both sections, the collinear bottom and top sides
+        # bound different sections and are kept apart
+        self.assertEqual(compiled.n_nodes, 6)
+        self.assertEqual(compiled.n_segments, 7)
+        self.assertEqual(compiled.segment_sections.count((0, 1)), 1)
+
+        drawer = RecordingDrawer()
+        drawer.draw_line([0, 0], [1, 0])
+        drawer.draw_line([1, 0], [2, 0])
+        drawer.draw_line([2, 0], [1, 0])
+        drawer.draw_line([2, 0], [2, 0])
+        compiled = compile_geometry(drawer.geometry)
+        self.assertEqual(compiled.n_segments, 1)
+        np.testing.assert_allclose(compiled.nodes[compiled.segments[0]], [[0, 0], [2, 0]])
+        self.assertEqual(compile_geometry(drawer.geometry, merge_collinear=False).n_segments, 2)
+
+    def test_replay_into_node_tool(self):
+        Q = 6
+        stator = make_stator(Q)
+        coil = Component(
+            name="Coil",
+            cross_sections=[
+                CrossSectInnerRotorStatorRightSlot(
+                    name="slot%d" % i,
+                    stator_core=stator,
+                    location=Location2D(theta=DimDegree(360 / Q * i)),
+                )
+                for i in range(Q)
+            ],
+            material=MaterialGeneric("Copper"),
+            make_solid=MakeExtrude(location=Location3D(), dim_depth=DimMillimeter(25)),
+        )
+        drawer = RecordingDrawer()
+        coil.make(drawer, drawer)
+        geometry = drawer.geometry
+        compiled = compile_geometry(geometry)
+
+        tool = CountingTool()
+        token_make = replay_geometry(compiled, tool)
+
+        self.assertEqual(tool.calls["add_node"], compiled.n_nodes)
+        self.assertEqual(tool.calls["add_segment"], compiled.n_segments)
+        self.assertEqual(tool.calls["add_arc"], compiled.n_arcs)
+        self.assertEqual(tool.calls["prepare_section"], Q)
+        self.assertEqual(tool.calls["extrude"], 1)
+        self.assertEqual(len(set(tool.nodes)), len(tool.nodes))
+        self.assertLess(tool.calls["add_node"], 2 * (geometry.n_lines + geometry.n_arcs))
+        self.assertEqual(token_make[0].make_solid_token, "Coil")
+        self.assertEqual(len(token_make[0].cs_token[0].token), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
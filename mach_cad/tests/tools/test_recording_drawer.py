@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+
+from mach_cad.model_obj import (
+    Component,
+    CrossSectHollowCylinder,
+    CrossSectSolidRectangle,
+    DimInch,
+    DimMillimeter,
+    Location2D,
+    Location3D,
+    MakeExtrude,
+    MaterialGeneric,
+)
+from mach_cad.tools.recorder import RecordingDrawer
+
+
+class TestRecordingDrawer(unittest.TestCase):
+    def test_record_lines(self):
+        drawer = RecordingDrawer("DimMillimeter")
+        rect = CrossSectSolidRectangle(
+            name="rect",
+            dim_w=DimMillimeter(25.4),
+            dim_h=DimMillimeter(12.7),
+            location=Location2D(anchor_xy=[DimMillimeter(50.8), DimMillimeter(0)]),
+        )
+        cs = rect.draw(drawer)
+        geometry = drawer.geometry
+
+        self.assertEqual(geometry.n_lines, 4)
+        self.assertEqual(geometry.n_arcs, 0)
+        self.assertEqual([t.draw_token for t in cs.token], [0, 1, 2, 3])
+        np.testing.assert_allclose(geometry.lines[1], [50.8, 12.7, 76.2, 12.7])
+        np.testing.assert_allclose(geometry.bounds(), [50.8, 0, 76.2, 12.7])
+        np.testing.assert_array_equal(geometry.line_section, -1)
+
+    def test_record_component_in_length_unit(self):
+        drawer = RecordingDrawer("DimMeter")
+        cylinder = CrossSectHollowCylinder(
+            name="magnet",
+            dim_t=DimMillimeter(5),
+            dim_r_o=DimInch(0.5),
+            location=Location2D(),
+        )
+        comp = Component(
+            name="Magnet",
+            cross_sections=[cylinder, cylinder.clone("magnet2", dim_r_o=DimMillimeter(40))],
+            material=MaterialGeneric("N40"),
+            make_solid=MakeExtrude(location=Location3D(), dim_depth=DimMillimeter(25)),
+        )
+        token_make = comp.make(drawer, drawer)
+        geometry = drawer.geometry
+
+        self.assertEqual(token_make.prep_sect_token, [0, 1])
+        self.assertEqual(token_make.make_solid_token, 0)
+        self.assertEqual(geometry.n_arcs, 8)
+        self.assertEqual(geometry.n_components, 1)
+        self.assertEqual(geometry.component_name, ["Magnet"])
+        self.assertEqual(geometry.component_material[0].name, "N40")
+        np.testing.assert_allclose(geometry.component_depth, [0.025])
+        np.testing.assert_allclose(geometry.arcs[0], [0, 0, 0, -0.0127, 0, 0.0127])
+        np.testing.assert_allclose(geometry.section_inner_coord, [[0.0102, 0], [0.0375, 0]])
+        np.testing.assert_array_equal(geometry.section_primitives(1)[1], [4, 5, 6, 7])
+        np.testing.assert_array_equal(geometry.component_sections(0), [0, 1])
+
+    def test_clear(self):
+        drawer = RecordingDrawer()
+        drawer.draw_line([0, 0], [1, 1])
+        drawer.clear()
+        self.assertEqual(drawer.geometry.n_lines, 0)
+        self.assertTrue(np.all(np.isnan(drawer.geometry.bounds())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -93,6 +93,37 @@ class FEMMDesigner(
         arc = 1
         return TokenDraw(arc, 1)
 
+    def add_node(self, xy: "Location2D"):
+        """Add a node in FEMM."""
+        femm.mi_addnode(xy[0], xy[1])
+
+    def add_segment(self, startxy: "Location2D", endxy: "Location2D") -> "TokenDraw":
+        """Add a segment between two existing nodes in FEMM.
+
+        Args:
+            startxy: Start node of segment.
+            endxy: End node of segment.
+
+        Returns:
+            TokenDraw: Wrapper object holding return values obtained upon adding a segment.
+        """
+        femm.mi_addsegment(startxy[0], startxy[1], endxy[0], endxy[1])
+        return TokenDraw(1, 0)
+
+    def add_arc(self, startxy: "Location2D", endxy: "Location2D", arc_angle) -> "TokenDraw":
+        """Add an arc between two existing nodes in FEMM.
+
+        Args:
+            startxy: Start node of arc.
+            endxy: End node of arc.
+            arc_angle: Angle spanned counterclockwise from start to end node [deg].
+
+        Returns:
+            TokenDraw: Wrapper object holding return values obtained upon adding an arc.
+        """
+        femm.mi_addarc(startxy[0], startxy[1], endxy[0], endxy[1], arc_angle, 1)
+        return TokenDraw(1, 1)
+
     def draw_circle(self, centerxy, radius):
         """Draw a circle in FEMM."""
         startxy = np.array([0, 0])
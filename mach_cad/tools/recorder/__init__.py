@@ -0,0 +1,9 @@
+from . import recording_drawer, geometry_compiler, geometry_cache
+from .recording_drawer import *
+from .geometry_compiler import *
+from .geometry_cache import *
+
+__all__ = []
+__all__ += recording_drawer.__all__
+__all__ += geometry_compiler.__all__
+__all__ += geometry_cache.__all__
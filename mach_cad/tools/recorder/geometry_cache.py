@@ -0,0 +1,114 @@
+import os
+import pickle
+
+from .recording_drawer import RecordingDrawer, GeometryIR
+from .geometry_compiler import compile_geometry, replay_geometry
+from ...model_obj.component import Component
+
+__all__ = []
+__all__ += ["GeometryCache"]
+
+
+class GeometryCache:
+    """Cache of drawn geometry keyed by the content hash of cross-sections and components
+
+    Geometry is drawn once into a RecordingDrawer and kept in memory, and in a folder if one is
+    given, so that a part reused across many designs, such as a rotor combined with several
+    stators, is not drawn again. Components made through the cache are replayed into a tool from
+    the cached geometry under their own name, since names are not part of the content hash. Tools
+    having import_model(path) and export_model(path) methods also get their model file of a
+    component saved in the folder and imported the next time instead. Model files hold part names,
+    so they are keyed by the component name as well, and importing one returns no tokens.
+
+    Attributes:
+        folder: folder holding cached geometry and model files, in memory only if not defined
+        length_unit: name of the eMach linear dimension class geometry is recorded in
+        hits: number of requests served from the cache
+        misses: number of requests which required drawing
+    """
+
+    def __init__(self, folder=None, length_unit="DimMillimeter"):
+        self.folder = folder
+        self.length_unit = length_unit
+        self.hits = 0
+        self.misses = 0
+        self._geometry = {}
+        if folder is not None:
+            os.makedirs(folder, exist_ok=True)
+
+    def key(self, obj) -> str:
+        """Returns the cache key of a cross-section or component"""
+        return self.length_unit + "_" + obj.content_hash()
+
+    def path(self, key, suffix) -> str:
+        """Returns the path of a cached file, None if the cache has no folder"""
+        if self.folder is None:
+            return None
+        return os.path.join(self.folder, key + suffix)
+
+    def geometry(self, obj) -> GeometryIR:
+        """Returns the recorded geometry of a cross-section or component
+
+        Cross-sections are drawn and prepared as a single section, components are drawn and
+        extruded. Geometry is only drawn if it is neither in memory nor in the cache folder.
+
+        Args:
+            obj: object of type CrossSectBase or Component
+        Returns:
+            geometry: object of type GeometryIR
+        """
+        key = self.key(obj)
+        geometry = self._geometry.get(key)
+        path = self.path(key, ".pkl")
+        if geometry is None and path is not None and os.path.exists(path):
+            with open(path, "rb") as f:
+                geometry = pickle.load(f)
+            self._geometry[key] = geometry
+        if geometry is not None:
+            self.hits += 1
+            return geometry
+
+        self.misses += 1
+        drawer = RecordingDrawer(self.length_unit)
+        if isinstance(obj, Component):
+            obj.make(drawer, drawer)
+        else:
+            drawer.prepare_section(obj.draw(drawer))
+        geometry = drawer.geometry
+        self._geometry[key] = geometry
+        if path is not None:
+            with open(path, "wb") as f:
+                pickle.dump(geometry, f)
+        return geometry
+
+    def make(self, component: Component, tool, suffix=None):
+        """Makes a component in a tool from cached geometry
+
+        Args:
+            component: object of type Component
+            tool: eMach tool implementing DrawerBase and MakerExtrudeBase
+            suffix: file extension of model files of the tool, e.g. ".jmag". Model files are only
+                used if defined, the cache has a folder and the tool supports them.
+        Returns:
+            token_make: list of TokenMake objects from replaying the geometry. None if the component
+                was imported from a model file, in which case no draw or make tokens exist.
+        """
+        key = self.key(component)
+        model_path = None
+        if suffix is not None:
+            model_path = self.path(key + "_" + component.name, suffix)
+        if model_path is not None and os.path.exists(model_path) and hasattr(tool, "import_model"):
+            self.hits += 1
+            tool.import_model(model_path)
+            return None
+
+        token_make = replay_geometry(
+            compile_geometry(self.geometry(component)), tool, names=[component.name]
+        )
+        if model_path is not None and hasattr(tool, "export_model"):
+            tool.export_model(model_path)
+        return token_make
+
+    def clear(self):
+        """Discards geometry held in memory, files in the cache folder are kept"""
+        self._geometry = {}
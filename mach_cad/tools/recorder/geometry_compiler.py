@@ -0,0 +1,241 @@
+import numpy as np
+
+from ..token_make import TokenMake
+from ...model_obj.cross_sects.cross_sect_base import CrossSectToken
+from ...model_obj.dimensions import *
+
+__all__ = []
+__all__ += ["CompiledGeometry", "compile_geometry", "replay_geometry"]
+
+
+class CompiledGeometry:
+    """Deduplicated geometry ready to be issued to a CAD tool
+
+    Nodes are unique within the compile tolerance, every segment and arc joins two nodes and
+    appears once, even if several sections share it.
+
+    Attributes:
+        length_unit: name of the eMach linear dimension class of all coordinates
+        nodes: numpy array of shape (n_nodes, 2) holding [x, y] of each node
+        segments: numpy array of shape (n_segments, 2) holding the start and end node of each segment
+        arcs: numpy array of shape (n_arcs, 2) holding the start and end node of each arc, arcs run
+            counterclockwise from start to end
+        arc_centers: numpy array of shape (n_arcs, 2) holding [x, y] of the center of each arc
+        arc_angles: numpy array of the angle spanned by each arc [deg]
+        segment_sections: list of tuples holding the sections bounded by each segment
+        arc_sections: list of tuples holding the sections bounded by each arc
+        section_inner_coord: numpy array of shape (n_sections, 2) holding a point inside each section
+        section_component: numpy array of the component index of each section, -1 if not made
+        component_name: list of component names
+        component_material: list of component materials
+        component_depth: numpy array of extrusion depth of each component
+    """
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    @property
+    def n_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def n_segments(self):
+        return len(self.segments)
+
+    @property
+    def n_arcs(self):
+        return len(self.arcs)
+
+
+class _SpatialHash:
+    """Merges points closer than a tolerance into shared nodes"""
+
+    def __init__(self, tol):
+        self.tol = tol
+        self.cells = {}
+        self.points = []
+
+    def node(self, x, y):
+        i, j = int(np.floor(x / self.tol)), int(np.floor(y / self.tol))
+        # a point within tol of (x, y) lies in one of the neighbouring cells
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for n in self.cells.get((i + di, j + dj), ()):
+                    px, py = self.points[n]
+                    if (px - x) ** 2 + (py - y) ** 2 <= self.tol**2:
+                        return n
+        n = len(self.points)
+        self.points.append((x, y))
+        self.cells.setdefault((i, j), []).append(n)
+        return n
+
+
+def compile_geometry(geometry: "GeometryIR", tol=1e-6, merge_collinear=True) -> CompiledGeometry:
+    """Compiles recorded geometry into a minimal set of nodes, segments and arcs
+
+    End points closer than tol are merged into a node with a spatial hash. Segments and arcs
+    joining the same nodes are merged, zero length segments are dropped and, optionally, chains
+    of collinear segments meeting at nodes used by nothing else are merged into single segments.
+
+    Args:
+        geometry: object of type GeometryIR, e.g. from RecordingDrawer.geometry
+        tol: distance below which points are merged, in the length unit of geometry
+        merge_collinear: if True, collinear segments bounding the same sections are merged
+    Returns:
+        compiled: object of type CompiledGeometry
+    """
+    nodes = _SpatialHash(tol)
+
+    segments = {}
+    for (x0, y0, x1, y1), section in zip(geometry.lines.tolist(), geometry.line_section.tolist()):
+        a, b = nodes.node(x0, y0), nodes.node(x1, y1)
+        if a == b:
+            continue
+        sections = segments.setdefault((min(a, b), max(a, b)), set())
+        if section >= 0:
+            sections.add(section)
+
+    arcs = {}
+    for (xc, yc, x0, y0, x1, y1), section in zip(geometry.arcs.tolist(), geometry.arc_section.tolist()):
+        key = (nodes.node(x0, y0), nodes.node(x1, y1), round(xc / tol), round(yc / tol))
+        arc = arcs.setdefault(key, [xc, yc, set()])
+        if section >= 0:
+            arc[2].add(section)
+
+    points = np.array(nodes.points, dtype=float).reshape(-1, 2)
+    if merge_collinear:
+        segments = _merge_collinear(segments, arcs, points, tol)
+
+    # drop nodes left without segments or arcs and renumber the rest in order of first use
+    seg_nodes = np.array(list(segments), dtype=np.int64).reshape(-1, 2)
+    arc_nodes = np.array([key[:2] for key in arcs], dtype=np.int64).reshape(-1, 2)
+    used, inverse = np.unique(
+        np.concatenate((seg_nodes.ravel(), arc_nodes.ravel())), return_inverse=True
+    )
+    inverse = inverse.reshape(-1, 2)
+
+    arc_centers = np.array([arc[:2] for arc in arcs.values()], dtype=float).reshape(-1, 2)
+    start = points[arc_nodes[:, 0]] - arc_centers
+    end = points[arc_nodes[:, 1]] - arc_centers
+    alpha_s = np.arctan2(start[:, 1], start[:, 0]) % (2 * np.pi)
+    alpha_e = np.arctan2(end[:, 1], end[:, 0]) % (2 * np.pi)
+    alpha_e = np.where(alpha_e < alpha_s, alpha_e + 2 * np.pi, alpha_e)
+
+    compiled = CompiledGeometry(
+        length_unit=geometry.length_unit,
+        nodes=points[used],
+        segments=inverse[: len(seg_nodes)],
+        arcs=inverse[len(seg_nodes) :],
+        arc_centers=arc_centers,
+        arc_angles=np.degrees(alpha_e - alpha_s),
+        segment_sections=[tuple(sorted(s)) for s in segments.values()],
+        arc_sections=[tuple(sorted(arc[2])) for arc in arcs.values()],
+        section_inner_coord=geometry.section_inner_coord,
+        section_component=geometry.section_component,
+        component_name=geometry.component_name,
+        component_material=geometry.component_material,
+        component_depth=geometry.component_depth,
+    )
+    return compiled
+
+
+def _merge_collinear(segments, arcs, points, tol):
+    incident = {}
+    for key in segments:
+        for n in key:
+            incident.setdefault(n, []).append(key)
+    # nodes on arcs have to be kept
+    for key in arcs:
+        for n in key[:2]:
+            incident.setdefault(n, []).append(None)
+
+    for n, keys in incident.items():
+        if len(keys) != 2 or None in keys:
+            continue
+        first, second = keys
+        if segments[first] != segments[second]:
+            continue
+        a = first[0] if first[1] == n else first[1]
+        b = second[0] if second[1] == n else second[1]
+        u = points[n] - points[a]
+        v = points[b] - points[n]
+        if abs(u[0] * v[1] - u[1] * v[0]) > tol * np.hypot(*(points[b] - points[a])):
+            continue
+        if np.dot(u, v) <= 0 or a == b:
+            continue
+        merged = (min(a, b), max(a, b))
+        if merged in segments:
+            continue
+
+        segments[merged] = segments.pop(first)
+        del segments[second]
+        for end, old in ((a, first), (b, second)):
+            incident[end] = [merged if key == old else key for key in incident[end]]
+        incident[n] = []
+    return segments
+
+
+def replay_geometry(compiled: CompiledGeometry, tool, names=None) -> list:
+    """Issues compiled geometry to an eMach tool
+
+    Tools having add_node, add_segment and add_arc methods, such as FEMM, receive each node once
+    followed by segments and arcs between existing nodes. Other tools receive one draw_line or
+    draw_arc call per segment or arc. Sections and components are then made with
+    prepare_section and extrude.
+
+    Args:
+        compiled: object of type CompiledGeometry
+        tool: eMach tool implementing DrawerBase and MakerExtrudeBase
+        names: list of component names to make the components under, the recorded component
+            names if not defined
+    Returns:
+        token_make: list of TokenMake objects, one per component
+    """
+    if names is None:
+        names = compiled.component_name
+    elif len(names) != len(compiled.component_name):
+        raise ValueError("Expected " + str(len(compiled.component_name)) + " component names. "
+                         "Instead " + str(len(names)) + " were given")
+
+    unit = eval(compiled.length_unit)
+    nodes = [[unit(x), unit(y)] for x, y in compiled.nodes.tolist()]
+    centers = [[unit(x), unit(y)] for x, y in compiled.arc_centers.tolist()]
+
+    section_tokens = [[] for _ in range(len(compiled.section_inner_coord))]
+    if hasattr(tool, "add_node"):
+        for xy in nodes:
+            tool.add_node(xy)
+        for (a, b), sections in zip(compiled.segments.tolist(), compiled.segment_sections):
+            token = tool.add_segment(nodes[a], nodes[b])
+            for section in sections:
+                section_tokens[section].append(token)
+        for (a, b), angle, sections in zip(
+            compiled.arcs.tolist(), compiled.arc_angles.tolist(), compiled.arc_sections
+        ):
+            token = tool.add_arc(nodes[a], nodes[b], angle)
+            for section in sections:
+                section_tokens[section].append(token)
+    else:
+        for (a, b), sections in zip(compiled.segments.tolist(), compiled.segment_sections):
+            token = tool.draw_line(nodes[a], nodes[b])
+            for section in sections:
+                section_tokens[section].append(token)
+        for (a, b), center, sections in zip(
+            compiled.arcs.tolist(), centers, compiled.arc_sections
+        ):
+            token = tool.draw_arc(center, nodes[a], nodes[b])
+            for section in sections:
+                section_tokens[section].append(token)
+
+    token_make = []
+    for component, name in enumerate(names):
+        cs_token = []
+        for section in np.flatnonzero(compiled.section_component == component):
+            x, y = compiled.section_inner_coord[section]
+            cs_token.append(CrossSectToken([unit(x), unit(y)], section_tokens[section]))
+        prep_token = [tool.prepare_section(cs) for cs in cs_token]
+        depth = unit(compiled.component_depth[component])
+        make_token = tool.extrude(name, compiled.component_material[component], depth, prep_token)
+        token_make.append(TokenMake(cs_token, prep_token, make_token))
+    return token_make
@@ -0,0 +1,242 @@
+from array import array
+import numpy as np
+
+from ..tool_abc import toolabc as abc
+from ..token_draw import TokenDraw
+from ...model_obj.dimensions import *
+from ...model_obj.dimensions.dim_linear import DimLinear
+
+__all__ = []
+__all__ += ["GeometryIR", "RecordingDrawer"]
+
+
+class GeometryIR:
+    """Array-backed intermediate representation of drawn cross-sections and components
+
+    All coordinates are floats in the length unit of the recording drawer. Lines and arcs are
+    numbered in the order they were drawn. A section is a cross-section prepared for making a
+    component, a component is a group of sections made into a solid.
+
+    Attributes:
+        length_unit: name of the eMach linear dimension class of all coordinates, e.g. "DimMillimeter"
+        lines: numpy array of shape (n_lines, 4) holding [x_start, y_start, x_end, y_end]
+        arcs: numpy array of shape (n_arcs, 6) holding [x_center, y_center, x_start, y_start, x_end,
+            y_end], arcs run counterclockwise from start to end
+        line_section: numpy array of the section index of each line, -1 if not part of a section
+        arc_section: numpy array of the section index of each arc, -1 if not part of a section
+        section_inner_coord: numpy array of shape (n_sections, 2) holding a point inside each section
+        section_component: numpy array of the component index of each section, -1 if not made
+        component_name: list of component names
+        component_material: list of component materials as passed to the maker
+        component_depth: numpy array of extrusion depth of each component
+    """
+
+    def __init__(
+        self,
+        length_unit,
+        lines,
+        arcs,
+        line_section,
+        arc_section,
+        section_inner_coord,
+        section_component,
+        component_name,
+        component_material,
+        component_depth,
+    ):
+        self.length_unit = length_unit
+        self.lines = lines
+        self.arcs = arcs
+        self.line_section = line_section
+        self.arc_section = arc_section
+        self.section_inner_coord = section_inner_coord
+        self.section_component = section_component
+        self.component_name = list(component_name)
+        self.component_material = list(component_material)
+        self.component_depth = component_depth
+
+    @property
+    def n_lines(self):
+        return len(self.lines)
+
+    @property
+    def n_arcs(self):
+        return len(self.arcs)
+
+    @property
+    def n_sections(self):
+        return len(self.section_inner_coord)
+
+    @property
+    def n_components(self):
+        return len(self.component_name)
+
+    def section_primitives(self, section):
+        """Returns the indices of the lines and arcs bounding a section
+
+        Args:
+            section: index of the section
+        Returns:
+            lines: numpy array of line indices
+            arcs: numpy array of arc indices
+        """
+        return (
+            np.flatnonzero(self.line_section == section),
+            np.flatnonzero(self.arc_section == section),
+        )
+
+    def component_sections(self, component):
+        """Returns the indices of the sections of a component"""
+        return np.flatnonzero(self.section_component == component)
+
+    def bounds(self):
+        """Returns the bounding box [x_min, y_min, x_max, y_max] of all line and arc end points
+
+        Arcs are bounded by their end points only, bulges between them are not accounted for.
+        """
+        points = np.concatenate(
+            (self.lines.reshape(-1, 2), self.arcs[:, 2:].reshape(-1, 2))
+        )
+        if len(points) == 0:
+            return np.full(4, np.nan)
+        return np.concatenate((points.min(axis=0), points.max(axis=0)))
+
+
+class RecordingDrawer(abc.DrawerBase, abc.MakerExtrudeBase):
+    """Headless eMach tool recording drawn geometry instead of passing it to a CAD tool
+
+    Lines and arcs are appended to typed buffers as floats in a single length unit, so that the
+    geometry of cross-sections and components can be generated, inspected and compared without a
+    running CAD tool. The draw tokens hold the index of each primitive, prepared sections and
+    extruded components are recorded as index groups.
+
+    Attributes:
+        length_unit: name of the eMach linear dimension class coordinates are recorded in
+    """
+
+    def __init__(self, length_unit="DimMillimeter"):
+        self.length_unit = length_unit
+        self._unit = eval(length_unit)
+        self.clear()
+
+    def clear(self):
+        """Discards all recorded geometry"""
+        self._lines = array("d")
+        self._arcs = array("d")
+        self._line_section = array("l")
+        self._arc_section = array("l")
+        self._inner_coord = array("d")
+        self._section_component = array("l")
+        self._component_name = []
+        self._component_material = []
+        self._component_depth = array("d")
+
+    def _to_float(self, value):
+        # plain numbers are taken to be in the recording unit already
+        if isinstance(value, DimLinear):
+            return value._to_dimensionless() / self._unit._conversion_factor
+        return float(value)
+
+    def draw_line(self, startxy: "Location2D", endxy: "Location2D") -> "TokenDraw":
+        """Records a line.
+
+        Args:
+            startxy: Start point of line. Should be of type Location2D defined with eMach DimLinear.
+            endxy: End point of the line. Should be of type Location2D defined with eMach DimLinear.
+
+        Returns:
+            TokenDraw: Wrapper object holding the index of the line.
+        """
+        f = self._to_float
+        line = len(self._line_section)
+        self._lines.extend((f(startxy[0]), f(startxy[1]), f(endxy[0]), f(endxy[1])))
+        self._line_section.append(-1)
+        return TokenDraw(line, 0)
+
+    def draw_arc(
+        self, centerxy: "Location2D", startxy: "Location2D", endxy: "Location2D"
+    ) -> "TokenDraw":
+        """Records an arc running counterclockwise from start to end point.
+
+        Args:
+            centerxy: Centre point of arc. Should be of type Location2D defined with eMach Dimensions.
+            startxy: Start point of arc. Should be of type Location2D defined with eMach Dimensions.
+            endxy: End point of arc. Should be of type Location2D defined with eMach Dimensions.
+
+        Returns:
+            TokenDraw: Wrapper object holding the index of the arc.
+        """
+        f = self._to_float
+        arc = len(self._arc_section)
+        self._arcs.extend(
+            (
+                f(centerxy[0]),
+                f(centerxy[1]),
+                f(startxy[0]),
+                f(startxy[1]),
+                f(endxy[0]),
+                f(endxy[1]),
+            )
+        )
+        self._arc_section.append(-1)
+        return TokenDraw(arc, 1)
+
+    def select(self):
+        pass
+
+    def prepare_section(self, cs_token: "CrossSectToken") -> int:
+        """Records the lines and arcs of a cross-section as a section.
+
+        Args:
+            cs_token: CrossSectToken returned from drawing a cross-section with this drawer
+
+        Returns:
+            section: index of the section
+        """
+        section = len(self._section_component)
+        for token in cs_token.token:
+            if token.geometry_type == 0:
+                self._line_section[token.draw_token] = section
+            else:
+                self._arc_section[token.draw_token] = section
+        self._inner_coord.extend(
+            (self._to_float(cs_token.inner_coord[0]), self._to_float(cs_token.inner_coord[1]))
+        )
+        self._section_component.append(-1)
+        return section
+
+    def extrude(self, name, material, depth, token=None) -> int:
+        """Records sections as a component extruded to a depth.
+
+        Args:
+            name: name of the component
+            material: material of the component
+            depth: depth of extrusion. Should be defined with eMach Dimensions.
+            token: list of section indices returned from prepare_section
+
+        Returns:
+            component: index of the component
+        """
+        component = len(self._component_name)
+        for section in token if token is not None else []:
+            self._section_component[section] = component
+        self._component_name.append(name)
+        self._component_material.append(material)
+        self._component_depth.append(self._to_float(depth))
+        return component
+
+    @property
+    def geometry(self) -> GeometryIR:
+        """Snapshot of the recorded geometry as an object of type GeometryIR"""
+        return GeometryIR(
+            self.length_unit,
+            np.array(self._lines, dtype=float).reshape(-1, 4),
+            np.array(self._arcs, dtype=float).reshape(-1, 6),
+            np.array(self._line_section, dtype=np.int64),
+            np.array(self._arc_section, dtype=np.int64),
+            np.array(self._inner_coord, dtype=float).reshape(-1, 2),
+            np.array(self._section_component, dtype=np.int64),
+            self._component_name,
+            self._component_material,
+            np.array(self._component_depth, dtype=float),
+        )
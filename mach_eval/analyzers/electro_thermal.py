@@ -0,0 +1,200 @@
+"""Coupled electro-thermal fixed-point analysis.
+
+Losses depend on temperature through the conductor resistivity and the magnet remanence, while
+temperatures depend on the losses. This module iterates the two to a consistent operating point.
+"""
+
+import numpy as np
+from typing import Any, Callable
+
+__all__ = [
+    "copper_conductivity",
+    "magnet_remanence",
+    "ElectroThermalProblem",
+    "ElectroThermalAnalyzer",
+    "ElectroThermalResults",
+]
+
+
+def copper_conductivity(sigma_ref, T, T_ref=20, alpha=3.93e-3):
+    """Temperature dependent conductor conductivity
+
+    Args:
+        sigma_ref: conductivity at T_ref [S/m]
+        T: conductor temperature [C]
+        T_ref: reference temperature of sigma_ref [C]
+        alpha: temperature coefficient of resistivity [1/K]
+
+    Returns:
+        sigma: conductivity at T [S/m]
+    """
+    return sigma_ref / (1 + alpha * (np.asarray(T) - T_ref))
+
+
+def magnet_remanence(B_r_ref, T, T_ref=20, alpha=-1.2e-3):
+    """Temperature dependent magnet remanence
+
+    Args:
+        B_r_ref: remanence at T_ref [T]
+        T: magnet temperature [C]
+        T_ref: reference temperature of B_r_ref [C]
+        alpha: reversible temperature coefficient of remanence [1/K]
+
+    Returns:
+        B_r: remanence at T [T]
+    """
+    return B_r_ref * (1 + alpha * (np.asarray(T) - T_ref))
+
+
+class ElectroThermalProblem:
+    """Problem class for ElectroThermalAnalyzer
+
+    The coupled problem is the fixed point T = thermal_model(loss_model(T)). Expensive quantities,
+    such as FEA results or thermal networks, should be evaluated before creating the problem and
+    captured by the two models, so that each iteration only consists of cheap analytical solves.
+
+    Attributes:
+        loss_model (Callable): maps temperatures to losses
+        thermal_model (Callable): maps losses to temperatures, returns an array of the shape of T_0
+        T_0 (np.array): initial temperatures [C]
+        tol (float): convergence tolerance on the maximum temperature update [K]
+        max_iter (int): maximum number of thermal model evaluations
+        acceleration (str): "anderson", "aitken" or "none"
+        depth (int): number of previous iterates used by Anderson acceleration
+    """
+
+    def __init__(
+        self,
+        loss_model: Callable[[np.ndarray], Any],
+        thermal_model: Callable[[Any], np.ndarray],
+        T_0,
+        tol: float = 1e-3,
+        max_iter: int = 50,
+        acceleration: str = "anderson",
+        depth: int = 3,
+    ):
+        if acceleration not in ("anderson", "aitken", "none"):
+            raise ValueError(f"Unknown acceleration {acceleration}")
+        self.loss_model = loss_model
+        self.thermal_model = thermal_model
+        self.T_0 = np.array(T_0, dtype=float)
+        self.tol = tol
+        self.max_iter = max_iter
+        self.acceleration = acceleration
+        self.depth = depth
+
+
+class ElectroThermalAnalyzer:
+    """Analyzer class for ElectroThermalProblem"""
+
+    def analyze(self, problem: ElectroThermalProblem) -> "ElectroThermalResults":
+        """Iterates losses and temperatures to convergence
+
+        Args:
+            problem (ElectroThermalProblem): ElectroThermalProblem
+
+        Returns:
+            results (ElectroThermalResults): ElectroThermalResults
+        """
+        self._evaluations = 0
+        self._problem = problem
+        self._residuals = []
+        iterate = {
+            "anderson": self._anderson,
+            "aitken": self._aitken,
+            "none": self._picard,
+        }[problem.acceleration]
+        T, iterations, converged = iterate(problem.T_0.copy())
+
+        # report the losses consistent with the returned temperatures
+        losses = problem.loss_model(T)
+        return ElectroThermalResults(
+            T, losses, iterations, self._evaluations, converged, self._residuals
+        )
+
+    def _G(self, T):
+        """Fixed point map, returns G(T) and the residual G(T) - T"""
+        problem = self._problem
+        self._evaluations += 1
+        G = np.asarray(
+            problem.thermal_model(problem.loss_model(T)), dtype=float
+        ).reshape(T.shape)
+        f = G - T
+        self._residuals.append(np.max(np.abs(f)))
+        return G, f
+
+    def _budget_left(self):
+        return self._evaluations < self._problem.max_iter
+
+    def _picard(self, T):
+        iterations = 0
+        while self._budget_left():
+            G, f = self._G(T)
+            iterations += 1
+            T = G
+            if self._residuals[-1] < self._problem.tol:
+                return T, iterations, True
+        return T, iterations, False
+
+    def _anderson(self, T):
+        """Type-II Anderson acceleration with a finite history"""
+        depth = self._problem.depth
+        dG, dF = [], []
+        G_prev = f_prev = None
+        iterations = 0
+        while self._budget_left():
+            G, f = self._G(T)
+            iterations += 1
+            if self._residuals[-1] < self._problem.tol:
+                return G, iterations, True
+            if f_prev is not None:
+                dG.append((G - G_prev).ravel())
+                dF.append((f - f_prev).ravel())
+                dG, dF = dG[-depth:], dF[-depth:]
+            G_prev, f_prev = G, f
+
+            T = G
+            if dF:
+                gamma = np.linalg.lstsq(np.array(dF).T, f.ravel(), rcond=None)[0]
+                T = G - (np.array(dG).T @ gamma).reshape(T.shape)
+        return G_prev, iterations, False
+
+    def _aitken(self, T):
+        """Element-wise Aitken delta-squared extrapolation of two Picard steps"""
+        iterations = 0
+        while self._budget_left():
+            T_1, f = self._G(T)
+            iterations += 1
+            if self._residuals[-1] < self._problem.tol:
+                return T_1, iterations, True
+            if not self._budget_left():
+                return T_1, iterations, False
+            T_2, f_1 = self._G(T_1)
+            if self._residuals[-1] < self._problem.tol:
+                return T_2, iterations, True
+
+            curvature = f_1 - f
+            with np.errstate(divide="ignore", invalid="ignore"):
+                T_acc = T_2 - f_1**2 / curvature
+            T = np.where(np.abs(curvature) > 1e-12, T_acc, T_2)
+        return T, iterations, False
+
+
+class ElectroThermalResults:
+    def __init__(self, T, losses, iterations, evaluations, converged, residuals):
+        """Results class for ElectroThermalAnalyzer
+
+        Attributes:
+            T (np.array): converged temperatures [C]
+            losses: losses at T, as returned by the loss model
+            iterations (int): number of fixed point iterations
+            evaluations (int): number of loss and thermal model evaluations
+            converged (bool): True if the temperature update dropped below the tolerance
+            residuals (list): maximum temperature update of each evaluation [K]
+        """
+        self.T = T
+        self.losses = losses
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.converged = converged
+        self.residuals = residuals
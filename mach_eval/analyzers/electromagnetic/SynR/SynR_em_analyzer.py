@@ -1,6 +1,5 @@
 import os
 import numpy as np
-import pandas as pd
 import sys
 from time import time as clock_time
 
@@ -9,6 +8,7 @@ from mach_opt import InvalidDesign
 from mach_eval.analyzers.electromagnetic.stator_wdg_res import(
     StatorWindingResistanceProblem, StatorWindingResistanceAnalyzer
 )
+from mach_eval.analyzers.electromagnetic.jmag_csv import load_jmag_results, SYNR_JMAG_SCHEMA
 from mach_cad.tools import jmag as JMAG
 
 class SynR_EM_Problem:
@@ -1069,48 +1069,17 @@ class SynR_EM_Analyzer:
         return list_region_objects
 
     def extract_JMAG_results(self, path, study_name):
-        current_csv_path = path + study_name + "_circuit_current.csv"
-        torque_csv_path = path + study_name + "_torque.csv"
-        force_csv_path = path + study_name + "_force.csv"
-        iron_loss_path = path + study_name + "_iron_loss_loss.csv"
-        hysteresis_loss_path = path + study_name + "_hysteresis_loss_loss.csv"
-        eddy_current_loss_path = path + study_name + "_joule_loss_loss.csv"
-        ohmic_loss_path = path + study_name + "_joule_loss.csv"
-        fem_coil_flux_path = path + study_name + "_inductance_of_fem_coil.csv"
-
-        curr_df = pd.read_csv(current_csv_path, skiprows=6)
-        tor_df = pd.read_csv(torque_csv_path, skiprows=6)
-        force_df = pd.read_csv(force_csv_path, skiprows=6)
-        iron_df = pd.read_csv(iron_loss_path, skiprows=6)
-        hyst_df = pd.read_csv(hysteresis_loss_path, skiprows=6)
-        eddy_df = pd.read_csv(eddy_current_loss_path, skiprows=6)
-        ohmic_df = pd.read_csv(ohmic_loss_path, skiprows=6)
-        flux_df = pd.read_csv(fem_coil_flux_path, skiprows=6)
-
-        curr_df = curr_df.set_index("Time(s)")
-        tor_df = tor_df.set_index("Time(s)")
-        force_df = force_df.set_index("Time(s)")
-        eddy_df = eddy_df.set_index("Frequency(Hz)")
-        hyst_df = hyst_df.set_index("Frequency(Hz)")
-        iron_df = iron_df.set_index("Frequency(Hz)")
-        ohmic_df = ohmic_df.set_index("Time(s)")
-        flux_df = flux_df.set_index("Time(s)")
+        # the parsed CSVs are cached as .npz next to them
+        jmag_results = load_jmag_results(path, study_name, SYNR_JMAG_SCHEMA)
 
         fea_data = {
-            "current": curr_df,
-            "torque": tor_df,
-            "force": force_df,
-            "iron_loss": iron_df,
-            "hysteresis_loss": hyst_df,
-            "eddy_current_loss": eddy_df,
-            "ohmic_loss": ohmic_df,
+            **jmag_results,
             "no_of_steps": self.config.no_of_steps,
             "no_of_rev": self.config.no_of_rev,
             "scale_axial_length": self.config.scale_axial_length,          
             "drive_freq": self.drive_freq,
             "stator_wdg_resistances": [self.R_wdg, self.R_wdg_coil_ends, self.R_wdg_coil_sides],
             "stator_slot_area": self.stator_slot_area,
-            "coil_flux_linkages": flux_df,
             "rotor_speed": (self.operating_point.speed * self.operating_point.speed_ratio)
         }
 
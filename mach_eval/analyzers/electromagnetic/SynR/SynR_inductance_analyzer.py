@@ -1,6 +1,5 @@
 import os
 import numpy as np
-import pandas as pd
 import sys
 from time import time as clock_time
 
@@ -9,6 +8,7 @@ from mach_opt import InvalidDesign
 from mach_eval.analyzers.electromagnetic.stator_wdg_res import(
     StatorWindingResistanceProblem, StatorWindingResistanceAnalyzer
 )
+from mach_eval.analyzers.electromagnetic.jmag_csv import read_jmag_csv
 from mach_cad.tools import jmag as JMAG
 
 class SynR_Inductance_Problem:
@@ -1052,11 +1052,13 @@ class SynR_Inductance_Analyzer:
     def extract_JMAG_results(self, path, study_name):
         fem_coil_flux_path = path + study_name + "_flux_of_fem_coil.csv"
 
-        flux_df = pd.read_csv(fem_coil_flux_path, skiprows=7)
+        # time is kept as the first column for the post-analyzer
+        flux_df = read_jmag_csv(fem_coil_flux_path, skiprows=7, index_col=False).to_frame()
 
         fea_data = {
             "coil_flux_linkages": flux_df,
             "current_peak": self.I_hat,
+            "drive_freq": self.drive_freq,
         }
 
         return fea_data
\ No newline at end of file
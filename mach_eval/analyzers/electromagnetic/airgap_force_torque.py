@@ -0,0 +1,130 @@
+########################### source of equations ###############################
+# Torque and force are determined from the Maxwell stress tensor evaluated on a
+# circle at the inner bore of the stator. With the airgap fields written as
+# Fourier series, the integrals over the circle reduce to sums of products of
+# harmonic coefficients.
+###############################################################################
+
+import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+from bfield_protocol import BField
+
+
+class AirgapForceTorqueProblem:
+    """Problem class for airgap force and torque analyzer
+    Attributes:
+        rotor_field: Rotor field of type BFieldSPM_InnerRotor, the rotor d-axis is at its theta
+        stator_field: Stator field of type BFieldOuterStator
+        l_st: Stack length [m]
+        theta: A numpy array of rotor positions relative to the rotor field orientation [rad]
+        rotor_harmonics: A numpy array holding rotor field harmonics of interest. Considers
+            1st thirteen harmonics of p if not defined
+        stator_sequence: A numpy array holding the rotation of each stator field harmonic as the
+            rotor moves. +1 rotates forward and -1 backward by p * theta electrical radians, 0
+            keeps the stator field fixed. All harmonics rotate forward if not defined, which
+            keeps the stator field synchronous with the rotor.
+    """
+
+    def __init__(
+        self,
+        rotor_field: BField,
+        stator_field: BField,
+        l_st,
+        theta=0,
+        rotor_harmonics=None,
+        stator_sequence=None,
+    ):
+        self.rotor_field = rotor_field
+        self.stator_field = stator_field
+        self.l_st = l_st
+        self.theta = np.atleast_1d(np.asarray(theta, dtype=float))
+        if rotor_harmonics is None:
+            rotor_harmonics = rotor_field.p * np.arange(1, 15, 2)  # first 13 harmonics
+        self.rotor_harmonics = np.asarray(rotor_harmonics)
+        if stator_sequence is None:
+            stator_sequence = np.ones(len(stator_field.n))
+        self.stator_sequence = np.asarray(stator_sequence)
+
+
+class AirgapForceTorqueAnalyzer:
+    """Analyzer class to determine torque and force from rotor and stator airgap fields"""
+
+    def analyze(self, problem: AirgapForceTorqueProblem):
+        """Determines torque and x-y forces acting on the rotor at each rotor position
+
+        Fields of both sources are combined harmonic by harmonic. Torque results from products of
+        radial and tangential harmonics of the same order, while forces result from products of
+        harmonics whose orders differ by one, such as the p pole pair rotor field and the
+        ps = p +/- 1 pole pair suspension field of a bearingless machine.
+
+        Args:
+            problem: object of type AirgapForceTorqueProblem
+        Returns:
+            results: Dict of torque [Nm], Fx [N] and Fy [N] arrays against rotor position
+        """
+        mu0 = 4 * np.pi * 10**-7
+        rotor = problem.rotor_field
+        stator = problem.stator_field
+        r = stator.r_si
+        p = rotor.p
+        theta = problem.theta[:, np.newaxis]
+
+        n_r = problem.rotor_harmonics
+        n_s = np.asarray(stator.n)
+        # rotor field harmonics follow the rotor, stator harmonics rotate with the currents
+        rotor_shift = np.exp(-1j * n_r * theta)
+        stator_shift = np.exp(-1j * problem.stator_sequence * p * theta)
+        n = np.concatenate((n_r, n_s))
+        b_rad_h = np.concatenate(
+            (
+                rotor.radial_harmonics(r, n_r) * rotor_shift,
+                stator.radial_harmonics(r) * stator_shift,
+            ),
+            axis=-1,
+        )
+        b_tan_h = np.concatenate(
+            (
+                rotor.tan_harmonics(r, n_r) * rotor_shift,
+                stator.tangential_harmonics() * stator_shift,
+            ),
+            axis=-1,
+        )
+        c_rad, L = two_sided_spectrum(b_rad_h, n)
+        c_tan, _ = two_sided_spectrum(b_tan_h, n)
+
+        # integral of b_rad * b_tan over the circle is 2 pi sum(c_rad[k] * c_tan[-k])
+        torque = problem.l_st * r**2 / mu0 * 2 * np.pi * np.real(
+            np.sum(c_rad * c_tan[:, ::-1], axis=-1)
+        )
+
+        # F = l r / (2 mu0) * integral of (b_rad + j b_tan)^2 e^(j alpha) over the circle,
+        # i.e. 2 pi sum(s[k] * s[-1 - k]) with s = c_rad + j c_tan
+        s = c_rad + 1j * c_tan
+        F = problem.l_st * r / (2 * mu0) * 2 * np.pi * np.sum(
+            s[:, : 2 * L] * s[:, 2 * L - 1 :: -1], axis=-1
+        )
+
+        results = {"torque": torque, "Fx": np.real(F), "Fy": np.imag(F)}
+        return results
+
+
+def two_sided_spectrum(fields, n):
+    """Converts cos-referenced harmonic phasors into a dense two-sided Fourier spectrum
+
+    Args:
+        fields: A numpy array of complex field harmonics, harmonics along the last axis
+        n: A numpy array holding the positive integer order of each harmonic
+    Returns:
+        c: A numpy array of Fourier coefficients of orders -L to L along the last axis
+        L: Highest harmonic order, orders n are located at index L + n
+    """
+    n = np.asarray(n).astype(np.int64)
+    L = int(n.max()) + 1
+    c = np.zeros(fields.shape[:-1] + (2 * L + 1,), dtype=complex)
+    # Re(F exp(j n alpha)) = F / 2 exp(j n alpha) + conj(F) / 2 exp(-j n alpha)
+    np.add.at(c, (Ellipsis, L + n), fields / 2)
+    np.add.at(c, (Ellipsis, L - n), np.conj(fields) / 2)
+    return c, L
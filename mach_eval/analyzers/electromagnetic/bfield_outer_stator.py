@@ -14,7 +14,7 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(__file__))
-from bfield_protocol import BField
+from bfield_protocol import BField, field_from_harmonics
 
 
 class BFieldOuterStatorProblem1:
@@ -133,7 +133,7 @@ class BFieldOuterStator(BField):
             b_radial_h = self.radial_harmonics(r)
             n = self.n
         else:
-            mask = np.in1d(self.n, harmonics)  # find array ids at which harmonics exist
+            mask = np.isin(self.n, harmonics)  # find array ids at which harmonics exist
             # n and b_radial_h only take harmonic values
             n = self.n[mask]
             b_radial_h = self.radial_harmonics(r)[mask]
@@ -159,7 +159,7 @@ class BFieldOuterStator(BField):
             b_tan_h = self.tangential_harmonics()
             n = self.n
         else:
-            mask = np.in1d(self.n, harmonics)  # find array ids at which harmonics exist
+            mask = np.isin(self.n, harmonics)  # find array ids at which harmonics exist
             # n and b_radial_h only take harmonic values
             n = self.n[mask]
             b_tan_h = self.tangential_harmonics()[mask]
@@ -245,17 +245,5 @@ class BFieldOuterStator(BField):
         return k_cu
 
     def __field_from_harmonics(self, fields, n, alpha):
-        # get phase and magnitude of B field harmonics
-        b_mag = abs(fields)
-        b_phase = np.angle(fields)
-
-        n = n.reshape(len(n), 1)  # reshape n for matrix multilication
-        alpha_t = alpha.reshape(1, len(alpha))  # reshape alpha for matrix multilication
-        # get effective theta at each harmonic based on n, alpha, and phase shift
-        theta = n * alpha_t + b_phase.reshape(len(b_phase), 1)
-        # get cosine asuuming MMF phase is provided relative to cos function
-        cos_array = np.cos(theta)
-
-        # get effective tangential B field at each alpha as a sum of all harmonics
-        b_tan = np.sum(b_mag.reshape(len(b_mag), 1) * cos_array, axis=0)
-        return b_tan
+        # fields are phasors relative to cos, uniform angles are reconstructed by inverse FFT
+        return field_from_harmonics(fields, n, alpha)
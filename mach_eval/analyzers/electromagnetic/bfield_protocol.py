@@ -18,3 +18,63 @@ class BField(Protocol):
         self, alpha: np.array, r: Union[int, float], harmonics: np.array
     ) -> np.array:
         pass
+
+
+def field_from_harmonics(fields: np.array, n: np.array, alpha: np.array) -> np.array:
+    """Reconstructs field from harmonic phasors
+
+    The field is the real part of the sum of fields * exp(j * n * alpha) over all harmonics.
+    Uniformly spaced angles whose spacing evenly divides the circle are evaluated with an
+    inverse FFT when this is cheaper than the dense harmonic by angle sum, arbitrary angles
+    always use the dense sum.
+
+    Args:
+        fields: A numpy array of complex field harmonics, harmonics along the last axis
+        n: A numpy array holding the harmonic order of each field harmonic
+        alpha: A numpy array holding angles at which B field is calculated
+    Returns:
+        b_field: A numpy array of fields of shape fields.shape[:-1] + alpha.shape
+    """
+    fields = np.asarray(fields)
+    n = np.asarray(n)
+    alpha = np.asarray(alpha, dtype=float)
+    M = _fft_length(n, alpha)
+    if M is not None and M * np.log2(max(M, 2)) < n.size * alpha.size:
+        return _field_from_harmonics_fft(fields, n, alpha, M)
+    return _field_from_harmonics_dense(fields, n, alpha)
+
+
+def _field_from_harmonics_dense(fields, n, alpha):
+    """Dense (harmonics x angles) reconstruction for arbitrary angles"""
+    phasors = np.exp(1j * np.multiply.outer(n, alpha))
+    return np.real(np.tensordot(fields, phasors, axes=1))
+
+
+def _field_from_harmonics_fft(fields, n, alpha, M):
+    """Inverse FFT reconstruction for angles alpha[0] + k * 2 pi / M"""
+    # phasors are shifted to the first angle and binned by harmonic order modulo M
+    shifted = fields * np.exp(1j * n * alpha[0])
+    spectrum = np.zeros(fields.shape[:-1] + (M,), dtype=complex)
+    np.add.at(spectrum, (Ellipsis, np.mod(n.astype(np.int64), M)), shifted)
+    samples = np.fft.ifft(spectrum, axis=-1) * M
+    k = np.arange(alpha.size) % M
+    return np.real(samples[..., k])
+
+
+def _fft_length(n, alpha):
+    """FFT length if the angles are uniformly spaced by 2 pi / M and n holds integers, else None"""
+    if alpha.ndim != 1 or alpha.size < 2 or n.ndim != 1:
+        return None
+    if not np.all(np.mod(n, 1) == 0):
+        return None
+    step = alpha[1] - alpha[0]
+    if step == 0:
+        return None
+    tol = 1e-9 * max(np.abs(alpha).max(), abs(step))
+    if not np.allclose(np.diff(alpha), step, rtol=0, atol=tol):
+        return None
+    M = 2 * np.pi / abs(step)
+    if abs(M - round(M)) > 1e-6 * M:
+        return None
+    # negative steps sample the spectrum in reverse
+    return int(round(M)) if step > 0 else None
@@ -7,9 +7,10 @@
 import numpy as np
 import os
 import sys
+from functools import lru_cache
 
 sys.path.append(os.path.dirname(__file__))
-from bfield_protocol import BField
+from bfield_protocol import BField, field_from_harmonics
 
 class BFieldSPM_InnerRotorProblem:
     """Problem class for stator radial B field analyzer
@@ -93,7 +94,8 @@ class BFieldSPM_InnerRotor(BField):
 
         Args:
             alpha: A numpy array holding angles at which B field is calculated.
-            r: Radius at which B field is calculated.
+            r: Radius at which B field is calculated. An array of radii returns a field map of
+              shape r.shape + alpha.shape.
             theta: Angular orientation of PM rotor d-axis.
             harmonics: A numpy array holding holding harmonics of interest.
         Returns:
@@ -111,7 +113,8 @@ class BFieldSPM_InnerRotor(BField):
 
         Args:
             alpha: A numpy array holding angles at which B field is calculated.
-            r: Radius at which B field is calculated. Should be of type int or float
+            r: Radius at which B field is calculated. An array of radii returns a field map of
+              shape r.shape + alpha.shape.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest
         Returns:
@@ -128,140 +131,119 @@ class BFieldSPM_InnerRotor(BField):
         """Determines radial B field harmonics at radius r
 
         Args:
-            r: Radius at which B field is calculated. Should be of type int or float. Defaults to 
-              inner bore of stator if not defined.
+            r: Radius at which B field is calculated. Defaults to inner bore of stator if not
+              defined. An array of radii returns harmonics of shape r.shape + harmonics.shape.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest. Considers 1st thirteen
               harmonics of p if not defined 
         Returns:
             b_rad_h: A numpy array of radial B field harmonics corresponding harmonics array
         """
-        if r==None:
-            r = self.Rsi    # stator inner bore
-        if harmonics is None:
-            harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
-        r_fe = self.r_fe
-        p = self.p
-        muR = self.muR
-        Rmo = self.Rmo # rotor outer radius
-        Rsi = self.Rsi # stator inner radius
-        vp = harmonics
-        # get magnetization vector
-        Mv, c3v = self.__get_Mv_c3v(harmonics)
-
-        # calculate radial b field magnitudes using EQUATION 15a
-        Bov = (Mv*vp/(muR*(vp)**2-1))*\
-                (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
-                ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))*\
-                ((r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
+        return self.__harmonics(r, harmonics, sign=1)
 
-        # discard even and fractional harmonics and revise formula for vp=1
-        for i in range(len(vp)):
-            # even harmonics non-existent
-            if harmonics[i]/p % 2 == 0 or harmonics[i]/p % 1 != 0:
-                Bov[i] = 0
-                continue
-            # vp=1 has different field formula
-            elif vp[i] == 1:
-                Bov[i] = ((Mv[i]/(muR*2))*(c3v[i]*(Rmo/Rsi)**2 -(c3v[i])*(r_fe/Rsi)**2 +\
-                            (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
-                            (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))*(1+(Rsi/r)**2))
-        # rotate based on rotor orientation
-        b_rad_h = np.array(Bov) * np.exp(-self.theta*vp* 1j)
-        return b_rad_h 
-    
     def tan_harmonics(self, r=None, harmonics=None):
         """Determines tangential B field harmonics at radius r
 
         Args:
-            r: Radius at which B field is calculated. Should be of type int or float. Defaults to 
-              inner bore of stator if not defined.
+            r: Radius at which B field is calculated. Defaults to inner bore of stator if not
+              defined. An array of radii returns harmonics of shape r.shape + harmonics.shape.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest. Considers 1st thirteen
               harmonics of p if not defined 
         Returns:
             b_rad_h: A numpy array of tangential B field harmonics corresponding harmonics array
         """
-        if r==None:
+        b_tan_h = self.__harmonics(r, harmonics, sign=-1)
+        # rotate again considering tan is a sine function 
+        b_tan_h = b_tan_h * np.exp(-np.pi/2* 1j)
+        return b_tan_h
+
+    def __harmonics(self, r, harmonics, sign):
+        """Evaluates EQUATION 15a (sign=1) or 15b (sign=-1) for all harmonics and radii at once"""
+        if r is None:
             r = self.Rsi    # stator inner bore
         if harmonics is None:
             harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
-        r_fe = self.r_fe
-        p = self.p
-        muR = self.muR
         Rmo = self.Rmo # rotor outer radius
         Rsi = self.Rsi # stator inner radius
-        vp = harmonics
-        # get magnetization vector
-        Mv, c3v = self.__get_Mv_c3v(harmonics)
-
-        # calculate radial b field magnitudes using EQUATION 15b
-        Bov = (Mv*vp/(muR*(vp)**2-1))*\
-            (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
-            ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))*\
-            (-1*(r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
-
-        # discard even harmoincs and revise formula for vp=1
-        for i in range(len(vp)):
-            # even harmonics non-existent
-            if harmonics[i]/p % 2 == 0 or harmonics[i]/p % 1 != 0:
-                Bov[i] = 0
-                continue
-            # vp=1 has different field formula
-            elif vp[i] == 1:
-                Bov[i] = (Mv[i]/(muR*2))*(c3v[i]*(Rmo/Rsi)**2 -(c3v[i])*(r_fe/Rsi)**2 +\
-                            (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
-                            (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))*(-1+(Rsi/r)**2)
+        vp = np.asarray(harmonics)
+        coeff, is_one = spm_field_coefficients(
+            self.alpha_p, self.p, self.muR, self.Br, self.r_fe, self.dm, self.delta,
+            self.mag_dir, tuple(vp.tolist()))
+
+        # radius dependent terms, vp=1 has a different field formula
+        r = np.asarray(r, dtype=float)[..., np.newaxis]
+        with np.errstate(over="ignore", under="ignore"):
+            r_term = np.where(
+                is_one,
+                sign+(Rsi/r)**2,
+                sign*(r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
         # rotate based on rotor orientation
-        b_tan_h = np.array(Bov) * np.exp(-self.theta*vp* 1j)
-        # rotate again considering tan is a sine function 
-        b_tan_h = b_tan_h * np.exp(-np.pi/2* 1j)
-        return b_tan_h 
+        return coeff * r_term * np.exp(-self.theta*vp* 1j)
 
-    def __get_Mv_c3v(self, harmonics):
-        alpha_p = self.alpha_p
-        Br = self.Br
-        p = self.p
-        vp = harmonics
-        v = vp/p
-        if self.mag_dir=="parallel":
-            # EQUATION 7c and 7d
-            c1v = np.sin((vp+1)*alpha_p*np.pi/(2*p))/((vp+1)*alpha_p*np.pi/(2*p))
-            c2v = np.sin((vp-1)*alpha_p*np.pi/(2*p))/((vp-1)*alpha_p*np.pi/(2*p))
-            for i in range(len(vp)):
-                if vp[i]==1:
-                    c2v[i] = 1
-                    break
-            Mrv = Br*alpha_p*(c1v+c2v)
-            Mtv = Br*alpha_p*(c1v-c2v)
-            # EQUATION 10b
-            Mv = Mrv+vp*Mtv
-            c3v = (vp-1/(vp))*Mrv/Mv + 1/(vp)
-            c3v[i] = 2*Mrv[i]/Mv[i]
+    def __field_from_harmonics(self, fields, n, alpha):
+        # fields are phasors relative to cos, uniform angles are reconstructed by inverse FFT
+        return field_from_harmonics(fields, n, alpha)
 
-        elif self.mag_dir=="radial":
-            # EQUATION 7a and 7b
-            Mrv = 2*Br*alpha_p*np.sin(v*np.pi*alpha_p/2)/(v*np.pi*alpha_p/2)
-            Mtv = 0
-            # EQUATION 10b
-            Mv = Mrv+vp*Mtv
-            c3v = vp
-        else:
-            raise NotImplemented("Invalid magnetization direction")
-        return Mv, c3v
 
-    def __field_from_harmonics(self, fields, n, alpha):
-        # get phase and magnitude of B field harmonics
-        b_mag = abs(fields)
-        b_phase = np.angle(fields)
+@lru_cache(maxsize=256)
+def spm_field_coefficients(alpha_p, p, muR, Br, r_fe, dm, delta, mag_dir, harmonics):
+    """Radius independent coefficients of EQUATION 15a and 15b
 
-        n = n.reshape(len(n), 1)  # reshape n for matrix multilication
-        alpha_t = alpha.reshape(1, len(alpha))  # reshape alpha for matrix multilication
-        # get effective theta at each harmonic based on n, alpha, and phase shift
-        theta = n * alpha_t + b_phase.reshape(len(b_phase), 1)
-        # get cosine asuuming MMF phase is provided relative to cos function
-        cos_array = np.cos(theta)
+    Coefficient tables are cached per geometry and harmonic set, so repeated field evaluations
+    at different radii, angles and rotor orientations only evaluate the radius dependent terms.
 
-        # get effective tangential B field at each alpha as a sum of all harmonics
-        b_field = np.sum(b_mag.reshape(len(b_mag), 1) * cos_array, axis=0)
-        return b_field
+    Args:
+        alpha_p: angular length of magnet in pu
+        p: Number of pole pairs
+        muR: Relative permeability
+        Br: Magnet remanence
+        r_fe: Outer radius of rotor iron
+        dm: Thickness of magnet
+        delta: Rotor sleeve and airgap dimension
+        mag_dir: Direction of magnetization, 'parallel' or 'radial'
+        harmonics: Tuple of harmonics of interest
+    Returns:
+        coeff: A read-only numpy array of coefficients, 0 for even and fractional harmonics
+        is_one: A read-only boolean numpy array marking the vp=1 harmonic
+    """
+    vp = np.array(harmonics, dtype=float)
+    Rmo = r_fe+dm
+    Rsi = r_fe+dm+delta
+    is_one = vp == 1
+    v = vp/p
+    # even and fractional harmonics non-existent
+    absent = (v % 2 == 0) | (v % 1 != 0)
+
+    # get magnetization vector
+    if mag_dir=="parallel":
+        # EQUATION 7c and 7d, np.sinc(x/pi) = sin(x)/x and is 1 for vp=1
+        c1v = np.sinc((vp+1)*alpha_p/(2*p))
+        c2v = np.sinc((vp-1)*alpha_p/(2*p))
+        Mrv = Br*alpha_p*(c1v+c2v)
+        Mtv = Br*alpha_p*(c1v-c2v)
+        # EQUATION 10b
+        Mv = Mrv+vp*Mtv
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c3v = np.where(is_one, 2*Mrv/Mv, (vp-1/(vp))*Mrv/Mv + 1/(vp))
+    elif mag_dir=="radial":
+        # EQUATION 7a and 7b
+        Mrv = 2*Br*alpha_p*np.sinc(v*alpha_p/2)
+        # EQUATION 10b
+        Mv = Mrv
+        c3v = vp
+    else:
+        raise NotImplementedError("Invalid magnetization direction")
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore", under="ignore"):
+        coeff = (Mv*vp/(muR*(vp)**2-1))*\
+            (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
+            ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))
+        coeff_one = (Mv/(muR*2))*(c3v*(Rmo/Rsi)**2 -(c3v)*(r_fe/Rsi)**2 +\
+            (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
+            (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))
+    coeff = np.where(is_one, coeff_one, coeff)
+    coeff = np.where(absent, 0, coeff)
+    coeff.flags.writeable = False
+    is_one.flags.writeable = False
+    return coeff, is_one
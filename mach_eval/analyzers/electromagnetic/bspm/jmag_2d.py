@@ -1,7 +1,6 @@
 from time import time as clock_time
 import os
 import numpy as np
-import pandas as pd
 import sys
 
 from eMach.mach_eval.analyzers.electromagnetic.bspm.electrical_analysis import (
@@ -12,6 +11,7 @@ from eMach.mach_eval.analyzers.electromagnetic.bspm.electrical_analysis.Location
 
 sys.path.append(os.path.dirname(__file__) + "/../../../..")
 from mach_opt import InvalidDesign
+from mach_eval.analyzers.electromagnetic.jmag_csv import load_jmag_results, BSPM_JMAG_SCHEMA
 
 
 class BSPM_EM_Problem:
@@ -1089,55 +1089,15 @@ class BSPM_EM_Analyzer:
         # results are selected.
 
     def extract_JMAG_results(self, path, study_name):
-        current_csv_path = path + study_name + "_circuit_current.csv"
-        voltage_csv_path = path + study_name + "_EXPORT_CIRCUIT_VOLTAGE.csv"
-        torque_csv_path = path + study_name + "_torque.csv"
-        force_csv_path = path + study_name + "_force.csv"
-        iron_loss_path = path + study_name + "_iron_loss_loss.csv"
-        hysteresis_loss_path = path + study_name + "_hysteresis_loss_loss.csv"
-        eddy_current_loss_path = path + study_name + "_joule_loss.csv"
-
-        curr_df = pd.read_csv(current_csv_path, skiprows=6)
-        volt_df = pd.read_csv(
-            voltage_csv_path,
-        )
-        volt_df.rename(
-            columns={
-                "Time, s": "Time(s)",
-                "Terminal_Us [Case 1]": "Terminal_Us",
-                "Terminal_Ut [Case 1]": "Terminal_Ut",
-                "Terminal_Vs [Case 1]": "Terminal_Vs",
-                "Terminal_Vt [Case 1]": "Terminal_Vt",
-                "Terminal_Ws [Case 1]": "Terminal_Ws",
-                "Terminal_Wt [Case 1]": "Terminal_Wt",
-            },
-            inplace=True,
-        )
-
-        tor_df = pd.read_csv(torque_csv_path, skiprows=6)
-        force_df = pd.read_csv(force_csv_path, skiprows=6)
-        iron_df = pd.read_csv(iron_loss_path, skiprows=6)
-        hyst_df = pd.read_csv(hysteresis_loss_path, skiprows=6)
-        eddy_df = pd.read_csv(eddy_current_loss_path, skiprows=6)
-
         range_2TS = int(self.config.no_of_steps_per_rev_2TS * self.config.no_of_rev_2TS)
 
-        curr_df = curr_df.set_index("Time(s)")
-        tor_df = tor_df.set_index("Time(s)")
-        volt_df = volt_df.set_index("Time(s)")
-        force_df = force_df.set_index("Time(s)")
-        eddy_df = eddy_df.set_index("Time(s)")
-        hyst_df = hyst_df.set_index("Frequency(Hz)")
-        iron_df = iron_df.set_index("Frequency(Hz)")
+        # only the fine step section is post-processed, the parsed CSVs are cached as .npz
+        jmag_results = load_jmag_results(
+            path, study_name, BSPM_JMAG_SCHEMA, tail=range_2TS
+        )
 
         fea_data = {
-            "current": curr_df,
-            "voltage": volt_df,
-            "torque": tor_df,
-            "force": force_df,
-            "iron_loss": iron_df,
-            "hysteresis_loss": hyst_df,
-            "eddy_current_loss": eddy_df,
+            **jmag_results,
             "copper_loss": self.copper_loss,
             "range_fine_step": range_2TS,
         }
@@ -0,0 +1,230 @@
+"""Fast loading of JMAG CSV result exports.
+
+JMAG writes table results as CSV files with a few lines of metadata followed by a header row and
+rows of floats. This module parses them directly into float arrays, optionally keeping only the
+last rows of a time series, and caches the parsed arrays in a ``.npz`` file next to each CSV so
+that archived runs can be post-processed again without parsing text.
+"""
+
+import io
+import os
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "JmagCSVSchema",
+    "JmagTable",
+    "read_jmag_csv",
+    "load_jmag_results",
+    "BSPM_JMAG_SCHEMA",
+    "SYNR_JMAG_SCHEMA",
+]
+
+
+class JmagCSVSchema:
+    """Layout of a JMAG CSV export
+
+    Attributes:
+        suffix: file name following the study name, e.g. "_torque.csv"
+        index_col: name of the index column after renaming, e.g. "Time(s)"
+        skiprows: number of metadata lines before the header row
+        rename: dict mapping header names of the file to column names
+        time_series: True if the rows are time steps, only these are cut to the last rows
+    """
+
+    def __init__(self, suffix, index_col, skiprows=6, rename=None, time_series=True):
+        self.suffix = suffix
+        self.index_col = index_col
+        self.skiprows = skiprows
+        self.rename = rename if rename is not None else {}
+        self.time_series = time_series
+
+
+class JmagTable:
+    """Float table of a JMAG CSV export
+
+    Attributes:
+        index_name: name of the index column
+        index: numpy array of index values, e.g. time steps
+        columns: tuple of column names
+        values: numpy array of shape (len(index), len(columns))
+    """
+
+    def __init__(self, index_name, index, columns, values):
+        self.index_name = index_name
+        self.index = index
+        self.columns = tuple(columns)
+        self.values = values
+
+    def __getitem__(self, column):
+        return self.values[:, self.columns.index(column)]
+
+    def __len__(self):
+        return len(self.index)
+
+    def tail(self, n):
+        """Returns a table holding the last n rows"""
+        n = min(n, len(self))
+        return JmagTable(self.index_name, self.index[-n:], self.columns, self.values[-n:])
+
+    def to_frame(self):
+        """Returns the table as a DataFrame indexed by the index column"""
+        return pd.DataFrame(
+            self.values,
+            index=pd.Index(self.index, name=self.index_name),
+            columns=list(self.columns),
+        )
+
+
+def read_jmag_csv(
+    path, skiprows=6, index_col=None, rename=None, tail=None, cache=True, usecols=None
+):
+    """Reads a JMAG CSV export into float arrays
+
+    Args:
+        path: path of the CSV file
+        skiprows: number of metadata lines before the header row
+        index_col: name of the index column after renaming, the first column if not defined and
+            row numbers if False
+        rename: dict mapping header names of the file to column names
+        tail: number of last rows to keep, all rows if not defined
+        cache: if True, parsed arrays are stored in and loaded from path + ".npz". The cache is
+            reused as long as the size and modification time of the CSV file are unchanged.
+        usecols: list of header names of the file to parse, all columns if not defined
+    Returns:
+        table: object of type JmagTable
+    """
+    stat = os.stat(path)
+    stamp = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    cache_path = path + ".npz"
+    usecols = None if usecols is None else list(usecols)
+
+    table = None
+    if cache and os.path.exists(cache_path):
+        with np.load(cache_path, allow_pickle=False) as cached:
+            header = [str(name) for name in cached["header"]]
+            if (
+                np.array_equal(cached["stamp"], stamp)
+                and cached["skiprows"] == skiprows
+                and (bool(cached["complete"]) if usecols is None else set(usecols) <= set(header))
+            ):
+                data = cached["data"]
+                if usecols is not None:
+                    data = data[:, [header.index(name) for name in usecols]]
+                    header = usecols
+                table = _to_table(header, data, index_col, rename)
+    if table is None:
+        # a cached table has to hold all rows, otherwise only the requested ones are parsed
+        header, data = _parse(path, skiprows, None if cache else tail, usecols)
+        if cache:
+            np.savez(
+                cache_path,
+                stamp=stamp,
+                skiprows=skiprows,
+                complete=usecols is None,
+                header=np.array(header),
+                data=data,
+            )
+        table = _to_table(header, data, index_col, rename)
+
+    if tail is not None:
+        table = table.tail(tail)
+    return table
+
+
+def load_jmag_results(path, study_name, schema, tail=None, cache=True):
+    """Loads all JMAG CSV exports of a study as DataFrames
+
+    Args:
+        path: folder holding the CSV files
+        study_name: name of the JMAG study, CSV files are named study_name + suffix
+        schema: dict mapping result names to objects of type JmagCSVSchema
+        tail: number of last time steps to keep of time series results, all if not defined
+        cache: if True, parsed arrays are cached next to the CSV files
+    Returns:
+        results: dict mapping result names to DataFrames indexed by their index column
+    """
+    results = {}
+    for name, csv in schema.items():
+        table = read_jmag_csv(
+            path + study_name + csv.suffix,
+            skiprows=csv.skiprows,
+            index_col=csv.index_col,
+            rename=csv.rename,
+            tail=tail if csv.time_series else None,
+            cache=cache,
+        )
+        results[name] = table.to_frame()
+    return results
+
+
+def _parse(path, skiprows, tail, usecols):
+    with open(path, "rb") as f:
+        lines = f.read().splitlines()
+    names = list(pd.read_csv(io.BytesIO(lines[skiprows]), nrows=0).columns)
+    header = names if usecols is None else usecols
+    rows = [line for line in lines[skiprows + 1 :] if line.strip()]
+    if tail is not None:
+        rows = rows[-tail:] if tail > 0 else []
+    if not rows:
+        return header, np.empty((0, len(header)))
+    frame = pd.read_csv(
+        io.BytesIO(b"\n".join(rows)),
+        header=None,
+        names=names,
+        usecols=usecols,
+        dtype={name: np.float64 for name in header},
+        engine="c",
+        float_precision="round_trip",
+    )
+    return header, frame[header].to_numpy()
+
+
+def _to_table(header, data, index_col, rename):
+    rename = rename if rename is not None else {}
+    names = [rename.get(name, name) for name in header]
+    if index_col is False:
+        return JmagTable(None, np.arange(len(data)), names, data)
+    i = 0 if index_col is None else names.index(index_col)
+    columns = names[:i] + names[i + 1 :]
+    values = np.delete(data, i, axis=1)
+    return JmagTable(names[i], data[:, i], columns, values)
+
+
+_VOLTAGE_RENAME = {"Time, s": "Time(s)"}
+_VOLTAGE_RENAME.update(
+    {
+        "Terminal_%s%s [Case 1]" % (phase, group): "Terminal_%s%s" % (phase, group)
+        for phase in "UVW"
+        for group in "st"
+    }
+)
+
+BSPM_JMAG_SCHEMA = {
+    "current": JmagCSVSchema("_circuit_current.csv", "Time(s)"),
+    "voltage": JmagCSVSchema(
+        "_EXPORT_CIRCUIT_VOLTAGE.csv", "Time(s)", skiprows=0, rename=_VOLTAGE_RENAME
+    ),
+    "torque": JmagCSVSchema("_torque.csv", "Time(s)"),
+    "force": JmagCSVSchema("_force.csv", "Time(s)"),
+    "iron_loss": JmagCSVSchema("_iron_loss_loss.csv", "Frequency(Hz)", time_series=False),
+    "hysteresis_loss": JmagCSVSchema(
+        "_hysteresis_loss_loss.csv", "Frequency(Hz)", time_series=False
+    ),
+    "eddy_current_loss": JmagCSVSchema("_joule_loss.csv", "Time(s)"),
+}
+
+SYNR_JMAG_SCHEMA = {
+    "current": JmagCSVSchema("_circuit_current.csv", "Time(s)"),
+    "torque": JmagCSVSchema("_torque.csv", "Time(s)"),
+    "force": JmagCSVSchema("_force.csv", "Time(s)"),
+    "iron_loss": JmagCSVSchema("_iron_loss_loss.csv", "Frequency(Hz)", time_series=False),
+    "hysteresis_loss": JmagCSVSchema(
+        "_hysteresis_loss_loss.csv", "Frequency(Hz)", time_series=False
+    ),
+    "eddy_current_loss": JmagCSVSchema(
+        "_joule_loss_loss.csv", "Frequency(Hz)", time_series=False
+    ),
+    "ohmic_loss": JmagCSVSchema("_joule_loss.csv", "Time(s)"),
+    "coil_flux_linkages": JmagCSVSchema("_inductance_of_fem_coil.csv", "Time(s)"),
+}
@@ -1,5 +1,7 @@
 import numpy as np
 
+from mach_eval.analyzers.electro_thermal import copper_conductivity
+
 
 class StatorWindingResistanceProblem:
     """Problem class for calculating stator phase winding resistance
@@ -94,4 +96,152 @@ class StatorWindingResistanceAnalyzer:
             'R_wdg': R_wdg,
         }
 
-        return results
\ No newline at end of file
+        return results
+
+class StatorWindingResistanceArrayProblem(StatorWindingResistanceProblem):
+    """Problem class for calculating stator phase winding resistance over arrays of operating points
+
+    All attributes of StatorWindingResistanceProblem may be arrays. In addition to them:
+
+    Attributes:
+        T_cond: conductor temperature [deg C]
+        freq: electrical frequency of the phase current [Hz]
+        T_ref: temperature at which sigma_cond is specified [deg C]
+        alpha_cond: temperature coefficient of resistivity [1/K]
+        n_cond_layers: number of conductor layers stacked along the slot depth, one turn per
+            layer of each winding layer if not defined
+        mu_cond: permeability of the conductor [H/m]
+    """
+
+    def __init__(
+        self,
+        r_si,
+        d_sp,
+        d_st,
+        w_st,
+        l_st,
+        Q,
+        y,
+        z_Q,
+        z_C,
+        Kcu,
+        Kov,
+        sigma_cond,
+        slot_area,
+        n_layers,
+        T_cond=20,
+        freq=0,
+        T_ref=20,
+        alpha_cond=3.93e-3,
+        n_cond_layers=None,
+        mu_cond=4 * np.pi * 1e-7,
+    ):
+        super().__init__(
+            r_si, d_sp, d_st, w_st, l_st, Q, y, z_Q, z_C, Kcu, Kov, sigma_cond, slot_area, n_layers
+        )
+        self.T_cond = T_cond
+        self.freq = freq
+        self.T_ref = T_ref
+        self.alpha_cond = alpha_cond
+        if n_cond_layers is None:
+            n_cond_layers = np.asarray(z_Q) * n_layers
+        self.n_cond_layers = n_cond_layers
+        self.mu_cond = mu_cond
+
+
+class StatorWindingResistanceArrayAnalyzer:
+    def analyze(self, problem: StatorWindingResistanceArrayProblem):
+        """Calculates DC and AC stator phase winding resistances over broadcast arrays
+
+        Geometry, temperatures and frequencies are broadcast against each other, e.g.
+        ``T_cond[:, None]`` and ``freq[None, :]`` give a temperature by frequency map. The
+        conductivity is corrected for the conductor temperature. Skin and proximity effects
+        of the conductors inside the slot are included with Dowell's AC resistance factor,
+        treating each conductor as a square bar of the conductor area and each conductor layer
+        as a foil spread over the mean slot width. End windings carry DC resistance.
+
+        Args:
+            problem: object of type StatorWindingResistanceArrayProblem
+        Returns results dictionary with the following parameters:
+            l_coil: length of a single loop of a coil [m]
+            l_ew: length of an end winding (one side) [m]
+            R_coil: DC resistance of a coil [Ohms]
+            R_ew: DC resistance of an end winding [Ohms]
+            R_wdg: DC resistance of a phase winding [Ohms]
+            sigma_cond: conductor conductivity at T_cond [Siemens/m]
+            k_ac: AC resistance factor of the conductors in the slot
+            R_wdg_ac: AC resistance of a phase winding [Ohms]
+        """
+        r_si = np.asarray(problem.r_si)
+        d_sp = np.asarray(problem.d_sp)
+        d_st = np.asarray(problem.d_st)
+        w_st = np.asarray(problem.w_st)
+        l_st = np.asarray(problem.l_st)
+        Q = np.asarray(problem.Q)
+        y = np.asarray(problem.y)
+        z_Q = np.asarray(problem.z_Q)
+        z_C = np.asarray(problem.z_C)
+        Kcu = np.asarray(problem.Kcu)
+        Kov = np.asarray(problem.Kov)
+        slot_area = np.asarray(problem.slot_area)
+        n_layers = np.asarray(problem.n_layers)
+        freq = np.asarray(problem.freq, dtype=float)
+        m = np.asarray(problem.n_cond_layers, dtype=float)
+        sigma_cond = copper_conductivity(
+            problem.sigma_cond, problem.T_cond, problem.T_ref, problem.alpha_cond
+        )
+
+        # same coil geometry as StatorWindingResistanceAnalyzer
+        tau_u = 2 * np.pi / Q * (r_si + d_sp + d_st / 2)
+        l_1 = tau_u * Kov * (y - 1)
+        l_2 = 1 / 4 * np.pi * (tau_u + w_st) / 2
+        l_ew = l_1 + 2 * l_2
+        l_coil = 2 * (l_st + l_ew)
+        cond_area = slot_area / n_layers * Kcu / z_Q
+
+        R_coil = (l_coil * z_Q) / (sigma_cond * cond_area)
+        R_ew = (l_ew * z_Q) / (sigma_cond * cond_area)
+        R_wdg = R_coil * z_C
+
+        # Dowell: conductor height h, porosity of the conductor layers across the slot width
+        h = np.sqrt(cond_area)
+        cond_per_layer = z_Q * n_layers / m
+        porosity = cond_per_layer * h / (slot_area / d_st)
+        skin_depth_inv = np.sqrt(np.pi * freq * problem.mu_cond * sigma_cond)
+        k_ac = dowell_factor(h * skin_depth_inv * np.sqrt(porosity), m)
+
+        # only the coil sides in the slots, 2 * l_st of each loop, see the AC field of the slot
+        R_wdg_ac = R_wdg * (2 * l_st * k_ac + 2 * l_ew) / l_coil
+
+        results = {
+            'l_coil': l_coil,
+            'l_ew': l_ew,
+            'R_coil': R_coil,
+            'R_ew': R_ew,
+            'R_wdg': R_wdg,
+            'sigma_cond': sigma_cond,
+            'k_ac': k_ac,
+            'R_wdg_ac': R_wdg_ac,
+        }
+
+        return results
+
+
+def dowell_factor(xi, m):
+    """Dowell's AC resistance factor of m conductor layers in a slot
+
+    Args:
+        xi: conductor height normalized to the skin depth, corrected for porosity
+        m: number of conductor layers
+    Returns:
+        k_ac: ratio of AC to DC resistance, averaged over all layers
+    """
+    xi, m = np.broadcast_arrays(np.asarray(xi, dtype=float), np.asarray(m, dtype=float))
+    # the closed form cancels for small xi, where its series expansion is used instead
+    small = xi < 0.1
+    x = np.where(small, 1.0, xi)
+    skin = x * (np.sinh(2 * x) + np.sin(2 * x)) / (np.cosh(2 * x) - np.cos(2 * x))
+    proximity = 2 * x * (m**2 - 1) / 3 * (np.sinh(x) - np.sin(x)) / (np.cosh(x) + np.cos(x))
+    series = 1 + (5 * m**2 - 1) / 45 * xi**4
+    k_ac = np.where(small, series, skin + proximity)
+    return k_ac[()] if k_ac.ndim == 0 else k_ac
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 
 class WindingFactorsProblem:
     """Problem class for winding factor analyzer
@@ -61,22 +62,87 @@ class WindingFactorsAnalyzer:
             k_w: winding factor array for each winding layout
         """        
         
-        if len(winding_layout[:,0]) == 1:
-            layer = winding_layout[0][:,None]
-            alpha_c = 2*np.pi/len(layer)
-            coil_sides = np.count_nonzero(layer)
-            slot = np.arange(1,len(layer)+1)[:,None]
-            k_w = layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))
-        elif len(winding_layout[:,0]) == 2:
-            top_layer = winding_layout[0][:,None]
-            bottom_layer = winding_layout[1][:,None]
-            alpha_c = 2*np.pi/len(top_layer)
-            coil_sides = np.count_nonzero(top_layer) + np.count_nonzero(bottom_layer)
-            slot = np.arange(1,len(top_layer)+1)[:,None]
-            k_w = top_layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))+bottom_layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))
-        else:
-            raise Exception("Error: Winding layer must be 1 or 2!")
+        winding_layout = np.asarray(winding_layout)
+        if winding_layout.ndim != 2 or len(winding_layout) == 0:
+            raise Exception("Error: Winding layout must be an array of at least one layer!")
+        k_w = winding_factors(harmonics_list, winding_layout[None], alpha_1)[0]
+        
+        return k_w
+
+
+class WindingFactorsBatchProblem:
+    """Problem class for batched winding factor analyzer
+    Attributes:
+        harmonics_list: array of harmonics to be included in calculations, shape (H,) []
+        winding_layouts: stack of winding layouts of shape (L, layers, Q), each layout 
+                         follows the convention of WindingFactorsProblem.winding_layout
+        alpha_1: angle of first slot counterclockwise from +x axis, scalar or shape 
+                 (L,) [rad]
+    """
+    
+    def __init__(self, harmonics_list, winding_layouts, alpha_1):
+        
+        self.harmonics_list = harmonics_list
+        self.winding_layouts = winding_layouts
+        self.alpha_1 = alpha_1
+
+
+class WindingFactorsBatchAnalyzer:
+    """Analyzer class to evaluate winding factors of many layouts at once"""
+    
+    def analyze(self, problem="WindingFactorsBatchProblem"):
+        """Determines winding factors of all layouts
+        
+        Args:
+            Problem class contains all args used in analyze function
             
-        k_w = sum(k_w)/coil_sides
+        Returns:
+            k_w: complex winding factor array of shape (L, H)
+        """
+        
+        return winding_factors(
+            problem.harmonics_list, problem.winding_layouts, problem.alpha_1
+        )
+
+
+def winding_factors(harmonics_list, winding_layouts, alpha_1):
+    """Determines winding factors of a stack of winding layouts
+    
+    Args:
+        harmonics_list: array of harmonics, shape (H,)
+        winding_layouts: stack of winding layouts, shape (L, layers, Q)
+        alpha_1: angle of first slot, scalar or shape (L,) [rad]
+        
+    Returns:
+        k_w: complex winding factor array of shape (L, H)
+    """
+    harmonics_list = np.asarray(harmonics_list)
+    winding_layouts = np.asarray(winding_layouts)
+    Q = winding_layouts.shape[-1]
+    table = slot_phasor_table(Q, tuple(harmonics_list.ravel().tolist()))
+    
+    # all layers and slots summed in one contraction against the shared table
+    k_w = np.einsum("lmq,qh->lh", winding_layouts, table, optimize=True)
+    coil_sides = np.count_nonzero(winding_layouts, axis=(1, 2))
+    shift = np.exp(-1j*np.multiply.outer(np.atleast_1d(alpha_1), harmonics_list.ravel()))
+    k_w = k_w*shift/coil_sides[:,None]
+    
+    return k_w.reshape((len(winding_layouts),) + harmonics_list.shape)
+
+
+@lru_cache(maxsize=128)
+def slot_phasor_table(Q, harmonics):
+    """Phasors of each slot for each harmonic relative to the first slot
+    
+    Args:
+        Q: number of slots
+        harmonics: tuple of harmonics
         
-        return k_w
\ No newline at end of file
+    Returns:
+        table: read-only complex array of shape (Q, H)
+    """
+    alpha_c = 2*np.pi/Q
+    slot = np.arange(Q)[:,None]
+    table = np.exp(-1j*np.array(harmonics)*slot*alpha_c)
+    table.flags.writeable = False
+    return table
@@ -4,7 +4,9 @@ class ProcessForceDataProblem:
     """Problem class for x, y force data processing
     Attributes:
         Fx: numpy array of x axis forces against time or position
-        Fx: numpy array of y axis forces against time or position
+        Fy: numpy array of y axis forces against time or position
+
+    Several waveforms can be stacked along the leading axes.
     """
 
     def __init__(self, Fx, Fy):
@@ -24,21 +26,21 @@ class ProcessForceDataAnalyzer:
             Em: pu variation in force magnitude
             Ea: Angular variation in force orientation
         """
-        Fx = problem.Fx
-        Fy = problem.Fy
+        Fx = np.asarray(problem.Fx, dtype=float)
+        Fy = np.asarray(problem.Fy, dtype=float)
 
         # Arrays of force magnitude and angle
-        F_abs = np.sqrt(np.array(Fx) ** 2 + np.array(Fy) ** 2)
+        F_abs = np.sqrt(Fx ** 2 + Fy ** 2)
         F_ang = np.arctan2(Fy, Fx) / np.pi * 180 # [deg]
     
         # Average force and angle
-        Fx_avg = sum(Fx) / len(Fx)
-        Fy_avg = sum(Fy) / len(Fy)
+        Fx_avg = np.mean(Fx, axis=-1)
+        Fy_avg = np.mean(Fy, axis=-1)
         F_abs_avg = np.sqrt(Fx_avg ** 2 + Fy_avg ** 2) # sum(F_abs) / len(F_abs)
         F_ang_avg = np.arctan2(Fy_avg, Fx_avg) / np.pi * 180 # [deg]
 
         # Error magnitude and angle
-        Em = max(abs((F_abs - F_abs_avg) / F_abs_avg))
-        Ea = max(abs(F_ang - F_ang_avg)) # [deg]
+        Em = np.max(np.abs((F_abs - F_abs_avg[..., np.newaxis]) / F_abs_avg[..., np.newaxis]), axis=-1)
+        Ea = np.max(np.abs(F_ang - F_ang_avg[..., np.newaxis]), axis=-1) # [deg]
 
         return Fx_avg, Fy_avg, F_abs_avg, Em, Ea
@@ -1,5 +1,8 @@
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 from functools import cached_property
+from typing import List, Sequence
 
 class RotorCritcalSpeedProblem:
     """Problem class for RotorCritcalSpeedProblem"""
@@ -92,6 +95,369 @@ class RotorCritcalSpeedResult:
         self.omega_n = omega_n
 
 
+class RotorSection:
+    """Axial section of a stepped rotor"""
+
+    def __init__(
+            self,
+            length:float,
+            layers:Sequence,
+            ) -> 'RotorSection':
+        """Creates RotorSection object from input
+
+        Args:
+            length (float): axial length of the section, in unit [m]
+            layers (Sequence): concentric layers of the section, each given as
+                ``[r_in, r_out, material]`` with radii in unit [m]
+
+        Notes:
+
+        * each layer `material` dictionary must contain the same key-value pairs as the
+          `material` dictionary of RotorCritcalSpeedProblem. Layers which only add mass to the
+          section, such as laminations or magnets, can be given a `youngs_modulus` of 0.
+
+        Returns:
+            RotorSection: RotorSection
+        """
+        self.length = length
+        self.layers = [list(layer) for layer in layers]
+
+    @cached_property
+    def EI(self):
+        """Bending stiffness of section [N m^2]"""
+        return sum(
+            mat['youngs_modulus']*(1/4)*np.pi*(r_o**4 - r_i**4)
+            for r_i, r_o, mat in self.layers)
+
+    @cached_property
+    def m(self):
+        """Mass per unit length of section [kg/m]"""
+        return sum(
+            mat['density']*np.pi*(r_o**2 - r_i**2)
+            for r_i, r_o, mat in self.layers)
+
+
+class RotorCriticalSpeedFEProblem:
+    """Problem class for RotorCriticalSpeedFEAnalyzer"""
+
+    def __init__(
+            self,
+            sections:List[RotorSection],
+            bearings:Sequence=(),
+            n_modes:int=3,
+            max_elem_length:float=None,
+            ) -> 'RotorCriticalSpeedFEProblem':
+        """Creates RotorCriticalSpeedFEProblem object from input
+
+        Args:
+            sections (List[RotorSection]): axial sections of the rotor, ordered along the axis
+            bearings (Sequence): radial supports given as ``[z, k]`` with axial position `z` in
+                unit [m] and stiffness `k` in unit [N/m]. Use ``np.inf`` for a rigid support.
+                No bearings corresponds to the free-free boundary condition.
+            n_modes (int): number of bending modes to compute
+            max_elem_length (float): maximum beam element length, in unit [m]. Defaults to
+                1/50 of the rotor length.
+
+        Returns:
+            RotorCriticalSpeedFEProblem: RotorCriticalSpeedFEProblem
+        """
+        self.sections = sections
+        self.bearings = [list(bearing) for bearing in bearings]
+        self.n_modes = n_modes
+        self.max_elem_length = max_elem_length
+
+    @classmethod
+    def from_spm_rotor(
+            cls,
+            r_sh:float,
+            d_ri:float,
+            d_m:float,
+            d_sl:float,
+            l_st:float,
+            L:float,
+            mat_dict:dict,
+            bearings:Sequence=(),
+            stack_stiffness:bool=False,
+            **kwargs
+            ) -> 'RotorCriticalSpeedFEProblem':
+        """Creates problem of an SPM rotor with the rotor stack centered on the shaft
+
+        Args:
+            r_sh (float): shaft radius, in unit [m]
+            d_ri (float): rotor core thickness, in unit [m]
+            d_m (float): magnet thickness, in unit [m]
+            d_sl (float): sleeve thickness, in unit [m]
+            l_st (float): stack length, in unit [m]
+            L (float): shaft length, in unit [m]
+            mat_dict (dict): material dictionary using the keys of SPM_RotorSpeedLimitProblem,
+                i.e. `shaft_material_density`, `core_material_density`,
+                `magnet_material_density`, `sleeve_material_density`, `shaft_youngs_modulus`,
+                `core_youngs_modulus`, `magnet_youngs_modulus` and `sleeve_youngs_p_direction`
+            bearings (Sequence): radial supports, see `__init__`
+            stack_stiffness (bool): include the bending stiffness of core, magnets and sleeve.
+                By default the stack only adds mass.
+            **kwargs: passed on to `__init__`
+
+        Returns:
+            RotorCriticalSpeedFEProblem: RotorCriticalSpeedFEProblem
+        """
+        def material(name, modulus_key):
+            E = mat_dict[modulus_key] if stack_stiffness or name == 'shaft' else 0
+            return {'youngs_modulus': E, 'density': mat_dict[name + '_material_density']}
+
+        r_ri = r_sh + d_ri
+        r_m = r_ri + d_m
+        shaft = [0, r_sh, material('shaft', 'shaft_youngs_modulus')]
+        l_end = (L - l_st)/2
+        stack = RotorSection(l_st, [
+            shaft,
+            [r_sh, r_ri, material('core', 'core_youngs_modulus')],
+            [r_ri, r_m, material('magnet', 'magnet_youngs_modulus')],
+            [r_m, r_m + d_sl, material('sleeve', 'sleeve_youngs_p_direction')],
+            ])
+        sections = [RotorSection(l_end, [shaft]), stack, RotorSection(l_end, [shaft])]
+        sections = [section for section in sections if section.length > 0]
+        return cls(sections, bearings, **kwargs)
+
+    @cached_property
+    def L(self):
+        """Total rotor length [m]"""
+        return sum(section.length for section in self.sections)
+
+    @cached_property
+    def z(self):
+        """Axial node positions [m]
+
+        Nodes are placed at every section boundary and bearing, intervals between them are
+        divided evenly into elements no longer than `max_elem_length`.
+        """
+        bounds = np.concatenate(
+            ([0], np.cumsum([section.length for section in self.sections])))
+        bearing_z = np.array([z for z, _ in self.bearings], dtype=float)
+        if np.any((bearing_z < 0) | (bearing_z > self.L)):
+            raise ValueError("Bearing positions must lie on the rotor")
+        breaks = np.unique(np.concatenate((bounds, bearing_z)))
+        h_max = self.max_elem_length or self.L/50
+        n_div = np.maximum(np.ceil(np.diff(breaks)/h_max).astype(int), 1)
+        nodes = [np.linspace(a, b, n, endpoint=False)
+                 for a, b, n in zip(breaks[:-1], breaks[1:], n_div)]
+        return np.concatenate(nodes + [breaks[-1:]])
+
+    @cached_property
+    def n_rigid_modes(self):
+        """Number of rigid body modes left by the bearings
+
+        A free-free rotor has two rigid body modes, translation and tilt. Each bearing at a
+        distinct node removes one of them.
+        """
+        nodes = {int(np.argmin(np.abs(self.z - z_b))) for z_b, k_b in self.bearings if k_b > 0}
+        return max(2 - len(nodes), 0)
+
+    @cached_property
+    def element_properties(self):
+        """Length, bending stiffness and mass per length of each element"""
+        z = self.z
+        h = np.diff(z)
+        ends = np.cumsum([section.length for section in self.sections])
+        idx = np.searchsorted(ends, (z[:-1] + z[1:])/2)
+        idx = np.minimum(idx, len(self.sections) - 1)
+        EI = np.array([section.EI for section in self.sections])[idx]
+        m = np.array([section.m for section in self.sections])[idx]
+        return h, EI, m
+
+
+class RotorCriticalSpeedFEAnalyzer:
+    """Analyzer class for RotorCriticalSpeedFEProblem
+
+    The rotor is modeled with Euler-Bernoulli beam finite elements with two degrees of freedom
+    (deflection and slope) per node, consistent mass matrices and bearings as radial springs.
+    """
+
+    def __init__(
+            self,
+            problem:RotorCriticalSpeedFEProblem
+            ) -> 'RotorCriticalSpeedFEAnalyzer':
+        """Creates RotorCriticalSpeedFEAnalyzer object from input
+
+        Args:
+            problem (RotorCriticalSpeedFEProblem): Problem class
+
+        Returns:
+            RotorCriticalSpeedFEAnalyzer: RotorCriticalSpeedFEAnalyzer
+        """
+        self.problem = problem
+
+    def solve(self):
+        """Solve sparse generalized eigenvalue problem for the first `n_modes` bending modes
+
+        Returns:
+            result (RotorCriticalSpeedFEResult): RotorCriticalSpeedFEResult
+        """
+        K, M, free = self.system_matrices(self.problem)
+        n_modes = self.problem.n_modes
+        n_rigid = self.problem.n_rigid_modes
+        n_dof = K.shape[0]
+        # rigid body modes are computed and discarded
+        k = n_modes + n_rigid
+        if k >= n_dof - 1:
+            lam, vec = _dense_eigh(K.toarray(), M.toarray())
+        else:
+            # shift-invert about a small negative shift, K may be singular
+            sigma = -1e-6*_eigenvalue_scale(self.problem)
+            lam, vec = spla.eigsh(K, k, M, sigma=sigma, which='LM')
+            order = np.argsort(lam)
+            lam, vec = lam[order], vec[:, order]
+        lam, vec = lam[n_rigid:n_rigid + n_modes], vec[:, n_rigid:n_rigid + n_modes]
+
+        shapes = np.zeros((2*len(self.problem.z), lam.size))
+        shapes[free] = vec
+        shapes = shapes[0::2]
+        shapes /= np.abs(shapes).max(axis=0, initial=0) + (lam.size == 0)
+        return RotorCriticalSpeedFEResult(np.sqrt(lam), self.problem.z, shapes)
+
+    @staticmethod
+    def solve_batch(
+            problems:List[RotorCriticalSpeedFEProblem],
+            chunk_size:int=256,
+            ) -> np.ndarray:
+        """Critical speeds of many rotor designs
+
+        Designs with the same number of degrees of freedom are stacked and solved with batched
+        dense eigenvalue decompositions.
+
+        Args:
+            problems (List[RotorCriticalSpeedFEProblem]): rotor designs
+            chunk_size (int): maximum number of designs per stacked solve
+
+        Returns:
+            omega_n (np.array): (n_designs, max n_modes) critical speeds [rad/s], padded with NaN
+        """
+        n_modes = max(problem.n_modes for problem in problems)
+        omega_n = np.full((len(problems), n_modes), np.nan)
+        systems = [RotorCriticalSpeedFEAnalyzer.system_matrices(problem)
+                   for problem in problems]
+
+        sizes = np.array([K.shape[0] for K, _, _ in systems])
+        for size in np.unique(sizes):
+            members = np.flatnonzero(sizes == size)
+            for start in range(0, len(members), chunk_size):
+                batch = members[start:start + chunk_size]
+                K = np.stack([systems[i][0].toarray() for i in batch])
+                M = np.stack([systems[i][1].toarray() for i in batch])
+                lam = _dense_eigvalsh(K, M)
+                for i, lam_i in zip(batch, lam):
+                    n_rigid = problems[i].n_rigid_modes
+                    lam_i = lam_i[n_rigid:n_rigid + problems[i].n_modes]
+                    omega_n[i, :lam_i.size] = np.sqrt(lam_i)
+        return omega_n
+
+    @staticmethod
+    def system_matrices(problem:RotorCriticalSpeedFEProblem):
+        """Assemble global stiffness and mass matrices
+
+        Args:
+            problem (RotorCriticalSpeedFEProblem): Problem class
+
+        Returns:
+            K (scipy.sparse.csc_matrix): stiffness matrix of the unconstrained degrees of freedom
+            M (scipy.sparse.csc_matrix): mass matrix of the unconstrained degrees of freedom
+            free (np.array): indices of the unconstrained degrees of freedom
+        """
+        h, EI, m = problem.element_properties
+        n_dof = 2*len(problem.z)
+        Ke, Me = _beam_element_matrices(h, EI, m)
+
+        dofs = 2*np.arange(h.size)[:, None] + np.arange(4)
+        rows = np.broadcast_to(dofs[:, :, None], Ke.shape).ravel()
+        cols = np.broadcast_to(dofs[:, None, :], Ke.shape).ravel()
+
+        rigid = []
+        for z_b, k_b in problem.bearings:
+            dof = 2*int(np.argmin(np.abs(problem.z - z_b)))
+            if np.isinf(k_b):
+                rigid.append(dof)
+            else:
+                rows = np.append(rows, dof)
+                cols = np.append(cols, dof)
+                Ke = np.append(Ke, k_b)
+        K = sp.coo_matrix((Ke.ravel(), (rows, cols)), shape=(n_dof, n_dof)).tocsc()
+        M = sp.coo_matrix(
+            (Me.ravel(), (rows[:Me.size], cols[:Me.size])), shape=(n_dof, n_dof)).tocsc()
+
+        free = np.setdiff1d(np.arange(n_dof), rigid)
+        return K[free][:, free], M[free][:, free], free
+
+
+class RotorCriticalSpeedFEResult:
+    """Result class for RotorCriticalSpeedFEAnalyzer"""
+    def __init__(
+            self,
+            omega_n,
+            z,
+            mode_shapes,
+            ) -> 'RotorCriticalSpeedFEResult':
+        """Result class for RotorCriticalSpeedFEAnalyzer
+
+        Attr:
+            omega_n (np.array): critical speeds of the bending modes in ascending order [rad/s]
+            z (np.array): axial node positions [m]
+            mode_shapes (np.array): (n_nodes, n_modes) deflection of each mode, normalized to
+                a maximum magnitude of 1
+
+        Returns:
+            result (RotorCriticalSpeedFEResult): RotorCriticalSpeedFEResult
+        """
+        self.omega_n = omega_n
+        self.z = z
+        self.mode_shapes = mode_shapes
+
+
+def _beam_element_matrices(h, EI, m):
+    """Stiffness and consistent mass matrices of Euler-Bernoulli beam elements
+
+    Args:
+        h (np.array): (n_elem,) element lengths
+        EI (np.array): (n_elem,) bending stiffness
+        m (np.array): (n_elem,) mass per unit length
+
+    Returns:
+        Ke (np.array): (n_elem, 4, 4) element stiffness matrices
+        Me (np.array): (n_elem, 4, 4) element mass matrices
+    """
+    h = h[:, None, None]
+    # entries are polynomials in the element length, split into the powers h^0, h^1 and h^2
+    K0 = np.array([[12, 0, -12, 0], [0, 0, 0, 0], [-12, 0, 12, 0], [0, 0, 0, 0]])
+    K1 = np.array([[0, 6, 0, 6], [6, 0, -6, 0], [0, -6, 0, -6], [6, 0, -6, 0]])
+    K2 = np.array([[0, 0, 0, 0], [0, 4, 0, 2], [0, 0, 0, 0], [0, 2, 0, 4]])
+    M0 = np.array([[156, 0, 54, 0], [0, 0, 0, 0], [54, 0, 156, 0], [0, 0, 0, 0]])
+    M1 = np.array([[0, 22, 0, -13], [22, 0, 13, 0], [0, 13, 0, -22], [-13, 0, -22, 0]])
+    M2 = np.array([[0, 0, 0, 0], [0, 4, 0, -3], [0, 0, 0, 0], [0, -3, 0, 4]])
+    Ke = EI[:, None, None]/h**3*(K0 + K1*h + K2*h**2)
+    Me = m[:, None, None]*h/420*(M0 + M1*h + M2*h**2)
+    return Ke, Me
+
+
+def _dense_eigh(K, M):
+    """Dense generalized eigen-decomposition, eigenvalues in ascending order"""
+    L = np.linalg.cholesky(M)
+    A = np.linalg.solve(L, np.linalg.solve(L, K).swapaxes(-1, -2))
+    lam, vec = np.linalg.eigh(A)
+    return lam, np.linalg.solve(L.swapaxes(-1, -2), vec)
+
+
+def _dense_eigvalsh(K, M):
+    """Batched dense generalized eigenvalues of (..., n, n) stacks, in ascending order"""
+    L = np.linalg.cholesky(M)
+    A = np.linalg.solve(L, np.linalg.solve(L, K).swapaxes(-1, -2))
+    return np.linalg.eigvalsh(A)
+
+
+def _eigenvalue_scale(problem):
+    """Order of magnitude of the largest eigenvalues of the shaft without bearings"""
+    Ke, Me = _beam_element_matrices(*problem.element_properties)
+    return np.trace(Ke, axis1=1, axis2=2).sum()/np.trace(Me, axis1=1, axis2=2).sum()
+
+
 if __name__ == "__main__":
     mat_dict = {
         'youngs_modulus':206E9, #Pa
@@ -100,4 +466,9 @@ if __name__ == "__main__":
     problem = RotorCritcalSpeedProblem(9E-3,164E-3,4.7,mat_dict)
     analyzer = RotorCritcalSpeedAnalyzer(problem)
     result = analyzer.solve()
+    print(result.omega_n)
+
+    section = RotorSection(164E-3, [[0, 9E-3, mat_dict]])
+    problem = RotorCriticalSpeedFEProblem([section], n_modes=3)
+    result = RotorCriticalSpeedFEAnalyzer(problem).solve()
     print(result.omega_n)
\ No newline at end of file
@@ -4,6 +4,11 @@ import os
 sys.path.append(os.path.dirname(__file__))
 
 from rotor_structural import SPM_RotorStructuralProblem, SPM_RotorStructuralAnalyzer
+from stress_criteria import (
+    StressCriteriaProblem,
+    StressCriteriaAnalyzer,
+    concatenate_ragged,
+)
 
 class SPM_RotorSpeedLimitProblem:
     def __init__(
@@ -125,16 +130,20 @@ class SPM_RotorSpeedLimitAnalyzer:
             r_vect_sl,
             r_vect_ah], dtype=object)
 
+        # Concatenate radius vectors with offsets for vectorized evaluation
+        (self.r_concat, self.r_offsets) = concatenate_ragged(self.r_vect)
+
         # Create speed array
         N = np.arange(0,self.N_max,self.N_step) 
 
-        for speed in N:            
-            # Check if failure is found and determine failure material
-            (fail, failure_mat) = self.check_if_fail(speed)      
-
-            # If failure is found, break for loop
-            if fail:
-                break
+        # Check all speeds at once to determine failure speed and material
+        (fail, failure_mat) = self.check_if_fail_speeds(N)
+        
+        if fail.any():
+            speed = N[np.argmax(fail)]
+            failure_mat = failure_mat[np.argmax(fail)]
+        else:
+            failure_mat = None
 
         if failure_mat is None:
             # if no failure is found, return "None" for both 
@@ -155,6 +164,19 @@ class SPM_RotorSpeedLimitAnalyzer:
             results (tuple): Tuple(True, failure_mat) 
             results (tuple): Tuple(False, None)
         """
+        (fail, failure_mat) = self.check_if_fail_speeds(np.array([speed]))
+        return (bool(fail[0]), failure_mat[0])
+
+    def check_if_fail_speeds(self, speeds):
+        """ Check if rotor material failure occured for an array of rotational speeds
+
+        Args:
+            speeds (np.array): rotational speeds of rotor [RPM]
+
+        Returns:
+            results (tuple): Tuple(fail, failure_mat), boolean array of failure at each
+            speed and the first failed material at each speed (None if no failure)
+        """
 
         # Material Array
         # ( Must follow this specific order )
@@ -165,6 +187,46 @@ class SPM_RotorSpeedLimitAnalyzer:
             "Sleeve",
             "Adhesive"])
         
+        # Use Von Mises Stress for ductile materials and MSST Stress for brittle materials
+        ductile = np.isin(materials, ["Shaft", "Core"])
+
+        # Rotor stresses are affine in speed squared, so two structural solves
+        # provide the stresses at every speed
+        speeds = np.asarray(speeds, dtype=float)
+        N_ref = max(np.max(speeds, initial=0), 1)
+        (sigma_t_0, sigma_r_0) = self.rotor_stresses(0)
+        (sigma_t_1, sigma_r_1) = self.rotor_stresses(N_ref)
+        scale = ((speeds / N_ref) ** 2)[:, None]
+        sigma_t = sigma_t_0 + scale * (sigma_t_1 - sigma_t_0)
+        sigma_r = sigma_r_0 + scale * (sigma_r_1 - sigma_r_0)
+
+        # Determine maxmium criterion stress of all materials for all speeds
+        # (the adhesive is a single point, its maximum and minimum MSST Stress coincide)
+        sc_problem = StressCriteriaProblem(sigma_t, sigma_r, self.r_offsets)
+        sc_results = StressCriteriaAnalyzer().analyze(sc_problem)
+        sigma_max = np.where(
+            ductile, sc_results.von_mises_max, sc_results.tresca_max)
+
+        # Determine percenatge to failure for all materials
+        # (materials without radial points, i.e. no sleeve, never fail)
+        pct_to_fail = np.nan_to_num(sigma_max / self.mat_fail_cond)
+
+        # Failure when pct is @ 100%, first material in order is reported
+        pct_max = 1.0
+        failed = pct_to_fail >= pct_max
+        fail = failed.any(axis=1)
+        failure_mat = np.where(fail, materials[np.argmax(failed, axis=1)], None)
+        return (fail, failure_mat)
+
+    def rotor_stresses(self, speed):
+        """ Determine tangential and radial stress along the concatenated radius vectors
+
+        Args:
+            speed (float): rotational speed of rotor [RPM]
+
+        Returns:
+            results (tuple): Tuple(sigma_t, sigma_r) of concatenated stress arrays
+        """
         # Create rotor structral problem
         st_problem = SPM_RotorStructuralProblem(
             self.r_sh, 
@@ -176,71 +238,24 @@ class SPM_RotorSpeedLimitAnalyzer:
             speed, 
             self.mat_dict)
 
-        # Initialize analyzers
-        st_analyzer = SPM_RotorStructuralAnalyzer()
-
         # Analyze rotor structual problem
-        st_sigmas = st_analyzer.analyze(st_problem)
-
-        sigma_max = np.zeros(len(materials))
-        failure_mat = None
-
-        # Determine maxmium Von Mises Stress for all rotor materials
-        for idx,mat in enumerate(materials):
-            # Skip the adhesive since it has a special case
-            if mat == "Adhesive":
-                continue
-
-            # Skip the sleeve calculation if not present
-            if mat == "Sleeve" and self.r_vect[idx].size == 0:
+        st_sigmas = SPM_RotorStructuralAnalyzer().analyze(st_problem)
+
+        # The adhesive is assumed to be at the interface between core and magnet 
+        # with zero thickness, and uses the core stress
+        sigmas = list(st_sigmas) + [st_sigmas[1]]
+
+        sigma_t = np.zeros_like(self.r_concat)
+        sigma_r = np.zeros_like(self.r_concat)
+        for idx, sigma in enumerate(sigmas):
+            r = self.r_vect[idx]
+            # Skip materials without radial points (sleeve if not present)
+            if r.size == 0:
                 continue
-            
-            # Determine tangential and radial stress
-            sigma_t = st_sigmas[idx].tangential(self.r_vect[idx])
-            sigma_r = st_sigmas[idx].radial(self.r_vect[idx])
-            
-            # Create static stress problem 
-            ss_problem = SteadyStateStressProblem(sigma_t,sigma_r)
-
-            # Analyze static stress problem
-            ss_analyzer = SteadyStateStressAnalyzer()
-            ss_stress = ss_analyzer.analyze(ss_problem)
-
-            if mat in ["Shaft", "Core"]:
-                # Use Von Mises Stress for ductile materials
-                # [0] index provides Von Mises Stress
-                sigma_max[idx] = np.max(ss_stress[0])
-            else:
-                # Use MSST Stress for brittle material
-                # [1] index provides MSST Stress (yield)
-                sigma_max[idx] = np.max(ss_stress[1])
-
-        # Determine adhesive MSST Stress
-        # (assumed to be at the interface between core and magnet with zero thickness)
-        # (self.r_vect[4] is the radial location of the adhesive)
-        core_idx = np.where(materials == "Core")[0][0]
-
-        ss_problem = SteadyStateStressProblem(
-            st_sigmas[core_idx].tangential(self.r_vect[4]),
-            st_sigmas[core_idx].radial(self.r_vect[4]))
-        
-        ss_stress = ss_analyzer.analyze(ss_problem)
-        sigma_max[-1] = np.min(ss_stress[1])
-
-        # Determine percenatge to failure for all materials
-        pct_to_fail = sigma_max/self.mat_fail_cond
-
-        # Check maximum stress against failure condition to determine failure material
-        for idx, pct in enumerate(pct_to_fail):
-            
-            # Failure when pct is @ 100%
-            pct_max = 1.0
-            if pct >= pct_max:
-                failure_mat = materials[idx]
-                return (True,failure_mat)
-        
-        # return False and None if no failure is found
-        return (False, None)
+            seg = slice(self.r_offsets[idx], self.r_offsets[idx + 1])
+            sigma_t[seg] = sigma.tangential(r)
+            sigma_r[seg] = sigma.radial(r)
+        return (sigma_t, sigma_r)
         
 class SteadyStateStressProblem:
     def __init__(
@@ -350,7 +365,7 @@ class SteadyStateStressAnalyzer:
         sigma_normal_s = np.sort(sigma_normal)
 
         # Split arrays into three arrays
-        sigma_principle = [np.array(x) for x in zip(*sigma_normal_s)] 
+        sigma_principle = sigma_normal_s.T
 
         # Obtain Principle Stresses
         sigma_1 = sigma_principle[2]
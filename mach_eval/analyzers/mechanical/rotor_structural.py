@@ -258,6 +258,90 @@ class SPM_RotorStructuralAnalyzer:
         return A
 
 
+class MaterialConstants:
+    """Immutable record of precomputed constants of a rotor material.
+
+    Attributes:
+        rho (float): Mass Density.
+        C1 (float): Stiffness constant.
+        C2 (float): Stiffness constant.
+        C3 (float): Stiffness constant.
+        h (float): Exponent of radial solution.
+        Del (float): Stiffness constant denominator.
+        zeta_r (float): Radial thermal stress constant.
+        zeta_t (float): Tangential thermal stress constant.
+        zeta_u (float): Thermal displacement constant.
+        Beta (float): Rotational stress constant.
+    """
+
+    __slots__ = (
+        "rho",
+        "C1",
+        "C2",
+        "C3",
+        "h",
+        "Del",
+        "zeta_r",
+        "zeta_t",
+        "zeta_u",
+        "Beta",
+    )
+
+    def __init__(self, rho, C1, C2, C3, h, Del, zeta_r, zeta_t, zeta_u, Beta):
+        for name, value in zip(
+            self.__slots__, (rho, C1, C2, C3, h, Del, zeta_r, zeta_t, zeta_u, Beta)
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MaterialConstants is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("MaterialConstants is immutable")
+
+    def __reduce__(self):
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+    @classmethod
+    def from_material(cls, material):
+        """Evaluate the constants of a Material_Isotropic or Material_Transverse_Isotropic once"""
+        C1 = material.C1
+        C3 = material.C3
+        return cls(
+            material.rho,
+            C1,
+            material.C2,
+            C3,
+            material.h,
+            material.Del,
+            material.zeta_r,
+            material.zeta_t,
+            material.zeta_u,
+            -material.rho / (9 * C1 - C3),
+        )
+
+
+# Registry of material constants shared between materials with identical properties
+_material_constants_registry = {}
+
+
+def material_constants(material) -> MaterialConstants:
+    """Returns the shared MaterialConstants record for a material
+
+    Args:
+        material (Material_Isotropic or Material_Transverse_Isotropic): Material object.
+
+    Returns:
+        constants (MaterialConstants): precomputed material constants.
+    """
+    key = (type(material), material.properties)
+    constants = _material_constants_registry.get(key)
+    if constants is None:
+        constants = MaterialConstants.from_material(material)
+        _material_constants_registry[key] = constants
+    return constants
+
+
 class Material_Isotropic:
     def __init__(self, Density, ElasticMod, PoissonRatio, alpha):
         """__init__ definition for Material_Isotropic class.
@@ -274,6 +358,14 @@ class Material_Isotropic:
         self.Nu = PoissonRatio  # Poisson Ratio of material
         self.alpha = alpha
 
+    @property
+    def properties(self):
+        return (self.rho, self.E, self.Nu, self.alpha)
+
+    @property
+    def constants(self):
+        return material_constants(self)
+
     @property
     def Del(self):
         return self.E / ((1 + self.Nu) * (1 - 2 * self.Nu))
@@ -347,6 +439,22 @@ class Material_Transverse_Isotropic:
         self.alpha_r = alpha_r
         self.alpha_t = alpha_t
 
+    @property
+    def properties(self):
+        return (
+            self.rho,
+            self.E_t,
+            self.E_p,
+            self.Nu_tp,
+            self.Nu_p,
+            self.alpha_r,
+            self.alpha_t,
+        )
+
+    @property
+    def constants(self):
+        return material_constants(self)
+
     @property
     def Nu_pt(self):
         return self.Nu_tp * (self.E_p / self.E_t)
@@ -422,19 +530,18 @@ class RotorComponent:
             self.Nu = MaterialObject.Nu
             self.rho = MaterialObject.rho
             self.alpha = MaterialObject.alpha
-        self.C1 = MaterialObject.C1
-        self.C2 = MaterialObject.C2
-        self.C3 = MaterialObject.C3
-        self.h = MaterialObject.h
-        self.zeta_r = MaterialObject.zeta_r
-        self.zeta_t = MaterialObject.zeta_t
-        self.zeta_u = MaterialObject.zeta_u
-        self.material = MaterialObject
-
-    @property
-    def Beta(self):
-        return -self.rho / (9 * self.C1 - self.C3)
+        constants = MaterialObject.constants
+        self.C1 = constants.C1
+        self.C2 = constants.C2
+        self.C3 = constants.C3
+        self.h = constants.h
+        self.zeta_r = constants.zeta_r
+        self.zeta_t = constants.zeta_t
+        self.zeta_u = constants.zeta_u
+        self.Beta = constants.Beta
         # self.OMEGA=  -self.rho*(omega**2)/(9*obj.C1 -obj.C3);
+        self.constants = constants
+        self.material = MaterialObject
 
     def set_delta_sl(self, Dr):
         self.Dr = Dr
@@ -2,6 +2,8 @@ import numpy as np
 import scipy.optimize as op
 import os
 import sys
+from time import perf_counter
+from typing import List
 
 # add the directory  this file's directory to path for module import
 sys.path.append(os.path.dirname(__file__))
@@ -94,10 +96,7 @@ class SPM_RotorThermalAnalyzer:
         ################################################
         #           Load Losses into loss Vector
         ################################################
-        Q_dot = np.zeros([33, 1])
-        Q_dot[1] = 0  # No shaft losses
-        Q_dot[3] = problem.losses["rotor_iron_loss"]
-        Q_dot[5] = problem.losses["magnet_loss"]
+        Q_dot = self.create_loss_vector(problem)
 
         # print('Magnet Losses:',Q_dot[5])
         ################################################
@@ -112,6 +111,40 @@ class SPM_RotorThermalAnalyzer:
         T = self.base_ana.analyze(base_prob)
         return T
 
+    def analyze_batch(self, problems: "List[SPM_RotorThermalProblem]"):
+        """Analyzes many input problems with a single batched network solve
+
+        Args:
+            problems (List[SPM_RotorThermalProblem]): input problems, e.g. from a design sweep
+        Returns:
+            T (np.array): (len(problems), 33) temperature distribution in each rotor
+        """
+        network = self.create_network_batch(problems)
+        Q_dot = np.array([self.create_loss_vector(problem)[:, 0] for problem in problems])
+        T_ref = [
+            [0, np.array([problem.T_ref for problem in problems])],
+        ]
+        batch_prob = tb.ThermalNetworkBatchProblem(network, Q_dot, T_ref)
+        return tb.ThermalNetworkBatchAnalyzer().analyze(batch_prob)
+
+    def create_network_batch(self, problems: "List[SPM_RotorThermalProblem]"):
+        """Creates array-backed resistance networks for input problems
+
+        Args:
+            problems (List[SPM_RotorThermalProblem]): input problems
+        Returns:
+            network (tb.ThermalNetworkBatch): networks of all problems
+        """
+        Res = [self.create_resistance_network(problem) for problem in problems]
+        return tb.ThermalNetworkBatch.from_resistances(Res, 33)
+
+    def create_loss_vector(self, problem):
+        Q_dot = np.zeros([33, 1])
+        Q_dot[1] = 0  # No shaft losses
+        Q_dot[3] = problem.losses["rotor_iron_loss"]
+        Q_dot[5] = problem.losses["magnet_loss"]
+        return Q_dot
+
     def create_resistance_network(self, problem):
         ################################################
         #           Load Material Properties
@@ -543,6 +576,8 @@ class AirflowProblem:
         self.mat_dict = mat_dict
         self.therm_prob = SPM_RotorThermalProblem
         self.therm_ana = SPM_RotorThermalAnalyzer()
+        self._network = None
+        self._network_key = None
 
     def magnet_temp(self, u_z):
         """Calculate magnet temperature from airflow rate
@@ -554,8 +589,23 @@ class AirflowProblem:
             T[5] (float): Magnet Temperature
         """
 
-        prob = self.therm_prob(
-            self.mat_dict,
+        return self.magnet_temp_batch(np.ravel(u_z))
+
+    def magnet_temp_batch(self, u_z):
+        """Calculate magnet temperatures for an array of airflow rates
+
+        The resistance network is only created when the geometry, temperature, losses, speed or
+        materials of the problem have changed since the last call. Only the conductances of the
+        airflow dependent convection resistances are updated before all networks are solved at
+        once.
+
+        Args:
+            u_z (np.array): Axial airflow rates [m/s]
+
+        Returns:
+            T_pm (np.array): Magnet Temperature at each airflow rate
+        """
+        key = (
             self.r_sh,
             self.d_ri,
             self.r_ro,
@@ -564,12 +614,49 @@ class AirflowProblem:
             self.l_st,
             self.l_hub,
             self.T_ref,
-            u_z,
-            self.losses,
             self.omega,
+            tuple(sorted(self.losses.items())),
+            tuple(sorted(self.mat_dict.items())),
+        )
+        if self._network is None or key != self._network_key:
+            prob = self.therm_prob(
+                self.mat_dict,
+                self.r_sh,
+                self.d_ri,
+                self.r_ro,
+                self.d_sl,
+                self.r_si,
+                self.l_st,
+                self.l_hub,
+                self.T_ref,
+                0,
+                self.losses,
+                self.omega,
+            )
+            Res = self.therm_ana.create_resistance_network(prob)
+            self._network = tb.ThermalNetworkBatch.from_resistances([Res], 33)
+            self._airflow_res = [
+                (i, r) for i, r in enumerate(Res) if isinstance(r, tb.air_gap_conv)
+            ]
+            self._Q_dot = self.therm_ana.create_loss_vector(prob)[:, 0]
+            self._network_key = key
+
+        u_z = np.asarray(u_z, dtype=float).reshape(-1, 1)
+        g = np.column_stack(
+            [
+                tb.air_gap_conv.h_array(r.Material, r.omega, r.R_r, r.R_s, u_z)[:, 0]
+                * r.A
+                for i, r in self._airflow_res
+            ]
+        )
+        network = self._network.with_conductances(
+            [i for i, r in self._airflow_res], g
         )
-        T = self.therm_ana.analyze(prob)
-        return T[5]
+        batch_prob = tb.ThermalNetworkBatchProblem(
+            network, self._Q_dot, [[0, self.T_ref]]
+        )
+        T = tb.ThermalNetworkBatchAnalyzer().analyze(batch_prob)
+        return T[:, 5]
 
     def cost(self, u_z):
         """Returns airflow rate as cost function"""
@@ -612,6 +699,76 @@ class AirflowAnalyzer:
             return results
 
 
+class AirflowRootAnalyzer:
+    """Analyzer to calculate required airflow in SPM machine using 1-D root finding
+
+    The magnet temperature is assumed monotonic in the axial airflow within ``u_z_bounds``, but its
+    direction depends on the flow regime. With the air gap convection correlation, the temperature
+    rises with small axial airflow and only falls once the axial flow dominates the rotational flow.
+    If the temperature rises over the bounds, the lower bound is the only candidate. If it falls,
+    the smallest airflow which satisfies ``max_temp`` is bracketed and found with Brent's method.
+
+    Attributes:
+        u_z_bounds (tuple): Lower and upper bound of axial airflow [m/s]
+        xtol (float): Absolute tolerance of the required airflow [m/s]
+    """
+
+    def __init__(self, u_z_bounds=(0.00001, 1.0), xtol=1e-9):
+        self.u_z_bounds = u_z_bounds
+        self.xtol = xtol
+
+    def analyze(self, problem: AirflowProblem):
+        """Analyzes input problem to calculate required airflow to cool rotor
+
+        Args:
+            problem (AirflowProblem): input problem
+        Returns:
+            results (dict): dictionary with analyzer solution, number of root finding iterations,
+                and solve time [s]
+        """
+        t_start = perf_counter()
+        u_lo, u_hi = self.u_z_bounds
+        # cache of network solves, the reported temperature is never recomputed
+        solves = {}
+        T_lo, T_hi = problem.magnet_temp_batch(np.array([u_lo, u_hi]))
+        solves[u_lo] = T_lo
+        solves[u_hi] = T_hi
+
+        def excess_temp(u_z):
+            if u_z not in solves:
+                solves[u_z] = problem.magnet_temp_batch(np.array([u_z]))[0]
+            return solves[u_z] - problem.max_temp
+
+        iterations = 0
+        if excess_temp(u_lo) <= 0:
+            valid = True
+            u_z = u_lo
+        elif T_hi >= T_lo:
+            # temperature rises with airflow, no airflow within the bounds cools the magnets
+            valid = False
+            u_z = u_lo
+        elif excess_temp(u_hi) > 0:
+            valid = False
+            u_z = u_hi
+        else:
+            valid = True
+            _, sol = op.brentq(
+                excess_temp, u_lo, u_hi, xtol=self.xtol, full_output=True
+            )
+            iterations = sol.iterations
+            # smallest evaluated airflow which keeps the magnets below max_temp
+            u_z = min(u for u, T in solves.items() if T <= problem.max_temp)
+
+        results = {
+            "valid": valid,
+            "magnet Temp": np.array([solves[u_z]]),
+            "Required Airflow": np.array([u_z]),
+            "iterations": iterations,
+            "solve time": perf_counter() - t_start,
+        }
+        return results
+
+
 if __name__ == "__main__":
     # mat_dict=fea_config_dict
     mat_dict = {
@@ -654,3 +811,5 @@ if __name__ == "__main__":
     ana = AirflowAnalyzer()
     sleeve_dim = ana.analyze(afp)
     print(sleeve_dim)
+    ana = AirflowRootAnalyzer()
+    print(ana.analyze(afp))
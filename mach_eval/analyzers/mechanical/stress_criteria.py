@@ -0,0 +1,117 @@
+import numpy as np
+from typing import List, Tuple
+
+
+class StressCriteriaProblem:
+    """Problem class for StressCriteriaAnalyzer
+
+    Stresses of all materials are evaluated on ragged radial grids which are concatenated into
+    a single array. ``offsets`` holds the index at which the points of each material start.
+
+    Attributes:
+        sigma_t (np.array): Tangential stresses, (n_points,) or (n_speeds, n_points) [Pa]
+        sigma_r (np.array): Radial stresses, (n_points,) or (n_speeds, n_points) [Pa]
+        offsets (np.array): (n_materials + 1,) start index of each material, the last entry
+            is n_points
+        sigma_z (float): Axial Stress (Constant) [Pa]
+    """
+
+    def __init__(
+        self,
+        sigma_t: np.ndarray,
+        sigma_r: np.ndarray,
+        offsets: np.ndarray,
+        sigma_z: float = 0,
+    ) -> "StressCriteriaProblem":
+        self.sigma_t = np.atleast_2d(sigma_t)
+        self.sigma_r = np.atleast_2d(sigma_r)
+        self.offsets = np.asarray(offsets, dtype=int)
+        self.sigma_z = sigma_z
+
+
+class StressCriteriaAnalyzer:
+    """Analyzer class for StressCriteriaProblem"""
+
+    def analyze(self, problem: "StressCriteriaProblem") -> "StressCriteriaResults":
+        """Determine maximum Von Mises and Tresca stress of each material
+
+        Applied shear stress terms are omitted, so sigma_t, sigma_r and sigma_z are the principal
+        stresses and the criteria are evaluated without sorting them.
+
+        Args:
+            problem (StressCriteriaProblem): StressCriteriaProblem
+
+        Returns:
+            results (StressCriteriaResults): StressCriteriaResults
+        """
+        sigma_t = problem.sigma_t
+        sigma_r = problem.sigma_r
+        sigma_z = problem.sigma_z
+
+        von_mises = np.sqrt(
+            0.5
+            * (
+                (sigma_t - sigma_r) ** 2
+                + (sigma_r - sigma_z) ** 2
+                + (sigma_z - sigma_t) ** 2
+            )
+        )
+        sigma_1 = np.maximum(np.maximum(sigma_t, sigma_r), sigma_z)
+        sigma_3 = np.minimum(np.minimum(sigma_t, sigma_r), sigma_z)
+        tresca = sigma_1 - sigma_3
+
+        return StressCriteriaResults(
+            segment_max(von_mises, problem.offsets),
+            segment_max(tresca, problem.offsets),
+        )
+
+
+class StressCriteriaResults:
+    def __init__(self, von_mises_max: np.ndarray, tresca_max: np.ndarray):
+        """Results class for StressCriteriaAnalyzer
+
+        Attributes:
+            von_mises_max (np.array): (n_speeds, n_materials) maximum Von Mises stress [Pa]
+            tresca_max (np.array): (n_speeds, n_materials) maximum Tresca/MSST stress [Pa]
+
+        Materials without any radial points hold NaN.
+        """
+        self.von_mises_max = von_mises_max
+        self.tresca_max = tresca_max
+
+
+def concatenate_ragged(arrays: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate ragged arrays, e.g. the radial grids of each material
+
+    Args:
+        arrays (List[np.array]): arrays to concatenate
+
+    Returns:
+        values (np.array): concatenated array
+        offsets (np.array): start index of each array, the last entry is len(values)
+    """
+    lengths = [len(a) for a in arrays]
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(int)
+    values = np.concatenate([np.asarray(a, dtype=float) for a in arrays])
+    return values, offsets
+
+
+def segment_max(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Maximum of each segment along the last axis of values
+
+    Args:
+        values (np.array): (..., n_points) array
+        offsets (np.array): start index of each segment, the last entry is n_points
+
+    Returns:
+        seg_max (np.array): (..., n_segments) array, NaN for empty segments
+    """
+    starts = offsets[:-1]
+    empty = offsets[1:] == starts
+    # pad with NaN so every start index is valid, fmax ignores the padding
+    padded = np.concatenate(
+        (values, np.full(values.shape[:-1] + (1,), np.nan)), axis=-1
+    )
+    seg_max = np.fmax.reduceat(padded, starts, axis=-1)
+    seg_max[..., empty] = np.nan
+    return seg_max
@@ -1,5 +1,7 @@
 import numpy as np
-from typing import List
+import scipy.linalg as la
+from copy import copy
+from typing import List, Union, Callable
 
 
 class ThermalNetworkProblem:
@@ -66,6 +68,277 @@ class ThermalNetworkAnalyzer:
         return T
 
 
+class ThermalNetworkTransientProblem:
+    """Problem class for Transient Thermal Resistance Network Analyzer.
+
+    Attributes:
+        res: List of Resistance objects
+        C: List of heat capacities at nodal locations [J/K]
+        Q_dot: Thermal sources at nodal locations [W]. Either a list of length N_nodes
+            (constant sources), an array of shape (n_steps, N_nodes) holding a loss time series
+            (the last row is held if the series is shorter than n_steps),
+            or a callable returning the N_nodes sources at time t
+        T_ref: List of [ref_node,ref_temp]
+        N_nodes: Number of Nodes in system
+        dt: Time step [s]
+        n_steps: Number of time steps to simulate
+        T_0: Initial temperature at each node [C]. Defaults to the first reference temperature
+        method: Integration method, 'euler' (implicit Euler) or 'bdf2'
+    """
+
+    def __init__(
+        self,
+        res: List["Resistance"],
+        C: "List[float]",
+        Q_dot: "Union[List[float], np.ndarray, Callable[[float], np.ndarray]]",
+        T_ref: "List[List[int,float]]",
+        N_nodes: int,
+        dt: float,
+        n_steps: int,
+        T_0: "Union[float, List[float]]" = None,
+        method: str = "euler",
+    ):
+        self.res = res
+        self.C = C
+        self.Q_dot = Q_dot
+        self.T_ref = T_ref
+        self.N_nodes = N_nodes
+        self.dt = dt
+        self.n_steps = n_steps
+        self.T_0 = T_0
+        self.method = method
+
+
+class ThermalNetworkTransientAnalyzer:
+    """Transient Thermal Resistance Network Analyzer.
+
+    Node temperatures are advanced with implicit Euler or BDF2. The system matrices only depend on
+    the resistances, capacities, and time step, so they are factorized once before time stepping.
+    """
+
+    def analyze(self, problem: ThermalNetworkTransientProblem):
+        """Analyze imported transient resistance network problem
+
+        Args:
+            problem: ThermalNetworkTransientProblem object to be analyzed
+
+        Returns:
+            generator: yields (t, T) at each time step, where T is the temperature at each node in
+                the system. Temperatures are streamed so long drive cycles are never held in memory.
+        """
+        if problem.method not in ("euler", "bdf2"):
+            raise ValueError("Unsupported integration method: " + str(problem.method))
+        return self._time_step(problem)
+
+    def _time_step(self, problem):
+        N = problem.N_nodes
+        dt = problem.dt
+        G = conductance_matrix(problem.res, N)
+        C = np.asarray(problem.C, dtype=float).reshape(N)
+
+        # split nodes into reference (fixed temperature) and free nodes
+        ref_nodes = np.array([node for node, temp in problem.T_ref], dtype=int)
+        ref_temps = np.array([temp for node, temp in problem.T_ref], dtype=float)
+        free = np.ones(N, dtype=bool)
+        free[ref_nodes] = False
+        G_ff = G[np.ix_(free, free)]
+        # heat flow into free nodes from the fixed reference temperatures
+        Q_ref = -G[np.ix_(free, ~free)] @ ref_temps[np.argsort(ref_nodes)]
+        C_f = C[free]
+
+        # factorize once, the matrices do not change over the simulation
+        lu_euler = la.lu_factor(np.diag(C_f / dt) + G_ff)
+        if problem.method == "bdf2":
+            lu_bdf2 = la.lu_factor(np.diag(1.5 * C_f / dt) + G_ff)
+
+        T = np.empty(N)
+        if problem.T_0 is None:
+            T[:] = ref_temps[0]
+        else:
+            T[:] = problem.T_0
+        T[ref_nodes] = ref_temps
+        T_f = T[free]
+        T_f_prev = None
+
+        Q_source = _source_function(problem.Q_dot, N, dt)
+        for n in range(1, problem.n_steps + 1):
+            t = n * dt
+            Q_f = Q_source(n, t)[free] + Q_ref
+            if T_f_prev is None or problem.method == "euler":
+                rhs = C_f / dt * T_f + Q_f
+                T_f_next = la.lu_solve(lu_euler, rhs)
+            else:
+                rhs = C_f / dt * (2 * T_f - 0.5 * T_f_prev) + Q_f
+                T_f_next = la.lu_solve(lu_bdf2, rhs)
+            T_f_prev, T_f = T_f, T_f_next
+            T[free] = T_f
+            yield t, T.copy()
+
+
+def conductance_matrix(res: List["Resistance"], N_nodes: int):
+    """Assemble the conductance matrix of a resistance network
+
+    Args:
+        res: List of Resistance objects
+        N_nodes: Number of Nodes in system
+
+    Returns:
+        G: (N_nodes, N_nodes) conductance matrix [W/K]. Parallel resistances between the same pair of
+            nodes are summed.
+    """
+    N1 = np.array([r.Node1 for r in res], dtype=int)
+    N2 = np.array([r.Node2 for r in res], dtype=int)
+    g = np.array([1 / r.resistance_value for r in res], dtype=float)
+    G = np.zeros([N_nodes, N_nodes])
+    np.add.at(G, (N1, N2), -g)
+    np.add.at(G, (N2, N1), -g)
+    np.add.at(G, (N1, N1), g)
+    np.add.at(G, (N2, N2), g)
+    return G
+
+
+class ThermalNetworkBatch:
+    """Array-backed resistance network holding many networks of identical topology.
+
+    Attributes:
+        Node1: Array of first node connected to each resistance
+        Node2: Array of second node connected to each resistance
+        g: (B, N_res) array of conductances [W/K], one row per network in the batch
+        N_nodes: Number of Nodes in system
+    """
+
+    def __init__(
+        self, Node1: np.ndarray, Node2: np.ndarray, g: np.ndarray, N_nodes: int
+    ):
+        self.Node1 = np.asarray(Node1, dtype=int)
+        self.Node2 = np.asarray(Node2, dtype=int)
+        self.g = np.atleast_2d(np.asarray(g, dtype=float))
+        self.N_nodes = N_nodes
+        # maps conductances onto the flattened conductance matrix: G = g @ incidence
+        N_res = len(self.Node1)
+        incidence = np.zeros([N_res, N_nodes * N_nodes])
+        res_idx = np.arange(N_res)
+        np.add.at(incidence, (res_idx, self.Node1 * N_nodes + self.Node2), -1)
+        np.add.at(incidence, (res_idx, self.Node2 * N_nodes + self.Node1), -1)
+        np.add.at(incidence, (res_idx, self.Node1 * N_nodes + self.Node1), 1)
+        np.add.at(incidence, (res_idx, self.Node2 * N_nodes + self.Node2), 1)
+        self._incidence = incidence
+
+    @classmethod
+    def from_resistances(
+        cls, res: "List[List[Resistance]]", N_nodes: int
+    ) -> "ThermalNetworkBatch":
+        """Create batch from lists of Resistance objects
+
+        Args:
+            res: List of resistance networks, each a list of Resistance objects. All networks must
+                connect the same nodes in the same order.
+            N_nodes: Number of Nodes in system
+
+        Returns:
+            batch: ThermalNetworkBatch holding one row of conductances per network
+        """
+        Node1 = np.array([r.Node1 for r in res[0]], dtype=int)
+        Node2 = np.array([r.Node2 for r in res[0]], dtype=int)
+        for network in res[1:]:
+            if not (
+                np.array_equal(Node1, [r.Node1 for r in network])
+                and np.array_equal(Node2, [r.Node2 for r in network])
+            ):
+                raise ValueError("Networks in a batch must share the same topology")
+        g = np.array([[1 / r.resistance_value for r in network] for network in res])
+        return cls(Node1, Node2, g, N_nodes)
+
+    @property
+    def batch_size(self):
+        return self.g.shape[0]
+
+    def with_conductances(self, idx, g_new) -> "ThermalNetworkBatch":
+        """Return a batch with the conductances of selected resistances replaced
+
+        Geometry dependent conductances are shared, only the conductances at ``idx`` are replaced.
+        The batch is broadcast against the rows of ``g_new``.
+
+        Args:
+            idx: Indices of the resistances to update
+            g_new: (B, len(idx)) array of new conductances [W/K]
+
+        Returns:
+            batch: ThermalNetworkBatch with updated conductances
+        """
+        g_new = np.atleast_2d(g_new)
+        B = np.broadcast_shapes((self.batch_size,), (g_new.shape[0],))[0]
+        g = np.array(np.broadcast_to(self.g, (B, self.g.shape[1])))
+        g[:, idx] = g_new
+        batch = copy(self)
+        batch.g = g
+        return batch
+
+    def conductance_matrix(self):
+        """Returns (B, N_nodes, N_nodes) conductance matrices [W/K]"""
+        N = self.N_nodes
+        return (self.g @ self._incidence).reshape(self.batch_size, N, N)
+
+
+class ThermalNetworkBatchProblem:
+    """Problem class for Batched Thermal Resistance Network Analyzer.
+
+    Attributes:
+        network: ThermalNetworkBatch object
+        Q_dot: Thermal sources at nodal locations, (N_nodes,) or (B, N_nodes) array [W]
+        T_ref: List of [ref_node,ref_temp]
+    """
+
+    def __init__(
+        self,
+        network: ThermalNetworkBatch,
+        Q_dot: np.ndarray,
+        T_ref: "List[List[int,float]]",
+    ):
+        self.network = network
+        self.Q_dot = Q_dot
+        self.T_ref = T_ref
+
+
+class ThermalNetworkBatchAnalyzer:
+    """Batched Thermal Resistance Network Analyzer."""
+
+    def analyze(self, problem: ThermalNetworkBatchProblem):
+        """Analyze all networks in a batch with a single linear solve
+
+        Args:
+            problem: ThermalNetworkBatchProblem object to be analyzed
+
+        Returns:
+            T: (B, N_nodes) temperature distribution at each node of every network in the batch
+        """
+        network = problem.network
+        N = network.N_nodes
+        G = network.conductance_matrix()
+        B = G.shape[0]
+        Q_dot = np.array(
+            np.broadcast_to(np.asarray(problem.Q_dot, dtype=float).reshape(-1, N), (B, N))
+        )
+        for node, temp in problem.T_ref:
+            G[:, node, :] = 0
+            G[:, node, node] = 1
+            Q_dot[:, node] = temp
+        T = np.linalg.solve(G, Q_dot[:, :, None])[:, :, 0]
+        return T
+
+
+def _source_function(Q_dot, N_nodes, dt):
+    """Wrap the supported heat source inputs in a function of (step, time)"""
+    if callable(Q_dot):
+        return lambda n, t: np.asarray(Q_dot(t), dtype=float).reshape(N_nodes)
+    Q_dot = np.asarray(Q_dot, dtype=float)
+    if Q_dot.ndim == 2 and Q_dot.shape[1] == N_nodes and Q_dot.shape[0] > 1:
+        # loss time series, one row per time step
+        return lambda n, t: Q_dot[min(n, Q_dot.shape[0]) - 1]
+    Q_dot = Q_dot.reshape(N_nodes)
+    return lambda n, t: Q_dot
+
+
 class Material:
     """Class holding material parameters.
 
@@ -226,6 +499,46 @@ class air_gap_conv(Resistance):
     def resistance_value(self):
         return 1 / (self.h * self.A)
 
+    @staticmethod
+    def h_array(Material: Material, omega, R_r, R_s, u_z):
+        """Convection coefficient evaluated over arrays of operating points.
+
+        Matches the ``h`` property, with the flow regime selected by masks so ``omega``, ``R_r``,
+        ``R_s`` and ``u_z`` can be broadcast against each other.
+
+        Returns:
+            h: Convection Coeff [W/m^2-K]
+        """
+        omega, R_r, R_s, u_z = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (omega, R_r, R_s, u_z))
+        )
+        # the gap length evaluates to the rotor radius, as in the h property
+        g = R_r
+        a = R_r
+        D_h = 2 * g
+        u_theta = omega * R_r
+        Re_g = (omega * g * R_r) / Material.mu
+        Re_z = np.sqrt((omega * R_r) ** 2 + u_z**2) * D_h / Material.mu
+        Ta_m = Re_g * ((g / R_r) ** (0.5))
+        Pr = 1000 * Material.cp * Material.mu / Material.k
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Nu_axial = (
+                (0.022 * (1 + D_h * u_theta / (np.pi * a * u_z) ** 2) ** 0.8714)
+                * (Re_z**0.8)
+                * (Pr**0.5)
+            )
+        Nu = np.select(
+            [Ta_m <= 41, Ta_m < 100, u_z == 0, Ta_m >= 100],
+            [
+                np.full_like(Ta_m, 2.0),
+                0.202 * (Ta_m ** (0.63)) * (Pr ** (0.27)),
+                0.03 * Re_z**0.8,
+                Nu_axial,
+            ],
+            default=np.nan,
+        )
+        return Nu * Material.k / D_h
+
 
 class hub_conv(Resistance):
     """Hub convection thermal resistance
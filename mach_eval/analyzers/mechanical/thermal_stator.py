@@ -142,3 +142,76 @@ class StatorThermalAnalyzer:
 
         results = {"Coil temperature": T_coil, "Stator yoke temperature": T_sy}
         return results
+
+
+class StatorThermalArrayAnalyzer:
+    """Stator Thermal Analyzer for problems with array attributes
+
+    All StatorThermalProblem attributes may be arrays which broadcast against each other,
+    e.g. for loss maps or design sweeps.
+    """
+
+    def analyze(self, problem):
+        """calculates coil temperature from problem class.
+
+        Args:
+            problem (StatorThermalProblem): Problem Object
+
+        Returns:
+            results : Dict of coil and stator yoke temperature arrays of the broadcast shape
+        """
+
+        g_sy = np.asarray(problem.g_sy, dtype=float)
+        g_th = np.asarray(problem.g_th, dtype=float)
+        w_tooth = np.asarray(problem.w_tooth, dtype=float)
+        l_st = np.asarray(problem.l_st, dtype=float)
+        l_tooth = np.asarray(problem.l_tooth, dtype=float)
+        alpha_q = np.asarray(problem.alpha_q, dtype=float)
+        r_so = np.asarray(problem.r_so, dtype=float)
+        r_sy = np.asarray(problem.r_sy, dtype=float)
+
+        k_ins = np.asarray(problem.k_ins, dtype=float)
+        w_ins = np.asarray(problem.w_ins, dtype=float)
+        k_fe = np.asarray(problem.k_fe, dtype=float)
+        h = np.asarray(problem.h, dtype=float)
+        alpha_slot = np.asarray(problem.alpha_slot, dtype=float)
+        h_slot = np.asarray(problem.h_slot, dtype=float)
+        Q_coil = np.asarray(problem.Q_coil, dtype=float)
+
+        Q_tooth = g_th * w_tooth * l_st * l_tooth / 2
+        zeta = np.sqrt(2 * k_ins / (w_tooth * w_ins * k_fe))
+
+        M_th = w_tooth * l_st / (2 * zeta) * np.tanh(zeta * l_tooth)
+        R_sy = 1 / (h * r_so * alpha_q * l_st) + np.log(r_so / r_sy) / (
+            k_fe * alpha_q * l_st
+        )
+        V_sy = l_st * (alpha_q / 2) * (r_so**2 - r_sy**2)
+        M_sy = (
+            r_sy**2 / (2 * k_fe) * np.log(r_sy / r_so)
+            + (r_so**2 - r_sy**2) / (2 * k_fe)
+            + V_sy / (h * r_so * alpha_q * l_st)
+        )
+
+        R_coil_st = w_ins * zeta / (k_ins * l_st * np.tanh(zeta * l_tooth))
+        R_coil_sy = w_ins / (k_ins * r_sy * alpha_slot * l_st)
+        R_coil = (2 / R_coil_st + 1 / R_coil_sy) ** -1
+        A_cd = (2 * l_tooth + r_sy * alpha_slot) * l_st
+
+        # R_coil / R_cd with R_cd = 1 / (h_slot * A_cd), in-slot convection below 0.1 is ignored
+        R_coil_R_cd = np.where(h_slot < 0.1, 0, R_coil * h_slot * A_cd)
+        T_coil = (
+            Q_coil * (R_coil + R_sy)
+            + g_sy * M_sy
+            + 2 * Q_tooth * R_sy
+            - M_th * g_th * R_coil
+            + Q_tooth * R_coil
+        ) / (1 + R_coil_R_cd)
+        T_sy = g_sy * M_sy + (Q_coil + 2 * Q_tooth) * R_sy
+
+        # Add back in ref temp
+        T_coil, T_sy = np.broadcast_arrays(
+            T_coil + problem.T_ref, T_sy + problem.T_ref
+        )
+
+        results = {"Coil temperature": T_coil, "Stator yoke temperature": T_sy}
+        return results
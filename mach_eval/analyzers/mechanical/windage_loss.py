@@ -26,6 +26,7 @@ class WindageLossProblem:
 class WindageLossAnalyzer:
     """Windage loss analyzer"""
 
+    @staticmethod
     def analyze(problem):
         """ Calculates total windage loss in machine.
         
@@ -125,3 +126,78 @@ class WindageLossAnalyzer:
         )
         return [windage_loss_radial, windage_loss_endFace, windage_loss_axial]
 
+
+
+class WindageLossArrayAnalyzer:
+    """Array windage loss analyzer
+
+    Evaluates the model of WindageLossAnalyzer for WindageLossProblem objects whose attributes
+    are arrays. ``Omega``, ``T_air``, ``R_ro``, ``stack_length``, ``R_st`` and ``u_z`` are
+    broadcast against each other, e.g. ``Omega[:, None]`` and ``T_air[None, :]`` give a
+    speed by temperature map.
+    """
+
+    def analyze(self, problem):
+        """Calculates windage loss components in machine.
+
+        Args:
+            problem: problem class
+
+        Returns:
+            [windage_loss_radial, windage_loss_endFace, windage_loss_axial]: loss components
+            as arrays of the broadcast input shape [W]
+        """
+        Omega, R, L, R_st, u_z, T_Air = np.broadcast_arrays(
+            *(
+                np.asarray(x, dtype=float)
+                for x in (
+                    problem.Omega,
+                    problem.R_ro,
+                    problem.stack_length,
+                    problem.R_st,
+                    problem.u_z,
+                    problem.T_air,
+                )
+            )
+        )
+        delta = R_st - R
+
+        nu_0_Air = 13.3e-6  # [m^2/s] kinematic viscosity of air at 0
+        rho_0_Air = 1.29  # [kg/m^3] Air density at 0
+        nu_Air = nu_0_Air * ((T_Air + 273) / (0 + 273)) ** 1.76
+        rho_Air = rho_0_Air * (0 + 273) / (T_Air + 273)
+
+        # all regime branches are evaluated, the losses of a standstill rotor are 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # shrouded cylinder, radial surface
+            Rey = R ** 2 * Omega / nu_Air
+            Tay = R * Omega * (delta / nu_Air) * np.sqrt(delta / R)
+            c_W = np.select(
+                [Rey <= 170, Tay < 41.3],
+                [
+                    8.0 / Rey,
+                    1.8 * (R / delta) ** (0.25) * (R + delta) ** 2 / (Rey * delta ** 2),
+                ],
+                default=7e-3,
+            )
+            windage_loss_radial = c_W * np.pi * rho_Air * Omega ** 3 * R ** 4 * L
+
+            # end faces
+            Rer = rho_Air * R ** 2 * Omega / nu_Air
+            c_f = np.select(
+                [Rer <= 30, Rer < 3 * 10 ** 5],
+                [64 / (3 * Rer), 3.87 * Rer ** (-0.5)],
+                default=0.146 * Rer ** (-0.2),
+            )
+            windage_loss_endFace = 0.5 * c_f * rho_Air * Omega ** 3 * R ** 5
+
+        standstill = Omega == 0
+        windage_loss_radial = np.where(standstill, 0, windage_loss_radial)
+        windage_loss_endFace = np.where(standstill, 0, windage_loss_endFace)
+
+        # axial air flow
+        um = 0.48 * Omega * R
+        windage_loss_axial = (
+            (2 / 3) * np.pi * rho_Air * (R_st ** 3 - R ** 3) * u_z * um * Omega
+        )
+        return [windage_loss_radial, windage_loss_endFace, windage_loss_axial]
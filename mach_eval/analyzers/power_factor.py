@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class PowerFactorProblem:
+    """Problem class for power factor, RMS and THD analysis of voltage and current waveforms
+
+    Waveforms are uniformly sampled over a whole number of fundamental periods. Waveforms with
+    half-wave symmetry, x(t + T/2) = -x(t), may be sampled over a half period instead. Several
+    waveforms can be analyzed at once by stacking them along the leading axes.
+
+    Attributes:
+        voltage: numpy array of voltage samples, time along the last axis
+        current: numpy array of current samples, time along the last axis
+        time: numpy array of sample times [s]
+        freq: fundamental frequency [Hz]
+        half_period: True if the samples span a half period of a half-wave symmetric waveform, in
+            which case the mean of the samples is not taken as DC when calculating THD
+    """
+
+    def __init__(self, voltage, current, time, freq, half_period=False):
+        self.voltage = np.asarray(voltage, dtype=float)
+        self.current = np.asarray(current, dtype=float)
+        self.time = np.asarray(time, dtype=float)
+        self.freq = freq
+        self.half_period = half_period
+
+
+class PowerFactorAnalyzer:
+    def analyze(self, problem: PowerFactorProblem):
+        """Calculates power factor, RMS values and THD of voltage and current
+
+        Args:
+            problem: object of type PowerFactorProblem holding waveform data
+        Returns results dictionary with the following parameters:
+            power_factor: cosine of the phase difference between current and voltage fundamentals
+            phase_difference: phase of the current relative to the voltage fundamental [deg]
+            voltage_fundamental: amplitude of the voltage fundamental
+            current_fundamental: amplitude of the current fundamental
+            voltage_rms: RMS voltage
+            current_rms: RMS current
+            voltage_thd: total harmonic distortion of voltage
+            current_thd: total harmonic distortion of current
+        """
+        u = fundamental_phasor(problem.voltage, problem.time, problem.freq)
+        i = fundamental_phasor(problem.current, problem.time, problem.freq)
+        u_rms = rms(problem.voltage)
+        i_rms = rms(problem.current)
+        phase_difference = np.angle(i * np.conj(u))
+
+        results = {
+            "power_factor": np.cos(phase_difference),
+            "phase_difference": np.degrees(phase_difference),
+            "voltage_fundamental": np.abs(u),
+            "current_fundamental": np.abs(i),
+            "voltage_rms": u_rms,
+            "current_rms": i_rms,
+            "voltage_thd": thd(problem.voltage, u, u_rms, problem.half_period),
+            "current_thd": thd(problem.current, i, i_rms, problem.half_period),
+        }
+        return results
+
+
+def fundamental_phasor(x, time, freq):
+    """Projects waveforms onto a single DFT bin at the fundamental frequency
+
+    Samples span a whole number of periods, or a half period of a half-wave symmetric waveform.
+    In the latter case the mirrored second half period contributes the same sum as the sampled
+    half, so the projection over the samples is exact without extending the waveform.
+
+    Args:
+        x: numpy array of samples, time along the last axis
+        time: numpy array of sample times [s]
+        freq: fundamental frequency [Hz]
+    Returns:
+        X: complex amplitude of the fundamental, x = Re(X exp(j 2 pi freq t))
+    """
+    time = np.asarray(time, dtype=float)
+    kernel = np.exp(-2j * np.pi * freq * (time - time[0]))
+    return 2 / time.size * (np.asarray(x, dtype=float) @ kernel)
+
+
+def rms(x):
+    """RMS of waveforms along the last axis"""
+    x = np.asarray(x, dtype=float)
+    return np.sqrt(np.mean(x**2, axis=-1))
+
+
+def thd(x, X, x_rms=None, half_period=False):
+    """Total harmonic distortion of waveforms relative to their fundamental
+
+    Args:
+        x: numpy array of samples, time along the last axis
+        X: complex amplitude of the fundamental
+        x_rms: RMS of x, computed if not provided
+        half_period: True if the samples span a half period of a half-wave symmetric waveform,
+            which has no DC component
+    Returns:
+        thd: RMS of all harmonics except the fundamental and DC, relative to the fundamental RMS
+    """
+    if x_rms is None:
+        x_rms = rms(x)
+    dc = 0 if half_period else np.mean(x, axis=-1)
+    fundamental_rms = np.abs(X) / np.sqrt(2)
+    harmonic_ms = np.maximum(x_rms**2 - dc**2 - fundamental_rms**2, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(harmonic_ms) / fundamental_rms
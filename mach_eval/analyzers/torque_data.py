@@ -1,7 +1,11 @@
+import numpy as np
+
+
 class ProcessTorqueDataProblem:
     """Problem class for torque data processing
     Attributes:
-        torque: numpy array of torque against time or position
+        torque: numpy array of torque against time or position, several waveforms can be
+            stacked along the leading axes
     """
 
     def __init__(self, torque):
@@ -18,7 +22,9 @@ class ProcessTorqueDataAnalyzer:
             torque_avg: Average torque calculated from provided data
             torque_ripple: Torque ripple calculated from provided data
         """
-        torque = problem.torque
-        torque_avg = sum(torque) / len(torque)
-        torque_ripple = max(abs(torque - torque_avg)) / torque_avg
+        torque = np.asarray(problem.torque, dtype=float)
+        torque_avg = np.mean(torque, axis=-1)
+        torque_ripple = (
+            np.max(np.abs(torque - torque_avg[..., np.newaxis]), axis=-1) / torque_avg
+        )
         return torque_avg, torque_ripple
@@ -0,0 +1,136 @@
+import numpy as np
+
+
+class ProcessWaveformDataProblem:
+    """Problem class for spectral analysis of periodic waveforms
+
+    Waveforms such as torque, force, voltage or flux linkage are uniformly sampled over a whole
+    number of periods of their fundamental. Any number of waveforms, e.g. phases of several
+    designs, can be stacked along the leading axes.
+
+    Attributes:
+        waveforms: numpy array of samples against time or position, time along the last axis
+        harmonics: numpy array of harmonic orders of interest, all orders up to the Nyquist
+            order if not defined
+        periods: number of fundamental periods spanned by the samples
+    """
+
+    def __init__(self, waveforms, harmonics=None, periods=1):
+        self.waveforms = np.asarray(waveforms, dtype=float)
+        n_samples = self.waveforms.shape[-1]
+        if harmonics is None:
+            harmonics = np.arange(1, n_samples // (2 * periods) + 1)
+        self.harmonics = np.asarray(harmonics, dtype=int)
+        if np.any(self.harmonics * periods > n_samples // 2):
+            raise ValueError("Harmonic orders beyond the Nyquist frequency of the samples")
+        self.periods = periods
+
+
+class ProcessWaveformDataAnalyzer:
+    def analyze(self, problem: ProcessWaveformDataProblem):
+        """Calculates mean, RMS, ripple, harmonics and THD of waveforms with a single rFFT
+
+        Args:
+            problem: object of type ProcessWaveformDataProblem holding waveform data
+        Returns results dictionary with the following parameters, each with the leading shape
+        of the waveforms:
+            mean: average value
+            rms: RMS value
+            ripple: peak-to-peak ripple
+            ripple_pu: peak-to-peak ripple relative to the magnitude of the average value
+            amplitudes: amplitudes of the harmonics of interest along the last axis
+            phases: phases of the harmonics of interest along the last axis, referred to a
+                cosine starting at the first sample [rad]
+            thd: RMS of all harmonics except the fundamental, relative to the fundamental RMS
+        """
+        x = problem.waveforms
+        n_samples = x.shape[-1]
+        spectrum = np.fft.rfft(x, axis=-1) / n_samples
+        # one-sided amplitudes, DC and Nyquist bins are not doubled
+        amplitude = 2 * np.abs(spectrum)
+        amplitude[..., 0] /= 2
+        if n_samples % 2 == 0:
+            amplitude[..., -1] /= 2
+
+        bins = problem.harmonics * problem.periods
+        mean = np.real(spectrum[..., 0])
+        # Parseval: the mean square is the sum of the squared RMS values of all bins
+        ms_ac = np.sum(amplitude[..., 1:] ** 2, axis=-1) / 2
+        if n_samples % 2 == 0:
+            ms_ac += amplitude[..., -1] ** 2 / 2
+        fundamental_ms = amplitude[..., problem.periods] ** 2 / 2
+
+        peak_to_peak = np.ptp(x, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ripple_pu = peak_to_peak / np.abs(mean)
+            thd = np.sqrt(np.maximum(ms_ac - fundamental_ms, 0) / fundamental_ms)
+
+        results = {
+            "mean": mean,
+            "rms": np.sqrt(mean**2 + ms_ac),
+            "ripple": peak_to_peak,
+            "ripple_pu": ripple_pu,
+            "amplitudes": amplitude[..., bins],
+            "phases": np.angle(spectrum[..., bins]),
+            "thd": thd,
+        }
+        return results
+
+
+class SinusoidFitProblem:
+    """Problem class for fitting sinusoids of known frequency to waveforms
+
+    Attributes:
+        waveforms: numpy array of samples, time along the last axis. Several waveforms, e.g.
+            the flux linkages of all phases, can be stacked along the leading axes
+        time: numpy array of sample times [s]
+        freq: frequency of the sinusoid [Hz]
+    """
+
+    def __init__(self, waveforms, time, freq):
+        self.waveforms = np.asarray(waveforms, dtype=float)
+        self.time = np.asarray(time, dtype=float)
+        self.freq = freq
+
+
+class SinusoidFitAnalyzer:
+    def analyze(self, problem: SinusoidFitProblem):
+        """Fits amp * sin(omega * t + phase) + offset to each waveform
+
+        With the frequency known, the fit is linear in the sine, cosine and offset coefficients
+        and all waveforms are fit at once with a single least-squares solve. The samples need
+        not span whole periods.
+
+        Args:
+            problem: object of type SinusoidFitProblem holding waveform data
+        Returns results dictionary with the following parameters, each with the leading shape
+        of the waveforms:
+            amp: non-negative amplitude of the sinusoid
+            omega: angular frequency of the sinusoid [rad/s]
+            phase: phase of the sinusoid [rad]
+            offset: offset of the sinusoid
+            sin_coeff: signed coefficient of sin(omega * t)
+            cos_coeff: signed coefficient of cos(omega * t)
+            residual: RMS deviation of the waveform from the fit
+        """
+        t = problem.time
+        omega = 2 * np.pi * problem.freq
+        basis = np.column_stack((np.sin(omega * t), np.cos(omega * t), np.ones_like(t)))
+
+        y = problem.waveforms.reshape(-1, t.size)
+        coeffs = np.linalg.lstsq(basis, y.T, rcond=None)[0]
+        a, b, c = coeffs.reshape((3,) + problem.waveforms.shape[:-1])
+        residual = np.sqrt(
+            np.mean((y.T - basis @ coeffs) ** 2, axis=0)
+        ).reshape(problem.waveforms.shape[:-1])[()]
+
+        results = {
+            "amp": np.hypot(a, b),
+            "omega": omega,
+            "phase": np.arctan2(b, a),
+            "offset": c,
+            "sin_coeff": a,
+            "cos_coeff": b,
+            "residual": residual,
+        }
+        return results
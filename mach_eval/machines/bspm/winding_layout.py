@@ -1,6 +1,9 @@
+import numpy as np
+from functools import lru_cache
 
 class WindingLayout(object):
     def __init__(self, DPNV_or_SEPA, Qs, p, ps=None):
+        requested_ps = ps
 
         # separate winding
         if DPNV_or_SEPA == False \
@@ -221,12 +224,49 @@ class WindingLayout(object):
             self.l21 = self.leftlayer_phase
             self.l22 = self.leftlayer_polarity
 
+        if not hasattr(self, 'l41') and not hasattr(self, 'rightlayer_phase'):
+            # no hand-made table for this winding, generate it from the star of slots
+            self._from_generated_layout(DPNV_or_SEPA, Qs, p, requested_ps)
+
         try: 
             self.y
             # self.distributed_or_concentrated = False if abs(self.y) == 1 else True
         except:
             raise Exception('Error: Not implemented for this winding.')
 
+    def _from_generated_layout(self, DPNV_or_SEPA, Qs, p, ps):
+        if DPNV_or_SEPA and ps is None:
+            ps = p + 1 if is_feasible_winding(Qs, p + 1) else p - 1
+        no_of_layers = 2 if DPNV_or_SEPA else 1
+        layout = generate_winding_layout(
+            Qs, p, ps if DPNV_or_SEPA else None, no_of_layers=no_of_layers
+        )
+        if layout is None:
+            raise Exception('Error: Not implemented for this winding.')
+
+        self.rightlayer_phase = layout["layer_phases"][0]
+        self.rightlayer_polarity = layout["layer_polarity"][0]
+        self.leftlayer_phase = layout["layer_phases"][-1]
+        self.leftlayer_polarity = layout["layer_polarity"][-1]
+        if DPNV_or_SEPA:
+            self.grouping_a = layout["coil_groups"]
+        self.y = layout["pitch"]
+        self.coil_pitch = layout["pitch"]
+        self.CommutatingSequenceD = 1 if DPNV_or_SEPA else 0
+        self.CommutatingSequenceB = 0
+        self.number_parallel_branch = 2. if DPNV_or_SEPA else 1.
+        self.bool_3PhaseCurrentSource = not DPNV_or_SEPA
+        self.no_winding_layer = no_of_layers
+        self.initial_excitation_bias_compensation_deg = excitation_bias_compensation_deg(
+            layout["layer_phases"], layout["layer_polarity"], p
+        )
+
+        # backward compatibility
+        self.l41 = self.rightlayer_phase
+        self.l42 = self.rightlayer_polarity
+        self.l21 = self.leftlayer_phase
+        self.l22 = self.leftlayer_polarity
+
 
         # # combined winding
         # if DPNV_or_SEPA == True \
@@ -256,3 +296,258 @@ class WindingLayout(object):
         #     self.number_parallel_branch = 1.
         #     self.bool_3PhaseCurrentSource = True
         #     self.no_winding_layer = 1 # for torque winding
+
+
+# phase and polarity of each 60 deg phase belt of the star of slots
+_PHASES = np.array(['U', 'V', 'W'])
+_BELT_PHASE = np.array([0, 2, 1, 0, 2, 1])  # U, W, V, U, W, V
+_BELT_POLARITY = np.array([1, -1, 1, -1, 1, -1])
+
+
+def is_feasible_winding(Q, p, no_of_layers=2, m=3):
+    """Checks if balanced m-phase windings exist for slot and pole pair numbers
+
+    Args:
+        Q: number of slots, int or array
+        p: number of pole pairs, int or array broadcastable against Q
+        no_of_layers: 1 for a single-layer and 2 for a double-layer winding
+        m: number of phases
+
+    Returns:
+        feasible: bool or boolean array of the broadcast shape of Q and p
+    """
+    Q, p = np.broadcast_arrays(np.asarray(Q), np.asarray(p))
+    t = np.gcd(Q, p)
+    periods = m * np.where(t > 0, t, 1) * (2 if no_of_layers == 1 else 1)
+    feasible = (p > 0) & (Q > 0) & (Q % periods == 0) & (2 * p != Q)
+    return feasible[()] if feasible.ndim == 0 else feasible
+
+
+def star_of_slots(Q, p, sequence=1, offset=0):
+    """Assigns each slot to a 60 deg phase belt of the star of slots
+
+    Args:
+        Q: number of slots
+        p: number of pole pairs
+        sequence: 1 for a forward and -1 for a backward phase sequence
+        offset: number of belts by which the star is rotated
+
+    Returns:
+        phase: array of phase indices of each slot, 0, 1 and 2 for U, V and W
+        polarity: array of polarities of each slot, +1 and -1
+    """
+    k = np.arange(Q)
+    # belt index 6 * (p * k mod Q) / Q evaluated in integers to avoid round-off at belt edges
+    belt = (6 * np.mod(sequence * p * k, Q) // Q + offset) % 6
+    return _BELT_PHASE[belt], _BELT_POLARITY[belt]
+
+
+def is_balanced_winding(layer_phases, layer_polarity, p):
+    """Checks if the phases of a winding layout form a balanced three-phase system
+
+    Args:
+        layer_phases: list of layers of phase characters
+        layer_polarity: list of layers of polarity characters, '+', '-' or 'o' for empty
+        p: number of pole pairs
+
+    Returns:
+        balanced: True if the p-th harmonic of all phases is equal in magnitude and 120 deg apart
+    """
+    phases = np.array(layer_phases)
+    polarity = np.select(
+        [np.array(layer_polarity) == '+', np.array(layer_polarity) == '-'], [1, -1], 0
+    )
+    Q = phases.shape[-1]
+    # (phase, layer, slot) layouts of all phases summed against one phasor row
+    layouts = (phases[None] == _PHASES[:, None, None]) * polarity[None]
+    phasor = np.exp(-1j * p * 2 * np.pi / Q * np.arange(Q))
+    k_w = np.einsum("mlq,q->m", layouts, phasor)
+    if np.abs(k_w[0]) < 1e-9 * Q:
+        return False
+    ratio = k_w[1:] / k_w[0]
+    lag = np.exp(-2j * np.pi / 3 * np.array([1, 2]))
+    return bool(
+        np.allclose(ratio, lag, atol=1e-9) or np.allclose(ratio, np.conj(lag), atol=1e-9)
+    )
+
+
+def excitation_bias_compensation_deg(layer_phases, layer_polarity, p):
+    """Initial rotor angle compensating the position of the U-phase winding axis
+
+    The U-phase axis is the angle of the p-th harmonic phasor summed over the U-phase coil sides
+    of all layers, with slot k centered (k + 1/2) slot pitches from the x-axis. The compensation
+    is added to the initial rotor angle of the JMAG study for id = 0 control. It is derived from
+    the Q24 p2, Q24 p1 and Q12 p4 tables of WindingLayout, and also reproduces the Q6 p1 table.
+
+    The Q6 p2, Q12 p2 and Q12 p1 tables hold 0 instead of -30, -30 and 15. The U-phase axes of
+    the Q24 p2 and Q12 p2 tables coincide, yet their values differ, so no rule based on the layout
+    reproduces both. The Q12 p1 entry also leaves out the half slot pitch offset which the Q24 p1
+    entry compensates. WindingLayout keeps these tables unchanged and always uses their values,
+    so only windings without a table use this compensation.
+
+    Args:
+        layer_phases: list of layers of phase characters
+        layer_polarity: list of layers of polarity characters, '+', '-' or 'o' for empty
+        p: number of pole pairs
+
+    Returns:
+        bias: compensation angle in mechanical degrees, between -180 / p and 180 / p
+    """
+    phases = np.array(layer_phases)
+    polarity = np.select(
+        [np.array(layer_polarity) == '+', np.array(layer_polarity) == '-'], [1, -1], 0
+    )
+    Q = phases.shape[-1]
+    phasor = np.exp(1j * p * 2 * np.pi / Q * (np.arange(Q) + 0.5))
+    axis = np.degrees(np.angle(np.sum((phases == 'U') * polarity * phasor)))
+    # the rotor repeats every pole pair, the angle is wrapped into one pole pair pitch
+    return np.mod((axis + 90) / p - 90 + 180 / p, 360 / p) - 180 / p
+
+
+def generate_winding_layout(Q, p, ps=None, no_of_layers=2, pitch=None):
+    """Generates a three-phase winding layout from the star of slots
+
+    Layouts follow the winding dictionary convention of BSPM_Machine. The first layer holds the
+    coil sides going into the slots, the last layer the returning coil sides. If the suspension
+    pole pairs ps are given, a DPNV winding is generated and coil groups 'a' and 'b' are
+    assigned so that the suspension currents flow against the torque currents in group 'a'.
+    Results are memoized.
+
+    Args:
+        Q: number of slots
+        p: number of pole pairs
+        ps: number of suspension pole pairs of a DPNV winding, None for a separate winding
+        no_of_layers: 1 for a single-layer and 2 for a double-layer winding
+        pitch: coil pitch in slots, defaults to the full pitch rounded down or 1 for
+            concentrated windings
+
+    Returns:
+        winding: dict holding no_of_layers, layer_phases, layer_polarity, pitch and, for DPNV
+            windings, coil_groups. None if no balanced winding exists.
+    """
+    layout = _generate_winding_layout(Q, p, ps, no_of_layers, pitch)
+    if layout is None:
+        return None
+    return {
+        key: [list(layer) for layer in value] if key.startswith("layer") else
+        (list(value) if isinstance(value, tuple) else value)
+        for key, value in layout.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _generate_winding_layout(Q, p, ps, no_of_layers, pitch):
+    if no_of_layers not in (1, 2) or not is_feasible_winding(Q, p, no_of_layers):
+        return None
+    if ps is not None and (ps == p or not is_feasible_winding(Q, ps)):
+        return None
+    if pitch is not None:
+        return _layout_for_pitch(Q, p, ps, no_of_layers, pitch)
+    # full pitch coils cannot carry every suspension field, so shorter pitches are tried as well
+    for y in range(max(Q // (2 * p), 1), 0, -1):
+        layout = _layout_for_pitch(Q, p, ps, no_of_layers, y)
+        if layout is not None:
+            return layout
+    return None
+
+
+def _layout_for_pitch(Q, p, ps, no_of_layers, y):
+    phase, polarity = star_of_slots(Q, p)
+    k = np.arange(Q)
+    if no_of_layers == 2:
+        # coil k goes into slot k and returns in slot k + y
+        coils = k
+        slot_phase = np.stack((phase, np.roll(phase, y)))
+        slot_polarity = np.stack((polarity, -np.roll(polarity, y)))
+    elif Q % (2 * p) == 0 and y == Q // (2 * p):
+        # full pitch windings use the star of slots directly, coils go in at positive belts
+        returning = np.roll(phase, -y) == phase
+        if not np.all(returning & (np.roll(polarity, -y) == -polarity)):
+            return None
+        coils = k[polarity > 0]
+        slot_phase = phase[None]
+        slot_polarity = polarity[None]
+    elif y % 2 == 1 and Q % 2 == 0:
+        # every other coil is used, coil k occupies slots k and k + y
+        coils = k[::2]
+        slot_phase = np.empty(Q, dtype=int)
+        slot_polarity = np.empty(Q, dtype=int)
+        slot_phase[coils] = phase[coils]
+        slot_polarity[coils] = polarity[coils]
+        slot_phase[(coils + y) % Q] = phase[coils]
+        slot_polarity[(coils + y) % Q] = -polarity[coils]
+        slot_phase, slot_polarity = slot_phase[None], slot_polarity[None]
+    else:
+        return None
+
+    layer_phases = tuple(tuple(_PHASES[layer].tolist()) for layer in slot_phase)
+    layer_polarity = tuple(
+        tuple(np.where(layer > 0, '+', '-').tolist()) for layer in slot_polarity
+    )
+    if not is_balanced_winding(layer_phases, layer_polarity, p):
+        return None
+    layout = {
+        "no_of_layers": no_of_layers,
+        "layer_phases": layer_phases,
+        "layer_polarity": layer_polarity,
+        "pitch": y,
+    }
+    if ps is None:
+        return layout
+
+    groups = _dpnv_groups(Q, p, ps, y, phase[coils], polarity[coils], coils)
+    if groups is None:
+        return None
+    # coil groups are listed per slot of the first layer, returning sides follow their coil
+    coil_groups = np.empty(Q, dtype='<U1')
+    coil_groups[coils] = groups
+    if no_of_layers == 1:
+        coil_groups[(coils + y) % Q] = groups
+    layout["coil_groups"] = tuple(coil_groups.tolist())
+    return layout
+
+
+def _dpnv_groups(Q, p, ps, y, phase, polarity, coils):
+    """Splits the coils of each phase into DPNV groups 'a' and 'b'
+
+    Suspension currents flow forward in group 'a' and backward in group 'b'. Each phase is split
+    by the half plane of its suspension axis in the ps star of slots. All suspension axes and
+    both phase sequences are checked at once, and the split with the largest suspension winding
+    factor is returned for which the suspension currents produce a balanced ps pole pair field
+    and no p pole pair field. The torque currents must not produce a ps pole pair field.
+    """
+    theta = 2 * np.pi / Q * coils
+    # coil phasors of both coil sides at p and ps
+    c_p = polarity * (np.exp(-1j * p * theta) - np.exp(-1j * p * (theta + 2 * np.pi / Q * y)))
+    c_ps = polarity * (np.exp(-1j * ps * theta) - np.exp(-1j * ps * (theta + 2 * np.pi / Q * y)))
+    in_phase = phase[None, :] == np.arange(3)[:, None]  # (phase, coil)
+    tol = 1e-9 * len(coils)
+    if np.any(np.abs(in_phase @ c_ps) > tol):
+        return None
+
+    # suspension axes on odd multiples of pi / (2 Q) never coincide with a coil phasor
+    phi = np.pi * (2 * np.arange(2 * Q) + 1) / (2 * Q)
+    sequence = np.array([1, -1])
+    # axes of (sequence, axis, phase)
+    axes = phi[None, :, None] - sequence[:, None, None] * 2 * np.pi / 3 * np.arange(3)
+    coil_angle = np.angle(polarity * np.exp(-1j * ps * theta))
+    # sign of each coil of its own phase, (sequence, axis, coil)
+    sign = np.sign(np.cos(coil_angle - np.take(axes, phase, axis=-1)))
+
+    balanced_count = np.all(np.einsum("sac,mc->sam", sign, in_phase) == 0, axis=-1)
+    no_torque = np.all(np.abs(np.einsum("sac,mc,c->sam", sign, in_phase, c_p)) < tol, axis=-1)
+    S = np.einsum("sac,mc,c->sam", sign, in_phase, c_ps)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = S[..., 1:] / S[..., :1]
+    lag = np.exp(-2j * np.pi / 3 * np.arange(1, 3) * sequence[:, None])[:, None, :]
+    balanced = np.all(np.abs(ratio - lag) < 1e-9, axis=-1) & (np.abs(S[..., 0]) > tol)
+
+    valid = balanced_count & no_torque & balanced
+    if not np.any(valid):
+        return None
+    best = np.unravel_index(np.argmax(np.where(valid, np.abs(S[..., 0]), -1)), valid.shape)
+    groups = np.where(sign[best] > 0, 'a', 'b')
+    # suspension current direction is arbitrary, the first coil is placed in group 'b'
+    if groups[0] == 'a':
+        groups = np.where(groups == 'a', 'b', 'a')
+    return groups
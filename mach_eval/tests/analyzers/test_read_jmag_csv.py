@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mach_eval.analyzers.electromagnetic.jmag_csv import read_jmag_csv
+
+docs_folder = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "docs", "source", "EM_analyzers"
+)
+
+
+class TestReadJmagCSV(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "study_torque.csv")
+        self.time = np.arange(50) * 1e-4
+        self.torque = 2 + np.sin(2 * np.pi * 1000 * self.time)
+        with open(self.path, "w") as f:
+            for i in range(6):
+                f.write("meta data,%d\n" % i)
+            f.write("Time(s),TorCon\n")
+            for t, tau in zip(self.time, self.torque):
+                f.write("%.17g,%.17g\n" % (t, tau))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_matches_pandas(self):
+        table = read_jmag_csv(self.path, index_col="Time(s)", cache=False)
+        expected = pd.read_csv(self.path, skiprows=6).set_index("Time(s)")
+        pd.testing.assert_frame_equal(table.to_frame(), expected)
+
+    def test_tail(self):
+        table = read_jmag_csv(self.path, tail=10, cache=False)
+        np.testing.assert_array_equal(table.index, self.time[-10:])
+        np.testing.assert_array_equal(table["TorCon"], self.torque[-10:])
+
+    def test_cache(self):
+        table = read_jmag_csv(self.path, tail=10)
+        self.assertTrue(os.path.exists(self.path + ".npz"))
+        cached = read_jmag_csv(self.path)
+        np.testing.assert_array_equal(cached["TorCon"], self.torque)
+        np.testing.assert_array_equal(cached["TorCon"][-10:], table["TorCon"])
+
+    def test_docs_csv(self):
+        path = os.path.join(docs_folder, "results_stator_wdg_res.csv")
+        table = read_jmag_csv(path, skiprows=0, index_col=False, usecols=["Value"], cache=False)
+        expected = pd.read_csv(path)["Value"].to_numpy()
+        np.testing.assert_array_equal(table["Value"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.rotor_thermal import AirflowProblem, AirflowRootAnalyzer
+
+mat_dict = {
+    "shaft_therm_conductivity": 51.9,  # W/m-k ,
+    "core_therm_conductivity": 28,  # W/m-k
+    "magnet_therm_conductivity": 8.95,  # W/m-k ,
+    "sleeve_therm_conductivity": 0.71,  # W/m-k,
+    "air_therm_conductivity": 0.02624,  # W/m-K
+    "air_viscosity": 1.562e-5,  # m^2/s
+    "air_cp": 1,  # kJ/kg
+    "rotor_hub_therm_conductivity": 205.0,
+}
+
+
+def make_problem(losses=None, omega=120e3 * 2 * np.pi / 60, max_temp=80):
+    r_sh = 5e-3  # [m]
+    d_m = 3e-3  # [m]
+    r_ro = 12.5e-3  # [m]
+    d_sl = 1e-3  # [m]
+    if losses is None:
+        losses = {"rotor_iron_loss": 0.001, "magnet_loss": 135}
+    return AirflowProblem(
+        r_sh,
+        r_ro - r_sh - d_m,
+        r_ro,
+        d_sl,
+        r_ro + d_sl + 1e-3,
+        50e-3,
+        3e-3,
+        25,
+        losses,
+        omega,
+        max_temp,
+        mat_dict,
+    )
+
+
+class TestAirflowProblem(unittest.TestCase):
+    def test_network_follows_problem_changes(self):
+        u_z = np.array([0.5, 5.0])
+        problem = make_problem()
+        problem.magnet_temp_batch(u_z)
+
+        problem.losses = {"rotor_iron_loss": 0.001, "magnet_loss": 200}
+        problem.omega /= 2
+        np.testing.assert_allclose(
+            problem.magnet_temp_batch(u_z),
+            make_problem(problem.losses, problem.omega).magnet_temp_batch(u_z),
+        )
+
+        problem.losses["magnet_loss"] = 50
+        np.testing.assert_allclose(
+            problem.magnet_temp_batch(u_z),
+            make_problem(dict(problem.losses), problem.omega).magnet_temp_batch(u_z),
+        )
+
+
+class TestAirflowRootAnalyzer(unittest.TestCase):
+    def test_temperature_rising_with_airflow(self):
+        # at small airflow the magnet temperature rises with the airflow
+        analyzer = AirflowRootAnalyzer(u_z_bounds=(1e-5, 1.0))
+        results = analyzer.analyze(make_problem(max_temp=80))
+        self.assertTrue(results["valid"])
+        self.assertEqual(results["Required Airflow"][0], 1e-5)
+
+        results = analyzer.analyze(make_problem(max_temp=73))
+        self.assertFalse(results["valid"])
+        self.assertEqual(results["iterations"], 0)
+
+    def test_root_bracketed(self):
+        # once the axial flow dominates, the magnet temperature falls with the airflow
+        problem = make_problem(max_temp=100)
+        analyzer = AirflowRootAnalyzer(u_z_bounds=(100.0, 3000.0), xtol=1e-6)
+        results = analyzer.analyze(problem)
+
+        self.assertTrue(results["valid"])
+        self.assertGreater(results["iterations"], 0)
+        u_z = results["Required Airflow"][0]
+        self.assertTrue(100 < u_z < 3000)
+        self.assertLessEqual(results["magnet Temp"][0], 100)
+        self.assertAlmostEqual(results["magnet Temp"][0], 100, places=3)
+        self.assertGreater(problem.magnet_temp_batch(np.array([u_z - 1e-3]))[0], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "examples", "mach_eval_examples", "SynR_eval"
+    )
+)
+from SynR_inductance_post_analyzer import SynR_Inductance_PostAnalyzer
+
+
+def flux_linkages(Ld, Lq, Lls, I_hat, drive_freq, theta_0, no_of_steps=180):
+    """Flux linkages of the U and V coils with DC current in the U-phase of a rotating rotor"""
+    L0 = (Ld + Lq - 2 * Lls) / 3
+    Lg = (Lq - Ld) / 3
+    t = np.arange(no_of_steps) / (no_of_steps * drive_freq)
+    theta = 2 * np.pi * drive_freq * t + theta_0
+    L_uu = Lls + L0 - Lg * np.cos(2 * theta)
+    L_uv = -L0 / 2 - Lg * np.cos(2 * theta - 2 * np.pi / 3)
+    return pd.DataFrame({"Time(s)": t, "Uu": I_hat * L_uu, "Uv": I_hat * L_uv})
+
+
+class TestSynRInductancePostAnalyzer(unittest.TestCase):
+    def test_saliency_ratio(self):
+        # rotor starting with the sine coefficient of the mutual flux linkage carrying the sign
+        # of Lg, as in the JMAG study of the documented results
+        results = {
+            "coil_flux_linkages": flux_linkages(0.0144, 0.004, 0.001, 10, 100, np.pi / 2),
+            "current_peak": 10,
+            "drive_freq": 100,
+        }
+        state = SimpleNamespace(conditions=SimpleNamespace())
+        state_out = SynR_Inductance_PostAnalyzer.get_next_state(results, state)
+
+        inductance = state_out.conditions.inductance
+        self.assertAlmostEqual(inductance["Ld"], 0.0144)
+        self.assertAlmostEqual(inductance["Lq"], 0.004)
+        self.assertAlmostEqual(inductance["saliency_ratio"], 3.6)
+
+
+if __name__ == "__main__":
+    unittest.main()
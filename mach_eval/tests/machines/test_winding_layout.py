@@ -0,0 +1,54 @@
+import unittest
+
+from mach_eval.machines.bspm.winding_layout import (
+    WindingLayout,
+    excitation_bias_compensation_deg,
+)
+
+
+class TestExcitationBiasCompensation(unittest.TestCase):
+    def test_generated_layout_matches_table(self):
+        table = WindingLayout(True, 24, 2)
+        # build the generated layout of the same winding, bypassing the table
+        generated = WindingLayout.__new__(WindingLayout)
+        generated._from_generated_layout(True, 24, 2, 1)
+
+        self.assertEqual(generated.rightlayer_phase, table.rightlayer_phase)
+        self.assertAlmostEqual(table.initial_excitation_bias_compensation_deg, -30)
+        self.assertAlmostEqual(
+            generated.initial_excitation_bias_compensation_deg,
+            table.initial_excitation_bias_compensation_deg,
+        )
+
+    def test_table_layouts(self):
+        # (Q, p): (table value, derived value)
+        tables = {
+            (24, 2): (-30, -30),
+            (24, 1): (7.5, 7.5),
+            (12, 4): (-15, -15),
+            (6, 1): (0, 0),
+            # tables deviating from the derived value, see excitation_bias_compensation_deg
+            (6, 2): (0, -30),
+            (12, 2): (0, -30),
+            (12, 1): (0, 15),
+        }
+        for (Q, p), (table_bias, bias) in tables.items():
+            with self.subTest(Q=Q, p=p):
+                table = WindingLayout.__new__(WindingLayout)
+                try:
+                    table.__init__(True, Q, p)
+                except Exception:
+                    # the Q24 p1 and Q12 p2 tables have no coil pitch y and raise after filling in
+                    pass
+                self.assertEqual(table.initial_excitation_bias_compensation_deg, table_bias)
+                self.assertAlmostEqual(
+                    excitation_bias_compensation_deg(
+                        [table.rightlayer_phase, table.leftlayer_phase],
+                        [table.rightlayer_polarity, table.leftlayer_polarity],
+                        p,
+                    ),
+                    bias,
+                )
+
+if __name__ == "__main__":
+    unittest.main()
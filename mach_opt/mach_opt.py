@@ -8,7 +8,10 @@ import pandas as pd
 from typing import Protocol, runtime_checkable, Any
 from abc import abstractmethod, ABC
 import numpy as np
+import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 __all__ = [
     "DesignOptimizationMOEAD",
@@ -19,6 +22,7 @@ __all__ = [
     "DesignSpace",
     "DataHandler",
     "OptiData",
+    "ArchiveReplay",
     "InvalidDesign",
 ]
 
@@ -299,6 +303,116 @@ class OptiData:
         self.objs = objs
 
 
+class ArchiveReplay:
+    """Re-evaluates post-analyzers and objectives over an optimization archive
+
+    Archived analyzer results are reused, so no FEA or other analyzer is run again. Each record is
+    replayed step by step: a step with a new post-analyzer gets its output state recomputed from
+    its archived results and the (possibly replayed) output state of the previous step, while
+    steps without a new post-analyzer keep their archived output state. Objectives are then
+    recomputed from the replayed results. Records are streamed from the source archive and
+    replayed in parallel across a process pool, so post-analyzers and the design space must be
+    picklable, e.g. defined at module level.
+
+    Attributes:
+        post_analyzers: dict mapping step indices of full_results to new post-analyzers
+        design_space: design space providing get_objectives(full_results), archived objectives
+            are kept if not defined
+        invalid_design_objs: objectives of records which turn invalid on replay. Such records
+            are dropped if not defined
+        n_workers: number of worker processes, records are replayed in this process if 1
+        chunk_size: number of records sent to a worker at once
+    """
+
+    def __init__(
+        self,
+        post_analyzers=None,
+        design_space: "DesignSpace" = None,
+        invalid_design_objs=None,
+        n_workers=None,
+        chunk_size=16,
+    ):
+        self.post_analyzers = post_analyzers if post_analyzers is not None else {}
+        self.design_space = design_space
+        self.invalid_design_objs = invalid_design_objs
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+
+    def replay_record(self, data: "OptiData") -> "OptiData":
+        """Replays the post-analyzers and objectives of a single archived record
+
+        Args:
+            data: archived OptiData record
+        Returns:
+            replayed: OptiData record with replayed results and objectives, None if the design
+                turned invalid and no invalid_design_objs are defined
+        """
+        if data.full_results is None:
+            return data
+        try:
+            full_results = []
+            state = None
+            for i, (state_in, results, state_out) in enumerate(data.full_results):
+                if state is not None:
+                    state_in = state
+                if i in self.post_analyzers:
+                    state_out = self.post_analyzers[i].get_next_state(results, state_in)
+                full_results.append([state_in, results, state_out])
+                state = state_out
+
+            objs = data.objs
+            if self.design_space is not None:
+                objs = self.design_space.get_objectives(full_results)
+            return OptiData(x=data.x, design=data.design, full_results=full_results, objs=objs)
+
+        except Exception as e:
+            # InvalidDesign is matched by class name as in DesignProblem.fitness
+            if e.__class__.__name__ != InvalidDesign.__name__:
+                raise e
+            if self.invalid_design_objs is None:
+                return None
+            objs = tuple(self.invalid_design_objs)
+            return OptiData(x=data.x, design=data.design, full_results=None, objs=objs)
+
+    def run(self, source: "DataHandler", target: "DataHandler") -> int:
+        """Replays all records of the source archive and appends them to the target archive
+
+        Args:
+            source: data handler of the archive to replay
+            target: data handler of the derived archive, which should not be the source
+        Returns:
+            n_saved: number of records written to the target archive
+        """
+        if source.archive_filepath == target.archive_filepath:
+            raise ValueError("The derived archive must differ from the source archive")
+        archive = source.load_from_archive()
+        n_saved = 0
+        if self.n_workers == 1:
+            for data in archive:
+                n_saved += self._save(target, self.replay_record(data))
+            return n_saved
+
+        n_workers = self.n_workers if self.n_workers is not None else os.cpu_count()
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            # records are streamed in batches to bound memory, results keep the archive order
+            batch_size = self.chunk_size * n_workers * 2
+            while True:
+                batch = list(islice(archive, batch_size))
+                if not batch:
+                    break
+                replayed = pool.map(self.replay_record, batch, chunksize=self.chunk_size)
+                for data in replayed:
+                    n_saved += self._save(target, data)
+        return n_saved
+
+    @staticmethod
+    def _save(target, data):
+        if data is None:
+            return 0
+        target.save_to_archive(data.x, data.design, data.full_results, data.objs)
+        return 1
+
+
 class InvalidDesign(Exception):
     """Exception raised for invalid designs"""
 